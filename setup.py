@@ -1,16 +1,17 @@
 """Setup Script"""
+import re
 import typing
 
 import setuptools
 
 # pylint: disable=no-name-in-module
+from src.setup.bench_command import BenchCommand
 from src.setup.cleanup_command import CleanupCommand
+from src.setup.corpus_command import CorpusCommand
 from src.setup.generate_command import GenerateCommand
 from src.setup.nltk_command import NltkCommand
 from src.setup.py_test_command import PyTestCommand
 
-VERSION = '1.100.1'  # also in package
-
 
 # pylint: enable=no-name-in-module
 def load_file(path) -> typing.List[str]:
@@ -20,6 +21,18 @@ def load_file(path) -> typing.List[str]:
     return [line for line in lines if line]
 
 
+def load_version(path) -> str:
+    """Read package version from constants, without importing package"""
+    parts = dict(
+        re.findall(r'^VERSION_([A-Z]+) = (\d+)$', line)[0]
+        for line in load_file(path)
+        if line.startswith('VERSION_'))
+
+    return '.'.join(parts[key] for key in ('MAJOR', 'MINOR', 'REV'))
+
+
+VERSION = load_version('src/oolongt/constants.py')
+
 ALL_REQS = load_file('src/oolongt/requirements.txt')
 DEP_LINKS = [req for req in ALL_REQS if req.startswith('git+')]
 
@@ -41,7 +54,9 @@ setuptools.setup(
     tests_require=['pytest'],
     cmdclass={
         'pytest': PyTestCommand,
+        'bench': BenchCommand,
         'generate': GenerateCommand,
+        'corpus': CorpusCommand,
         'nltk': NltkCommand,
         'cleanup': CleanupCommand,
     },
@@ -56,5 +71,6 @@ setuptools.setup(
     install_requires=[
         req for req in ALL_REQS if req not in DEP_LINKS
     ],
+    extras_require={'numpy': ['numpy']},
     dependency_links=[req[4:] for req in DEP_LINKS],
 )
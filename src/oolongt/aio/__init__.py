@@ -0,0 +1,2 @@
+"""Initialize asyncio subpackage"""
+from .aio import aget_document, ascore_sentences, asummarize  # noqa: F401
@@ -0,0 +1,172 @@
+"""asyncio counterparts of blocking calls
+
+Fetching, parsing, tokenizing and scoring run in an executor (default:
+the event loop's thread pool), so the event loop stays free. Pass a
+`concurrent.futures.ProcessPoolExecutor` to score on other cores.
+
+A timeout or cancellation stops the wait at once, and work not yet
+started is dropped. The timeout is also passed down to HTTP requests
+made by the call (see `io.http_pool.request_deadline`), so a stalled
+fetch gives up soon after. CPU-bound work (parsing, scoring) cannot be
+interrupted: it keeps its executor worker busy until it finishes.
+"""
+import asyncio
+import typing
+from concurrent.futures import Executor
+
+from ..constants import BUILTIN, DEFAULT_IDIOM, DEFAULT_LENGTH
+from ..content import Document
+from ..files import get_document
+from ..io.http_pool import request_deadline
+from ..summarizer import ScoredSentence
+from ..text import score_body_sentences, summarize
+from ..typings import OptionalString, StringList
+
+OptionalExecutor = typing.Optional[Executor]
+OptionalFloat = typing.Optional[float]
+
+
+def call_with_deadline(
+        timeout: OptionalFloat,
+        func: typing.Callable,
+        *args: typing.Any) -> typing.Any:
+    """Call `func` with `args`, its HTTP requests limited to `timeout`
+
+    Arguments:
+        timeout {OptionalFloat} -- seconds, None for no limit
+        func {typing.Callable} -- blocking function
+        *args {typing.Any} -- positional arguments of `func`
+
+    Returns:
+        typing.Any -- return value of `func`
+    """
+    with request_deadline(timeout):
+        return func(*args)
+
+
+async def offload(
+        func: typing.Callable,
+        *args: typing.Any,
+        executor: OptionalExecutor = None,
+        timeout: OptionalFloat = None) -> typing.Any:
+    """Call `func` with `args` in `executor` without blocking the loop
+
+    On timeout, HTTP requests made by `func` stop at their next socket
+    operation; other work runs on in the executor until it returns.
+
+    Arguments:
+        func {typing.Callable} -- blocking function
+        *args {typing.Any} -- positional arguments of `func`
+
+    Keyword Arguments:
+        executor {OptionalExecutor} -- executor, None for loop default
+            (default: {None})
+        timeout {OptionalFloat} -- seconds to wait, None for no limit
+            (default: {None})
+
+    Raises:
+        asyncio.TimeoutError -- `timeout` elapsed
+
+    Returns:
+        typing.Any -- return value of `func`
+    """
+    loop = asyncio.get_event_loop()
+    future = loop.run_in_executor(
+        executor, call_with_deadline, timeout, func, *args)
+
+    return await asyncio.wait_for(future, timeout)
+
+
+async def aget_document(
+        path: str,
+        ext: OptionalString = None,
+        executor: OptionalExecutor = None,
+        timeout: OptionalFloat = None) -> Document:
+    """Get text contents of the file at `path` (see `files.get_document`)
+
+    Arguments:
+        path {str} -- path/URL to document
+
+    Keyword Arguments:
+        ext {OptionalString} -- nominal extension (default: {None})
+        executor {OptionalExecutor} -- executor, None for loop default
+            (default: {None})
+        timeout {OptionalFloat} -- seconds to wait, None for no limit
+            (default: {None})
+
+    Raises:
+        ValueError -- unable to read file
+        asyncio.TimeoutError -- `timeout` elapsed
+
+    Returns:
+        Document -- contents of file
+    """
+    return await offload(
+        get_document, path, ext, executor=executor, timeout=timeout)
+
+
+async def asummarize(  # pylint: disable=too-many-arguments
+        body: str,
+        title: str,
+        limit: float = DEFAULT_LENGTH,
+        root: str = BUILTIN,
+        idiom: str = DEFAULT_IDIOM,
+        executor: OptionalExecutor = None,
+        timeout: OptionalFloat = None) -> StringList:
+    """Get `limit` best sentences from `body` (see `text.summarize`)
+
+    Arguments:
+        body {str} -- body of content
+        title {str} -- title of content
+
+    Keyword Arguments:
+        limit {float} -- sentences to return (int) or
+            fraction of total (float) (default: {DEFAULT_LENGTH})
+        root {str} -- root directory of idiom data (default: {BUILTIN})
+        idiom {str} -- basename of idiom file (default: {DEFAULT_IDIOM})
+        executor {OptionalExecutor} -- executor, None for loop default
+            (default: {None})
+        timeout {OptionalFloat} -- seconds to wait, None for no limit
+            (default: {None})
+
+    Raises:
+        asyncio.TimeoutError -- `timeout` elapsed
+
+    Returns:
+        StringList -- top sentences in content order
+    """
+    return await offload(
+        summarize, body, title, limit, root, idiom,
+        executor=executor, timeout=timeout)
+
+
+async def ascore_sentences(  # pylint: disable=too-many-arguments
+        body: str,
+        title: str,
+        root: str = BUILTIN,
+        idiom: str = DEFAULT_IDIOM,
+        executor: OptionalExecutor = None,
+        timeout: OptionalFloat = None) -> typing.List[ScoredSentence]:
+    """List and score every sentence in `body` (see `score_body_sentences`)
+
+    Arguments:
+        body {str} -- body of content
+        title {str} -- title of content
+
+    Keyword Arguments:
+        root {str} -- root directory of idiom data (default: {BUILTIN})
+        idiom {str} -- basename of idiom file (default: {DEFAULT_IDIOM})
+        executor {OptionalExecutor} -- executor, None for loop default
+            (default: {None})
+        timeout {OptionalFloat} -- seconds to wait, None for no limit
+            (default: {None})
+
+    Raises:
+        asyncio.TimeoutError -- `timeout` elapsed
+
+    Returns:
+        typing.List[ScoredSentence] -- sentences with scoring and metadata
+    """
+    return await offload(
+        score_body_sentences, body, title, root, idiom,
+        executor=executor, timeout=timeout)
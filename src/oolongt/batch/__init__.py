@@ -0,0 +1,2 @@
+"""Initialize batch subpackage"""
+from .batch import BatchResult, summarize_many  # noqa: F401
@@ -0,0 +1,259 @@
+"""Summarize many documents in parallel"""
+import os
+import typing
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from itertools import islice
+
+from ..constants import BUILTIN, DEFAULT_IDIOM, DEFAULT_LENGTH
+from ..content import Content
+from ..files import get_document
+from ..process_pool import get_process_pool
+from ..repr_able import ReprAble
+from ..summarizer import get_summarizer
+from ..typings import OptionalInt, OptionalString, StringList
+
+Source = typing.Union[str, Content]
+Job = typing.Tuple[int, Source]
+JobSettings = typing.Tuple[float, OptionalString, str, str]
+
+WARM_UP_TEXT = 'Load the tokenizer. Load the stemmer.'
+CHUNKS_PER_WORKER = 2  # chunks in flight per worker process
+
+_JOB_SETTINGS = (
+    DEFAULT_LENGTH, None, BUILTIN, DEFAULT_IDIOM)  # type: JobSettings
+
+
+# pylint: disable=too-few-public-methods
+class BatchResult(ReprAble):
+    """Summary of one document, or the error that prevented it"""
+    __slots__ = ['index', 'path', 'title', 'summary', 'error']
+
+    def __init__(
+            self,
+            index: int,
+            path: str,
+            title: str = '',
+            summary: typing.Optional[StringList] = None,
+            error: OptionalString = None) -> None:
+        """Initialize result
+
+        Arguments:
+            index {int} -- position of document in input
+            path {str} -- path/URL to document ('' if given as content)
+
+        Keyword Arguments:
+            title {str} -- title of document (default: {''})
+            summary {typing.Optional[StringList]} --
+                top sentences in content order (default: {None})
+            error {OptionalString} -- description of error (default: {None})
+        """
+        self.index = index
+        self.path = path
+        self.title = title
+        self.summary = summary
+        self.error = error
+
+    @property
+    def ok(self) -> bool:  # pylint: disable=invalid-name
+        """Document was summarized
+
+        Returns:
+            bool -- no error
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return self._repr_(
+            self.index, self.path, self.title, self.summary, self.error)
+
+
+def summarize_source(
+        job: Job,
+        limit: float = DEFAULT_LENGTH,
+        ext: OptionalString = None,
+        root: str = BUILTIN,
+        idiom: str = DEFAULT_IDIOM) -> BatchResult:
+    """Summarize document of `job`, capturing any error
+
+    Arguments:
+        job {Job} -- index of document, path/URL to document or content
+
+    Keyword Arguments:
+        limit {float} -- length of summary (default: {DEFAULT_LENGTH})
+        ext {OptionalString} -- nominal extension of files
+            (default: {None})
+        root {str} -- root directory of idiom data (default: {BUILTIN})
+        idiom {str} -- basename of idiom file (default: {DEFAULT_IDIOM})
+
+    Returns:
+        BatchResult -- summary or error
+    """
+    index, source = job
+    path = source if isinstance(source, str) else ''
+
+    try:
+        content = get_document(path, ext) if path else source
+        summary = content.summarize(limit, root, idiom)
+
+    except Exception as err:  # pylint: disable=broad-except
+        error = '{}: {}'.format(type(err).__name__, err)
+
+        return BatchResult(index, path, error=error)
+
+    return BatchResult(index, path, content.title, summary)
+
+
+def init_worker(
+        limit: float,
+        ext: OptionalString,
+        root: str,
+        idiom: str) -> None:
+    """Store job settings and load language data in a worker process
+
+    Arguments:
+        limit {float} -- length of summary
+        ext {OptionalString} -- nominal extension of files
+        root {str} -- root directory of idiom data
+        idiom {str} -- basename of idiom file
+    """
+    global _JOB_SETTINGS  # pylint: disable=global-statement
+    _JOB_SETTINGS = (limit, ext, root, idiom)
+
+    parser = get_summarizer(root, idiom).parser
+    parser.get_all_stems(WARM_UP_TEXT)
+    parser.split_sentences(WARM_UP_TEXT)
+
+
+def summarize_chunk(jobs: typing.List[Job]) -> typing.List[BatchResult]:
+    """Summarize documents of `jobs` with the worker's settings
+
+    Arguments:
+        jobs {typing.List[Job]} -- indexes and sources of documents
+
+    Returns:
+        typing.List[BatchResult] -- summary or error of each
+    """
+    return [summarize_source(job, *_JOB_SETTINGS) for job in jobs]
+
+
+def chunk_jobs(
+        sources: typing.Iterable[Source],
+        chunk_size: int) -> typing.Iterator[typing.List[Job]]:
+    """Number `sources` and group them `chunk_size` at a time
+
+    Arguments:
+        sources {typing.Iterable[Source]} -- paths/URLs or content
+        chunk_size {int} -- documents per chunk
+
+    Returns:
+        typing.Iterator[typing.List[Job]] -- chunks of jobs
+    """
+    jobs = enumerate(sources)
+    chunk = list(islice(jobs, chunk_size))
+
+    while chunk:
+        yield chunk
+
+        chunk = list(islice(jobs, chunk_size))
+
+
+def summarize_many(  # pylint: disable=too-many-arguments
+        sources: typing.Iterable[Source],
+        limit: float = DEFAULT_LENGTH,
+        ext: OptionalString = None,
+        root: str = BUILTIN,
+        idiom: str = DEFAULT_IDIOM,
+        max_workers: OptionalInt = None,
+        chunk_size: int = 1,
+        ordered: bool = True) -> typing.Iterator[BatchResult]:
+    """Summarize every document in `sources` with a pool of processes
+
+    Each worker loads language data once, before its first document.
+    A document that cannot be read or summarized yields a result with
+    `error` set instead of stopping the batch.
+
+    Arguments:
+        sources {typing.Iterable[Source]} -- paths/URLs or content
+
+    Keyword Arguments:
+        limit {float} -- length of summary (default: {DEFAULT_LENGTH})
+        ext {OptionalString} -- nominal extension of files
+            (default: {None})
+        root {str} -- root directory of idiom data (default: {BUILTIN})
+        idiom {str} -- basename of idiom file (default: {DEFAULT_IDIOM})
+        max_workers {OptionalInt} -- worker processes, None for one
+            per CPU (default: {None})
+        chunk_size {int} -- documents sent to a worker at a time
+            (default: {1})
+        ordered {bool} -- yield in input order, else as completed
+            (default: {True})
+
+    Raises:
+        ValueError -- invalid chunk size
+
+    Returns:
+        typing.Iterator[BatchResult] -- summary or error of each document
+    """
+    if chunk_size < 1:
+        raise ValueError('invalid chunk size: {!r}'.format(chunk_size))
+
+    chunks = chunk_jobs(sources, chunk_size)
+    settings = (limit, ext, root, idiom)  # type: JobSettings
+
+    return run_pool(chunks, settings, max_workers, ordered)
+
+
+def run_pool(
+        chunks: typing.Iterable[typing.List[Job]],
+        settings: JobSettings,
+        max_workers: OptionalInt,
+        ordered: bool) -> typing.Iterator[BatchResult]:
+    """Summarize `chunks` of jobs in a pool of warm worker processes
+
+    At most `CHUNKS_PER_WORKER` chunks per worker are submitted ahead of
+    the results consumed, so `chunks` is read lazily. Closing the
+    iterator early cancels pending chunks without waiting for workers.
+
+    Arguments:
+        chunks {typing.Iterable[typing.List[Job]]} -- chunks of jobs
+        settings {JobSettings} -- limit, ext, root and idiom of jobs
+        max_workers {OptionalInt} -- worker processes (None: CPU count)
+        ordered {bool} -- yield in input order, else as completed
+
+    Returns:
+        typing.Iterator[BatchResult] -- summary or error of each document
+    """
+    window = (max_workers or os.cpu_count() or 1) * CHUNKS_PER_WORKER
+    remaining = iter(chunks)
+    executor = get_process_pool(max_workers, init_worker, settings)
+    pending = deque(
+        executor.submit(summarize_chunk, chunk)
+        for chunk in islice(remaining, window))
+
+    def refill(count: int) -> None:
+        pending.extend(
+            executor.submit(summarize_chunk, chunk)
+            for chunk in islice(remaining, count))
+
+    try:
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+
+            else:
+                done = list(wait(pending, return_when=FIRST_COMPLETED)[0])
+
+                for future in done:
+                    pending.remove(future)
+
+            refill(len(done))
+
+            for future in done:
+                yield from future.result()
+
+    finally:
+        for future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=not pending)
@@ -0,0 +1,4 @@
+"""Initialize cache subpackage"""
+from .memory_cache import MemoryCache  # noqa: F401
+from .result_cache import ResultCache, get_cache, set_cache  # noqa: F401
+from .sqlite_cache import SqliteCache  # noqa: F401
@@ -0,0 +1,77 @@
+"""In-memory least-recently-used result cache"""
+import copy
+import threading
+import time
+import typing
+from collections import OrderedDict
+
+from ..constants import DEFAULT_CACHE_SIZE
+from ..typings import OptionalInt
+from .result_cache import Clock, OptionalFloat, ResultCache
+
+Entry = typing.Tuple[OptionalFloat, typing.Any]
+
+
+class MemoryCache(ResultCache):
+    """Cache results in this process
+
+    Results are copied (shallow) on the way out, so a caller may
+    reorder or trim a cached list without affecting the next caller.
+    """
+    def __init__(
+            self,
+            max_size: OptionalInt = DEFAULT_CACHE_SIZE,
+            ttl: OptionalFloat = None,
+            clock: Clock = time.time) -> None:
+        """Initialize empty cache
+
+        Keyword Arguments:
+            max_size {OptionalInt} -- max. entries, None for unbounded
+                (default: {DEFAULT_CACHE_SIZE})
+            ttl {OptionalFloat} -- seconds to keep entries,
+                None for no expiry (default: {None})
+            clock {Clock} -- current time in seconds (default: {time.time})
+        """
+        super().__init__(max_size, ttl, clock)
+        self._entries = OrderedDict()  # type: OrderedDict[str, Entry]
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> typing.Any:
+        with self._lock:
+            expires, value = self._entries[key]
+
+            if self.is_expired(expires):
+                del self._entries[key]
+
+                raise KeyError(key)
+
+            self._entries.move_to_end(key)
+
+        return copy.copy(value)
+
+    def set(self, key: str, value: typing.Any) -> None:
+        with self._lock:
+            self._entries[key] = (self.get_expiry(), copy.copy(value))
+            self._entries.move_to_end(key)
+
+            while (
+                    (self.max_size is not None) and
+                    (len(self._entries) > self.max_size)):
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def purge(self) -> None:
+        """Remove expired entries"""
+        with self._lock:
+            for key in [
+                    key for key, (expires, _) in self._entries.items()
+                    if self.is_expired(expires)]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        self.purge()
+
+        return len(self._entries)
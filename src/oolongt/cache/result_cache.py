@@ -0,0 +1,268 @@
+"""Cache of summaries and scored sentences by content hash"""
+import abc
+import hashlib
+import json
+import threading
+import time
+import typing
+
+from ..constants import DEFAULT_CACHE_SIZE, VERSION
+from ..parser.parser_config import get_config_path
+from ..typings import OptionalInt
+
+Clock = typing.Callable[[], float]
+OptionalFloat = typing.Optional[float]
+
+_DIGEST_LOCK = threading.Lock()
+_DIGESTS = {}  # type: typing.Dict[typing.Tuple[str, str], str]
+
+
+def get_config_digest(root: str, idiom: str) -> str:
+    """Hash contents of idiom config (empty if unreadable)
+
+    The file is read once per `root`/`idiom`; call `forget_config_digests`
+    (or `summarizer.invalidate`) after editing it.
+
+    Arguments:
+        root {str} -- root directory of idiom config
+        idiom {str} -- basename of idiom config
+
+    Returns:
+        str -- SHA-256 hex digest
+    """
+    key = (str(root), str(idiom))
+
+    try:
+        return _DIGESTS[key]
+
+    except KeyError:
+        pass
+
+    try:
+        contents = get_config_path(root, idiom).read_bytes()
+
+    except OSError:
+        contents = b''
+
+    digest = hashlib.sha256(contents).hexdigest()
+
+    with _DIGEST_LOCK:
+        _DIGESTS[key] = digest
+
+    return digest
+
+
+def forget_config_digests(
+        root: typing.Optional[str] = None,
+        idiom: typing.Optional[str] = None) -> None:
+    """Discard digests of idiom configs matching `root` and/or `idiom`
+
+    Keyword Arguments:
+        root {typing.Optional[str]} -- root directory (default: {None})
+        idiom {typing.Optional[str]} -- basename of idiom (default: {None})
+    """
+    with _DIGEST_LOCK:
+        keys = [
+            key for key in _DIGESTS
+            if (root is None or key[0] == str(root)) and
+            (idiom is None or key[1] == str(idiom))]
+
+        for key in keys:
+            del _DIGESTS[key]
+
+
+def get_key(  # pylint: disable=too-many-arguments
+        kind: str,
+        body: str,
+        title: str,
+        root: str,
+        idiom: str,
+        limit: OptionalFloat = None) -> str:
+    """Hash everything a result depends on into a cache key
+
+    Arguments:
+        kind {str} -- kind of result
+        body {str} -- body of content
+        title {str} -- title of content
+        root {str} -- root directory of idiom config
+        idiom {str} -- basename of idiom config
+
+    Keyword Arguments:
+        limit {OptionalFloat} -- length of summary, so 3 and 3.0 match
+            (default: {None})
+
+    Returns:
+        str -- SHA-256 hex digest
+    """
+    if limit is not None:
+        limit = float(limit)
+
+    spec = json.dumps([
+        kind, body, title, get_config_digest(root, idiom), limit, VERSION])
+
+    return hashlib.sha256(spec.encode('utf-8')).hexdigest()
+
+
+class ResultCache(abc.ABC):
+    """Base class for result caches
+
+    Entries expire `ttl` seconds after they are set; past `max_size`
+    entries, the least recently used are evicted.
+    """
+    def __init__(
+            self,
+            max_size: OptionalInt = DEFAULT_CACHE_SIZE,
+            ttl: OptionalFloat = None,
+            clock: Clock = time.time) -> None:
+        """Initialize cache
+
+        Keyword Arguments:
+            max_size {OptionalInt} -- max. entries, None for unbounded
+                (default: {DEFAULT_CACHE_SIZE})
+            ttl {OptionalFloat} -- seconds to keep entries,
+                None for no expiry (default: {None})
+            clock {Clock} -- current time in seconds (default: {time.time})
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+
+    def get_expiry(self) -> OptionalFloat:
+        """Get expiry time of an entry set now
+
+        Returns:
+            OptionalFloat -- time in seconds, None for no expiry
+        """
+        return None if self.ttl is None else self.clock() + self.ttl
+
+    def is_expired(self, expires: OptionalFloat) -> bool:
+        """Check whether expiry time `expires` has passed
+
+        Arguments:
+            expires {OptionalFloat} -- expiry time of an entry
+
+        Returns:
+            bool -- entry has expired
+        """
+        return (expires is not None) and (expires <= self.clock())
+
+    @abc.abstractmethod
+    def get(self, key: str) -> typing.Any:
+        """Get result by `key`
+
+        Arguments:
+            key {str} -- cache key
+
+        Raises:
+            KeyError -- missing or expired
+
+        Returns:
+            typing.Any -- cached result
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, value: typing.Any) -> None:
+        """Store result `value` by `key`
+
+        Arguments:
+            key {str} -- cache key
+            value {typing.Any} -- result
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove every entry"""
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def fetch(self, key: str, compute: typing.Callable) -> typing.Any:
+        """Get result by `key`, computing and storing it if missing
+
+        Arguments:
+            key {str} -- cache key
+            compute {typing.Callable} -- get result
+
+        Returns:
+            typing.Any -- result
+        """
+        try:
+            value = self.get(key)
+            self.hits += 1
+
+            return value
+
+        except KeyError:
+            self.misses += 1
+
+        value = compute()
+        self.set(key, value)
+
+        return value
+
+
+_LOCK = threading.Lock()
+_CACHE = None  # type: typing.Optional[ResultCache]
+
+
+def get_cache() -> typing.Optional[ResultCache]:
+    """Get cache consulted by `summarize` and `score_body_sentences`
+
+    Returns:
+        typing.Optional[ResultCache] -- cache, None if disabled
+    """
+    return _CACHE
+
+
+def set_cache(
+        cache: typing.Optional[ResultCache]) -> typing.Optional[ResultCache]:
+    """Set cache consulted by `summarize` and `score_body_sentences`
+
+    Arguments:
+        cache {typing.Optional[ResultCache]} -- cache, None to disable
+
+    Returns:
+        typing.Optional[ResultCache] -- previous cache
+    """
+    global _CACHE  # pylint: disable=global-statement
+
+    with _LOCK:
+        previous, _CACHE = _CACHE, cache
+
+    return previous
+
+
+def cache_result(  # pylint: disable=too-many-arguments
+        compute: typing.Callable,
+        kind: str,
+        body: str,
+        title: str,
+        root: str,
+        idiom: str,
+        limit: OptionalFloat = None) -> typing.Any:
+    """Get result from active cache, computing it if missing
+
+    Arguments:
+        compute {typing.Callable} -- get result
+        kind {str} -- kind of result
+        body {str} -- body of content
+        title {str} -- title of content
+        root {str} -- root directory of idiom config
+        idiom {str} -- basename of idiom config
+
+    Keyword Arguments:
+        limit {OptionalFloat} -- length of summary (default: {None})
+
+    Returns:
+        typing.Any -- result
+    """
+    cache = get_cache()
+
+    if cache is None:
+        return compute()
+
+    return cache.fetch(
+        get_key(kind, body, title, root, idiom, limit), compute)
@@ -0,0 +1,150 @@
+"""SQLite result cache, shared between processes and runs"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import typing
+
+from ..constants import DEFAULT_CACHE_SIZE
+from ..typings import OptionalInt, PathOrString
+from .result_cache import Clock, OptionalFloat, ResultCache
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS results ('
+    'key TEXT PRIMARY KEY, value BLOB NOT NULL, '
+    'expires REAL, used INTEGER NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS results_used ON results (used)')
+NEXT_USE = '(SELECT COALESCE(MAX(used), 0) + 1 FROM results)'
+
+
+class SqliteCache(ResultCache):
+    """Cache results (pickled) in an SQLite database file
+
+    Each process opens its own database connection on first use, so a
+    cache may be shared with forked workers, or pickled to spawned ones.
+    """
+    def __init__(
+            self,
+            path: PathOrString,
+            max_size: OptionalInt = DEFAULT_CACHE_SIZE,
+            ttl: OptionalFloat = None,
+            clock: Clock = time.time) -> None:
+        """Open (or create) cache database
+
+        Arguments:
+            path {PathOrString} -- path to database file
+                (':memory:' for a private, temporary database)
+
+        Keyword Arguments:
+            max_size {OptionalInt} -- max. entries, None for unbounded
+                (default: {DEFAULT_CACHE_SIZE})
+            ttl {OptionalFloat} -- seconds to keep entries,
+                None for no expiry (default: {None})
+            clock {Clock} -- current time in seconds (default: {time.time})
+        """
+        super().__init__(max_size, ttl, clock)
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = None  # type: typing.Optional[sqlite3.Connection]
+        self._pid = None  # type: typing.Optional[int]
+        self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        """Get database connection of this process, opening it if needed
+
+        A connection (or held lock) inherited through `fork` is replaced,
+        never used.
+
+        Returns:
+            sqlite3.Connection -- connection
+        """
+        pid = os.getpid()
+
+        if self._pid != pid:
+            self._lock = threading.Lock()
+            self._conn = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None)
+            self._pid = pid
+
+            for statement in SCHEMA:
+                self._conn.execute(statement)
+
+        return self._conn
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.update(_lock=None, _conn=None, _pid=None)
+
+        return state
+
+    def get(self, key: str) -> typing.Any:
+        conn = self._open()
+
+        with self._lock:
+            row = conn.execute(
+                'SELECT value, expires FROM results WHERE key = ?',
+                (key, )).fetchone()
+
+            if row is None:
+                raise KeyError(key)
+
+            value, expires = row
+
+            if self.is_expired(expires):
+                conn.execute(
+                    'DELETE FROM results WHERE key = ?', (key, ))
+
+                raise KeyError(key)
+
+            conn.execute(
+                'UPDATE results SET used = {} WHERE key = ?'.format(NEXT_USE),
+                (key, ))
+
+        return pickle.loads(value)
+
+    def set(self, key: str, value: typing.Any) -> None:
+        blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        conn = self._open()
+
+        with self._lock:
+            conn.execute(
+                'INSERT OR REPLACE INTO results (key, value, expires, used) '
+                'VALUES (?, ?, ?, {})'.format(NEXT_USE),
+                (key, blob, self.get_expiry()))
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Remove expired entries, then least recently used past max"""
+        conn.execute(
+            'DELETE FROM results WHERE expires <= ?', (self.clock(), ))
+
+        if self.max_size is not None:
+            conn.execute(
+                'DELETE FROM results WHERE key IN ('
+                'SELECT key FROM results ORDER BY used DESC '
+                'LIMIT -1 OFFSET ?)', (self.max_size, ))
+
+    def clear(self) -> None:
+        conn = self._open()
+
+        with self._lock:
+            conn.execute('DELETE FROM results')
+
+    def close(self) -> None:
+        """Close database connection of this process"""
+        conn = self._open()
+
+        with self._lock:
+            conn.close()
+
+    def __len__(self) -> int:
+        conn = self._open()
+
+        with self._lock:
+            row = conn.execute(
+                'SELECT COUNT(*) FROM results '
+                'WHERE expires IS NULL OR expires > ?',
+                (self.clock(), )).fetchone()
+
+        return row[0]
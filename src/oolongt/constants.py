@@ -10,7 +10,7 @@ from .typings import StringList  # noqa: F401
 PKG_NAME = 'OolongT'
 VERSION_MAJOR = 1
 VERSION_MINOR = 100
-VERSION_REV = 0
+VERSION_REV = 1
 VERSION = '{}.{}.{}'.format(VERSION_MAJOR, VERSION_MINOR, VERSION_REV)
 
 # summarizer
@@ -18,6 +18,36 @@ DEFAULT_LENGTH = 5
 TOP_KEYWORD_MIN_RANK = 10
 SENTENCE_SCORE_K = 5.0
 
+# scoring backends
+BACKEND_PYTHON = 'python'
+BACKEND_NUMPY = 'numpy'
+DEFAULT_BACKEND = BACKEND_PYTHON
+
+# sharded scoring
+DEFAULT_SHARD_SIZE = 2000  # sentences per shard
+
+# result cache
+DEFAULT_CACHE_SIZE = 1024  # entries
+
+# PDF extraction
+PDF_PAGES_PER_TASK = 16  # pages per parallel task
+
+# local files
+TEXT_CHUNK_SIZE = 1024 * 1024  # bytes per read
+STREAM_MAX_TAIL = 64 * 1024  # characters held without a sentence break
+
+# HTTP fetching
+HTTP_MAX_PER_HOST = 6  # concurrent connections
+HTTP_TIMEOUT = 30.0  # seconds
+HTTP_RETRIES = 2
+HTTP_BACKOFF = 0.5  # seconds before first retry
+HTTP_MAX_REDIRECTS = 5
+HTTP_MAX_IDLE = 32  # idle connections, all hosts
+HTTP_IDLE_TIME = 60.0  # seconds before closing idle connections
+HTTP_MAX_WORKERS = 32  # default threads of `fetch_many`
+HTTP_CACHE_SIZE = 256 * 1024 * 1024  # bytes of bodies
+HTTP_CACHE_FRESH = 0.0  # seconds before revalidating
+
 # approximation
 COMPOSITE_TOLERANCE = 0.000000000001  # composite scores
 
@@ -29,3 +59,4 @@ DEFAULT_LANGUAGE = 'english'
 DEFAULT_NLTK_STOPS = True
 DEFAULT_USER_STOPS = []   # type: StringList
 KEYWORD_SCORE_K = 1.5
+DEFAULT_STEM_CACHE_SIZE = 65536
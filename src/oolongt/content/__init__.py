@@ -1,10 +1,42 @@
-"""Initialize content subpackage"""
+"""Initialize content subpackage
+
+Handlers of binary/markup formats are imported on first use, along with
+their dependencies (docx2python, PyPDF2, BeautifulSoup).
+"""
+import sys
+import types
+from importlib import import_module
+
 from .binary_document import BinaryDocument  # noqa: F401
 from .content import Content  # noqa: F401
 from .document import Document  # noqa: F401
-from .docx_document import DocxDocument  # noqa: F401
-from .html_document import HtmlDocument  # noqa: F401
-from .pdf_document import PdfDocument  # noqa: F401
 from .plain_text_document import PlainTextDocument  # noqa: F401
 from .text_content import TextContent  # noqa: F401
 from .text_document import TextDocument  # noqa: F401
+
+LAZY_HANDLERS = {
+    'DocxDocument': 'docx_document',
+    'HtmlDocument': 'html_document',
+    'PdfDocument': 'pdf_document',
+}
+
+
+class LazyModule(types.ModuleType):
+    """Content subpackage, importing handlers on first attribute access
+
+    Stands in for module `__getattr__` (Python 3.7+).
+    """
+    def __getattr__(self, name: str):
+        if name in LAZY_HANDLERS:
+            module = import_module('.' + LAZY_HANDLERS[name], self.__name__)
+
+            return getattr(module, name)
+
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(self.__name__, name))
+
+    def __dir__(self):
+        return sorted(list(self.__dict__) + list(LAZY_HANDLERS))
+
+
+sys.modules[__name__].__class__ = LazyModule
@@ -3,6 +3,7 @@ from docx2python import docx2python
 
 from ..typings import PathOrString
 from .binary_document import BinaryDocument
+from .supports import supports_docx
 
 
 class DocxDocument(BinaryDocument):
@@ -14,7 +15,6 @@ class DocxDocument(BinaryDocument):
 
         super().__init__(body, title, path)
 
-    # pylint: disable=unused-argument
     @staticmethod
     def supports(path: str, ext: str) -> bool:
-        return ext == 'docx'
+        return supports_docx(path, ext)
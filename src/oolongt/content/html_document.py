@@ -3,9 +3,25 @@ from bs4.element import Tag
 
 from ..io import read_file
 from ..typings import OptionalString, PathOrString
-from ..ugly_soup import UglyQuery, UglySoup
+from ..ugly_soup import FastSoup, UglyQuery, UglySoup
+from .supports import supports_html
 from .text_document import TextDocument
 
+IGNORE_TAGS = (
+    'input',
+    'button',
+    'textarea',
+    'iframe',
+    'script',
+    'noscript',
+    'style',
+    'img',
+    'aside',
+    'code',
+)
+BODY_TAGS = ('main', 'article', 'body')
+TITLE_TAGS = ('meta', 'title')
+
 
 def process(html: str) -> UglySoup:
     """Parse and reduce noise in `html`
@@ -17,36 +33,55 @@ def process(html: str) -> UglySoup:
         UglySoup -- BeautifulSoup subclass
     """
     soup = UglySoup(html)
-    ignore_tags = (
-        'input',
-        'button',
-        'textarea',
-        'iframe',
-        'script',
-        'noscript',
-        'style',
-        'img',
-        'aside',
-        'code',
-    )
-
-    for tag in soup(ignore_tags):
+
+    for tag in soup(IGNORE_TAGS):
         tag.decompose()
 
     return soup
 
 
-def get_source(path: PathOrString) -> UglySoup:
+def is_og_title(tag: Tag) -> bool:
+    """Check for OpenGraph-based title
+
+    Arguments:
+        tag {Tag} -- page element
+
+    Returns:
+        bool -- `get_og_title` finds a title
+    """
+    return get_og_title(tag) is not None
+
+
+def process_fast(html: str) -> FastSoup:
+    """Parse only the parts of `html` needed for body and title
+
+    Noise is dropped while parsing, which stops once the body and
+    title are found. Same body and title as `process`.
+
+    Arguments:
+        html {str} -- document HTML
+
+    Returns:
+        FastSoup -- BeautifulSoup subclass
+    """
+    return FastSoup(
+        html, IGNORE_TAGS, (BODY_TAGS, TITLE_TAGS), {'meta': is_og_title})
+
+
+def get_source(path: PathOrString, fast: bool = False) -> UglySoup:
     """Load HTML from `path`
 
     Arguments:
         path {str} -- local/remote path to HTML
 
+    Keyword Arguments:
+        fast {bool} -- parse with `process_fast` (default: {False})
+
     Returns:
         UglySoup -- BeautifulSoup
     """
     html = read_file(path)
-    src = process(html)
+    src = process_fast(html) if fast else process(html)
 
     return src
 
@@ -60,10 +95,7 @@ def get_body(src: UglySoup) -> str:
     Returns:
         str -- best match for content
     """
-    body = src.query(
-        UglyQuery('main'),
-        UglyQuery('article'),
-        UglyQuery('body'))
+    body = src.query(*(UglyQuery(tag) for tag in BODY_TAGS))
 
     return body
 
@@ -102,13 +134,17 @@ def get_title(src: UglySoup) -> str:
 
 class HtmlDocument(TextDocument):
     """Parse HTML"""
-    def __init__(self, path: PathOrString) -> None:
+    def __init__(self, path: PathOrString, fast: bool = False) -> None:
         """Initialize
 
         Arguments:
             path {str} -- path to HTML
+
+        Keyword Arguments:
+            fast {bool} -- parse only what is needed for body and title
+                (default: {False})
         """
-        src = get_source(path)
+        src = get_source(path, fast)
         body = get_body(src)
         title = get_title(src)
 
@@ -116,6 +152,4 @@ class HtmlDocument(TextDocument):
 
     @staticmethod
     def supports(path: OptionalString, ext: OptionalString) -> bool:
-        path_str = str(path)[:4]
-
-        return path_str in ['http', 'ftp:'] or str(ext).startswith('htm')
+        return supports_html(path, ext)
@@ -1,10 +1,20 @@
 """Content extractor for PDF files"""
+import typing
+from io import BytesIO
+
 from PyPDF2 import PdfFileReader
 from PyPDF2.pdf import DocumentInformation
 
+from ..constants import PDF_PAGES_PER_TASK
 from ..io import get_stream
-from ..typings import PathOrString
+from ..process_pool import get_process_pool
+from ..typings import OptionalInt, PathOrString, StringList
 from .binary_document import BinaryDocument
+from .supports import supports_pdf
+
+PageRange = typing.Tuple[int, int]
+
+_READER = None  # type: typing.Optional[PdfFileReader]
 
 
 def get_page(src: PdfFileReader, page_num: int) -> str:
@@ -22,21 +32,161 @@ def get_page(src: PdfFileReader, page_num: int) -> str:
     return page.extractText()
 
 
-def get_body(src: PdfFileReader) -> str:
+def get_page_count(src: PdfFileReader, max_pages: OptionalInt = None) -> int:
+    """Count pages to extract from PDF document
+
+    Arguments:
+        src {PdfFileReader} -- PDF document
+
+    Keyword Arguments:
+        max_pages {OptionalInt} -- page limit, None for all
+            (default: {None})
+
+    Returns:
+        int -- number of pages
+    """
+    num_pages = src.getNumPages()
+
+    if max_pages is None:
+        return num_pages
+
+    return max(0, min(num_pages, max_pages))
+
+
+def iter_pages(
+        src: PdfFileReader,
+        start: int = 0,
+        stop: OptionalInt = None) -> typing.Iterator[str]:
+    """Extract pages `start` to `stop` (exclusive) one at a time
+
+    Arguments:
+        src {PdfFileReader} -- PDF document
+
+    Keyword Arguments:
+        start {int} -- first page number (default: {0})
+        stop {OptionalInt} -- page number to stop before, None for last
+            (default: {None})
+
+    Returns:
+        typing.Iterator[str] -- text of each page
+    """
+    for page_num in range(start, get_page_count(src, stop)):
+        yield get_page(src, page_num)
+
+
+def get_body(src: PdfFileReader, max_pages: OptionalInt = None) -> str:
     """Get body of PDF document
 
     Arguments:
         src {PdfFileReader} -- PDF document
 
+    Keyword Arguments:
+        max_pages {OptionalInt} -- page limit, None for all
+            (default: {None})
+
     Returns:
         str -- document body property
     """
-    num_pages = src.getNumPages()
-    pages = [get_page(src, i) for i in range(num_pages)]
+    return '\n'.join(iter_pages(src, 0, max_pages))
+
+
+def split_pages(num_pages: int, size: int) -> typing.List[PageRange]:
+    """Split `num_pages` pages into ranges of `size` pages
+
+    Arguments:
+        num_pages {int} -- number of pages
+        size {int} -- pages per range
+
+    Returns:
+        typing.List[PageRange] -- start and stop of each range
+    """
+    return [
+        (start, min(start + size, num_pages))
+        for start in range(0, num_pages, size)]
+
+
+def init_worker(data: bytes) -> None:
+    """Parse PDF document once in a worker process
+
+    Arguments:
+        data {bytes} -- PDF file contents
+    """
+    global _READER  # pylint: disable=global-statement
+    _READER = PdfFileReader(BytesIO(data))
+
+
+def extract_range(page_range: PageRange) -> StringList:
+    """Extract a range of pages of the worker's PDF document
+
+    Arguments:
+        page_range {PageRange} -- start and stop page numbers
+
+    Returns:
+        StringList -- text of each page
+    """
+    return list(iter_pages(_READER, *page_range))
+
+
+def get_body_parallel(  # pylint: disable=too-many-arguments
+        src: PdfFileReader,
+        data: bytes,
+        max_pages: OptionalInt = None,
+        max_workers: OptionalInt = None,
+        pages_per_task: int = PDF_PAGES_PER_TASK) -> str:
+    """Get body of PDF document, extracting pages in worker processes
+
+    Documents that fit in one task are extracted in this process.
+
+    Arguments:
+        src {PdfFileReader} -- PDF document
+        data {bytes} -- PDF file contents of `src`
+
+    Keyword Arguments:
+        max_pages {OptionalInt} -- page limit, None for all
+            (default: {None})
+        max_workers {OptionalInt} -- worker processes, None for one
+            per CPU (default: {None})
+        pages_per_task {int} -- pages sent to a worker at a time
+            (default: {PDF_PAGES_PER_TASK})
+
+    Returns:
+        str -- document body property
+    """
+    ranges = split_pages(get_page_count(src, max_pages), pages_per_task)
+
+    if len(ranges) < 2:
+        return get_body(src, max_pages)
+
+    with get_process_pool(max_workers, init_worker, (data, )) as executor:
+        pages = [
+            page
+            for chunk in executor.map(extract_range, ranges)
+            for page in chunk]
 
     return '\n'.join(pages)
 
 
+def iter_document_pages(
+        path: PathOrString,
+        start: int = 0,
+        stop: OptionalInt = None) -> typing.Iterator[str]:
+    """Extract pages of PDF at `path` lazily, e.g. to stop early
+
+    Arguments:
+        path {PathOrString} -- path/URL to PDF
+
+    Keyword Arguments:
+        start {int} -- first page number (default: {0})
+        stop {OptionalInt} -- page number to stop before, None for last
+            (default: {None})
+
+    Returns:
+        typing.Iterator[str] -- text of each page
+    """
+    with get_stream(path) as stream:
+        yield from iter_pages(PdfFileReader(stream), start, stop)
+
+
 def get_title(info: DocumentInformation) -> str:
     """Get title (if any)
 
@@ -66,17 +216,36 @@ def get_title(info: DocumentInformation) -> str:
 
 class PdfDocument(BinaryDocument):
     """Parse PDF"""
-    def __init__(self, path: PathOrString) -> None:
+    def __init__(
+            self,
+            path: PathOrString,
+            max_pages: OptionalInt = None,
+            max_workers: OptionalInt = 1) -> None:
+        """Initialize
+
+        Arguments:
+            path {PathOrString} -- path to PDF
+
+        Keyword Arguments:
+            max_pages {OptionalInt} -- page limit, None for all
+                (default: {None})
+            max_workers {OptionalInt} -- worker processes to extract
+                pages, None for one per CPU (default: {1})
+        """
         with get_stream(path) as stream:
-            src = PdfFileReader(stream)
-            info = src.getDocumentInfo()
+            if max_workers == 1:
+                src = PdfFileReader(stream)
+                body = get_body(src, max_pages)
+
+            else:
+                data = stream.read()
+                src = PdfFileReader(BytesIO(data))
+                body = get_body_parallel(src, data, max_pages, max_workers)
 
-            body = get_body(src)
-            title = get_title(info)
+            title = get_title(src.getDocumentInfo())
 
         super().__init__(body, title, path)
 
-    # pylint: disable=unused-argument
     @staticmethod
     def supports(path: str, ext: str) -> bool:
-        return ext == 'pdf'
+        return supports_pdf(path, ext)
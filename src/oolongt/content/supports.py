@@ -0,0 +1,45 @@
+"""Support tests of document handlers, importable without the handlers"""
+from ..typings import OptionalString
+
+
+# pylint: disable=unused-argument
+def supports_docx(path: str, ext: str) -> bool:
+    """Claim support for Word XML
+
+    Arguments:
+        path {str} -- full path/URL of file
+        ext {str} -- nominal extension of file
+
+    Returns:
+        bool -- path/extension are supported
+    """
+    return ext == 'docx'
+
+
+def supports_pdf(path: str, ext: str) -> bool:
+    """Claim support for PDF
+
+    Arguments:
+        path {str} -- full path/URL of file
+        ext {str} -- nominal extension of file
+
+    Returns:
+        bool -- path/extension are supported
+    """
+    return ext == 'pdf'
+# pylint: enable=unused-argument
+
+
+def supports_html(path: OptionalString, ext: OptionalString) -> bool:
+    """Claim support for HTML and remote documents
+
+    Arguments:
+        path {OptionalString} -- full path/URL of file
+        ext {OptionalString} -- nominal extension of file
+
+    Returns:
+        bool -- path/extension are supported
+    """
+    path_str = str(path)[:4]
+
+    return path_str in ['http', 'ftp:'] or str(ext).startswith('htm')
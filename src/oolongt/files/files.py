@@ -1,12 +1,36 @@
 """Apply oolongt to files"""
 import typing
+from importlib import import_module
 from os.path import abspath
 from pathlib import Path
 
-from ..content import (
-    Document, DocxDocument, HtmlDocument, PdfDocument, PlainTextDocument)
+from ..content import Document, PlainTextDocument
+from ..content.supports import supports_docx, supports_html, supports_pdf
+from ..instrument.instrument import EXTRACT, stage
 from ..typings import OptionalString
 
+Supports = typing.Callable[[str, str], bool]
+
+# module, class and test of each handler, in order of precedence
+HANDLERS = (
+    ('docx_document', 'DocxDocument', supports_docx),
+    ('pdf_document', 'PdfDocument', supports_pdf),
+    ('html_document', 'HtmlDocument', supports_html),
+)  # type: typing.Tuple[typing.Tuple[str, str, Supports], ...]
+
+
+def load_handler(module: str, name: str) -> typing.Type[Document]:
+    """Import handler class `name` from content module `module`
+
+    Arguments:
+        module {str} -- module in content subpackage
+        name {str} -- class name
+
+    Returns:
+        typing.Type[Document] -- document handler
+    """
+    return getattr(import_module('..content.' + module, __package__), name)
+
 
 def get_handlers() -> typing.Generator[typing.Type[Document], None, None]:
     """List available document handlers
@@ -14,9 +38,8 @@ def get_handlers() -> typing.Generator[typing.Type[Document], None, None]:
     Returns:
         Generator[Document, None, None] -- document handler
     """
-    yield DocxDocument
-    yield PdfDocument
-    yield HtmlDocument
+    for module, name, _ in HANDLERS:
+        yield load_handler(module, name)
 
 
 def get_handler(path: str, ext: OptionalString = None) -> typing.Callable:
@@ -33,9 +56,9 @@ def get_handler(path: str, ext: OptionalString = None) -> typing.Callable:
     """
     ext = (ext or Path(path).suffix).replace('.', '')
 
-    for handler in get_handlers():
-        if handler.supports(path, ext):
-            return handler
+    for module, name, supports in HANDLERS:
+        if supports(path, ext):
+            return load_handler(module, name)
 
     return PlainTextDocument
 
@@ -54,7 +77,10 @@ def get_document(path: str, ext: OptionalString) -> Document:
     """
     try:
         handler = get_handler(path, ext)
-        doc = handler(path)  # type: Document
+
+        with stage(EXTRACT) as timed:
+            doc = handler(path)  # type: Document
+            timed.items = len(doc.body)
 
         return doc
 
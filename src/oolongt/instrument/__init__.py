@@ -0,0 +1,3 @@
+"""Initialize instrument subpackage"""
+from .instrument import (  # noqa: F401
+    Recorder, StageStats, recording, stage)
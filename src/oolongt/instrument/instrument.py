@@ -0,0 +1,220 @@
+"""Per-stage timing of document loading and summarization"""
+import contextlib
+import threading
+import time
+import typing
+
+from ..repr_able import ReprAble
+
+StageCallback = typing.Callable[[str, float, float, int], None]
+
+# CPU time of the running thread (of the process before Python 3.7)
+get_cpu_time = getattr(time, 'thread_time', time.process_time)
+
+# stage names
+FETCH = 'fetch'
+EXTRACT = 'extract'
+SPLIT = 'split'
+STEM = 'stem'
+KEYWORDS = 'keywords'
+SCORE = 'score'
+SORT = 'sort'
+
+
+# pylint: disable=too-few-public-methods
+class StageStats(ReprAble):
+    """Totals of one stage over every recorded call"""
+    __slots__ = ['calls', 'wall', 'cpu', 'items']
+
+    def __init__(
+            self,
+            calls: int = 0,
+            wall: float = 0.0,
+            cpu: float = 0.0,
+            items: int = 0) -> None:
+        """Initialize totals
+
+        Keyword Arguments:
+            calls {int} -- times stage ran (default: {0})
+            wall {float} -- elapsed seconds (default: {0.0})
+            cpu {float} -- CPU seconds of the running thread
+                (default: {0.0})
+            items {int} -- items processed, e.g. sentences (default: {0})
+        """
+        self.calls = calls
+        self.wall = wall
+        self.cpu = cpu
+        self.items = items
+
+    def add(self, wall: float, cpu: float, items: int) -> None:
+        """Add one call to totals
+
+        Arguments:
+            wall {float} -- elapsed seconds
+            cpu {float} -- CPU seconds
+            items {int} -- items processed
+        """
+        self.calls += 1
+        self.wall += wall
+        self.cpu += cpu
+        self.items += items
+
+    def __repr__(self) -> str:
+        return self._repr_(self.calls, self.wall, self.cpu, self.items)
+
+
+class Recorder:
+    """Collect stage totals, optionally reporting each call"""
+    def __init__(self, callback: typing.Optional[StageCallback] = None):
+        """Initialize empty totals
+
+        Keyword Arguments:
+            callback {typing.Optional[StageCallback]} --
+                called with stage name, wall, CPU and items of each call
+                (default: {None})
+        """
+        self.callback = callback
+        self.stages = {}  # type: typing.Dict[str, StageStats]
+        self._lock = threading.Lock()
+
+    def record(self, name: str, wall: float, cpu: float, items: int) -> None:
+        """Add one call of stage `name`
+
+        Arguments:
+            name {str} -- stage name
+            wall {float} -- elapsed seconds
+            cpu {float} -- CPU seconds
+            items {int} -- items processed
+        """
+        with self._lock:
+            self.stages.setdefault(name, StageStats()).add(wall, cpu, items)
+
+        if self.callback is not None:
+            self.callback(name, wall, cpu, items)
+
+    def as_dict(self) -> typing.Dict[str, typing.Dict[str, float]]:
+        """Export totals, e.g. for JSON or a metrics client
+
+        Returns:
+            typing.Dict[str, typing.Dict[str, float]] --
+                calls, wall, cpu, and items by stage name
+        """
+        with self._lock:
+            return {
+                name: {
+                    'calls': stats.calls,
+                    'wall': stats.wall,
+                    'cpu': stats.cpu,
+                    'items': stats.items}
+                for name, stats in self.stages.items()}
+
+    def reset(self) -> None:
+        """Forget totals"""
+        with self._lock:
+            self.stages.clear()
+
+
+_LOCAL = threading.local()
+
+
+def get_recorders() -> typing.Tuple[Recorder, ...]:
+    """Get recorders active in the current thread
+
+    Returns:
+        typing.Tuple[Recorder, ...] -- recorders, innermost last
+    """
+    return getattr(_LOCAL, 'recorders', ())
+
+
+class Stage:
+    """Time a block of code for the active recorders"""
+    __slots__ = ['name', 'items', '_recorders', '_wall', '_cpu']
+
+    def __init__(
+            self,
+            name: str,
+            recorders: typing.Tuple[Recorder, ...]) -> None:
+        self.name = name
+        self.items = 0
+        self._recorders = recorders
+        self._wall = 0.0
+        self._cpu = 0.0
+
+    def __enter__(self) -> 'Stage':
+        self._wall = time.perf_counter()
+        self._cpu = get_cpu_time()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        wall = time.perf_counter() - self._wall
+        cpu = get_cpu_time() - self._cpu
+
+        for recorder in self._recorders:
+            recorder.record(self.name, wall, cpu, self.items)
+
+
+class NullStage:
+    """Stand-in for `Stage` while nothing is recording"""
+    __slots__ = ['items']
+
+    def __enter__(self) -> 'NullStage':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+NULL_STAGE = NullStage()
+
+
+def stage(name: str) -> typing.Union[Stage, NullStage]:
+    """Time the block of a `with` statement as stage `name`
+
+    Set `items` of the returned object to report a count. Stages may
+    nest; the time of a stage includes the stages within it.
+
+    Arguments:
+        name {str} -- stage name
+
+    Returns:
+        typing.Union[Stage, NullStage] -- context manager
+    """
+    recorders = get_recorders()
+
+    if not recorders:
+        return NULL_STAGE
+
+    return Stage(name, recorders)
+
+
+@contextlib.contextmanager
+def recording(
+        recorder: typing.Optional[Recorder] = None,
+        callback: typing.Optional[StageCallback] = None
+) -> typing.Iterator[Recorder]:
+    """Record stages run in the current thread within the block
+
+    Pass the same `recorder` to several blocks to aggregate them.
+    Work sent to other threads or processes is not recorded.
+
+    Keyword Arguments:
+        recorder {typing.Optional[Recorder]} -- recorder to add to,
+            None for a new one (default: {None})
+        callback {typing.Optional[StageCallback]} --
+            callback of new recorder (default: {None})
+
+    Returns:
+        typing.Iterator[Recorder] -- active recorder
+    """
+    if recorder is None:
+        recorder = Recorder(callback)
+
+    previous = get_recorders()
+    _LOCAL.recorders = previous + (recorder, )
+
+    try:
+        yield recorder
+
+    finally:
+        _LOCAL.recorders = previous
@@ -1,2 +1,6 @@
 """Initialize I/O subpackage"""
-from .io import read_file, get_stream, load_json  # noqa: F401
+from .http_cache import (  # noqa: F401
+    HttpCache, get_http_cache, set_http_cache)
+from .http_pool import (  # noqa: F401
+    HttpPool, HttpResponse, fetch_many, get_pool, set_pool)
+from .io import get_stream, iter_text, load_json, read_file  # noqa: F401
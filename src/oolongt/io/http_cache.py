@@ -0,0 +1,353 @@
+"""On-disk HTTP cache, revalidated with conditional GET"""
+import email.parser
+import http.client
+import os
+import sqlite3
+import threading
+import time
+import typing
+from urllib.error import HTTPError
+
+from ..constants import HTTP_CACHE_FRESH, HTTP_CACHE_SIZE
+from ..typings import OptionalInt, PathOrString
+from .http_pool import Headers, HttpPool, HttpResponse
+
+Clock = typing.Callable[[], float]
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS responses ('
+    'url TEXT PRIMARY KEY, status INTEGER NOT NULL, reason TEXT NOT NULL, '
+    'headers TEXT NOT NULL, body BLOB NOT NULL, etag TEXT, modified TEXT, '
+    'stored REAL NOT NULL, used INTEGER NOT NULL, size INTEGER NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS responses_used ON responses (used)')
+NEXT_USE = '(SELECT COALESCE(MAX(used), 0) + 1 FROM responses)'
+PAST_MAX = (  # no window functions: SQLite 3.25+
+    'SELECT url FROM responses AS older WHERE (SELECT SUM(size) '
+    'FROM responses WHERE used >= older.used) > ?')
+
+
+def parse_headers(text: str) -> http.client.HTTPMessage:
+    """Parse stored response headers
+
+    Arguments:
+        text {str} -- headers, as sent
+
+    Returns:
+        http.client.HTTPMessage -- response headers
+    """
+    return email.parser.Parser(_class=http.client.HTTPMessage).parsestr(
+        text, headersonly=True)
+
+
+def is_storable(resp: HttpResponse) -> bool:
+    """Check whether `resp` may be stored
+
+    Arguments:
+        resp {HttpResponse} -- response
+
+    Returns:
+        bool -- complete response without `Cache-Control: no-store`
+    """
+    cache_control = resp.headers.get('Cache-Control', '').lower()
+
+    return (resp.status == 200) and ('no-store' not in cache_control)
+
+
+# pylint: disable=too-many-instance-attributes
+class HttpCache:
+    """Store responses with their validators in an SQLite database file
+
+    Within `fresh` seconds of being stored (or revalidated), a response
+    is served without a request. After that, it is revalidated with
+    `If-None-Match` and `If-Modified-Since`; a 304 response is served
+    from the cache. Past `max_size` bytes of bodies, the least recently
+    used responses are evicted.
+
+    Each process opens its own database connection on first use, so a
+    cache may be shared with forked workers, or pickled to spawned ones.
+    """
+    def __init__(
+            self,
+            path: PathOrString,
+            max_size: OptionalInt = HTTP_CACHE_SIZE,
+            fresh: float = HTTP_CACHE_FRESH,
+            clock: Clock = time.time) -> None:
+        """Open (or create) cache database
+
+        Arguments:
+            path {PathOrString} -- path to database file
+
+        Keyword Arguments:
+            max_size {OptionalInt} -- max. bytes of bodies,
+                None for unbounded (default: {HTTP_CACHE_SIZE})
+            fresh {float} -- seconds to serve responses without
+                revalidating (default: {HTTP_CACHE_FRESH})
+            clock {Clock} -- current time in seconds (default: {time.time})
+        """
+        self.path = str(path)
+        self.max_size = max_size
+        self.fresh = fresh
+        self.clock = clock
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = None  # type: typing.Optional[sqlite3.Connection]
+        self._pid = None  # type: typing.Optional[int]
+        self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        """Get database connection of this process, opening it if needed
+
+        A connection (or held lock) inherited through `fork` is replaced,
+        never used.
+
+        Returns:
+            sqlite3.Connection -- connection
+        """
+        pid = os.getpid()
+
+        if self._pid != pid:
+            self._lock = threading.Lock()
+            self._conn = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None)
+            self._pid = pid
+
+            for statement in SCHEMA:
+                self._conn.execute(statement)
+
+        return self._conn
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.update(_lock=None, _conn=None, _pid=None)
+
+        return state
+
+    def lookup(self, url: str) -> typing.Optional[tuple]:
+        """Get stored response to `url` and its validators
+
+        Arguments:
+            url {str} -- requested URL
+
+        Returns:
+            typing.Optional[tuple] -- response, ETag, Last-Modified and
+                time stored, None if missing
+        """
+        conn = self._open()
+
+        with self._lock:
+            row = conn.execute(
+                'SELECT status, reason, headers, body, etag, modified, '
+                'stored FROM responses WHERE url = ?', (url, )).fetchone()
+
+            if row is None:
+                return None
+
+            conn.execute(
+                'UPDATE responses SET used = {} WHERE url = ?'.format(
+                    NEXT_USE), (url, ))
+
+        status, reason, headers, body, etag, modified, stored = row
+        resp = HttpResponse(url, status, reason, parse_headers(headers), body)
+
+        return resp, etag, modified, stored
+
+    def store(self, url: str, resp: HttpResponse) -> None:
+        """Store response to `url`, replacing any stored response
+
+        A response too large or not storable is not stored, and any
+        earlier response to `url` is discarded.
+
+        Arguments:
+            url {str} -- requested URL
+            resp {HttpResponse} -- complete response
+        """
+        size = len(resp.body)
+
+        if not is_storable(resp) or (
+                (self.max_size is not None) and (size > self.max_size)):
+            self.discard(url)
+
+            return
+
+        conn = self._open()
+
+        with self._lock:
+            conn.execute(
+                'INSERT OR REPLACE INTO responses (url, status, reason, '
+                'headers, body, etag, modified, stored, used, size) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, {}, ?)'.format(NEXT_USE),
+                (
+                    url, resp.status, resp.reason, str(resp.headers),
+                    resp.body, resp.headers.get('ETag'),
+                    resp.headers.get('Last-Modified'), self.clock(), size))
+            self._evict(conn)
+
+    def discard(self, url: str) -> None:
+        """Remove stored response to `url`, if any
+
+        Arguments:
+            url {str} -- requested URL
+        """
+        conn = self._open()
+
+        with self._lock:
+            conn.execute('DELETE FROM responses WHERE url = ?', (url, ))
+
+    def refresh(self, url: str, resp: HttpResponse) -> None:
+        """Mark response to `url` fresh after a 304 response
+
+        Arguments:
+            url {str} -- requested URL
+            resp {HttpResponse} -- 304 response
+        """
+        conn = self._open()
+
+        with self._lock:
+            conn.execute(
+                'UPDATE responses SET stored = ?, '
+                'etag = COALESCE(?, etag), modified = COALESCE(?, modified) '
+                'WHERE url = ?',
+                (
+                    self.clock(), resp.headers.get('ETag'),
+                    resp.headers.get('Last-Modified'), url))
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Remove least recently used responses past max. size (locked)"""
+        if self.max_size is not None:
+            conn.execute(
+                'DELETE FROM responses WHERE url IN ({})'.format(PAST_MAX),
+                (self.max_size, ))
+
+    def get(
+            self,
+            pool: HttpPool,
+            url: str,
+            headers: typing.Optional[Headers] = None) -> HttpResponse:
+        """GET `url` with `pool`, from the cache when possible
+
+        Arguments:
+            pool {HttpPool} -- connection pool
+            url {str} -- http(s) URL
+
+        Keyword Arguments:
+            headers {typing.Optional[Headers]} -- extra request headers
+                (default: {None})
+
+        Returns:
+            HttpResponse -- stored or fetched response
+        """
+        entry = self.lookup(url)
+        all_headers = dict(headers or {})
+
+        if entry is not None:
+            cached, etag, modified, stored = entry
+
+            if self.clock() - stored < self.fresh:
+                with self._lock:
+                    self.hits += 1
+
+                return cached
+
+            if etag:
+                all_headers['If-None-Match'] = etag
+
+            if modified:
+                all_headers['If-Modified-Since'] = modified
+
+        try:
+            resp = pool.get(url, all_headers)
+
+        except HTTPError:
+            if entry is not None:
+                self.discard(url)
+
+            raise
+
+        if (entry is not None) and (resp.status == 304):
+            with self._lock:
+                self.revalidated += 1
+
+            self.refresh(url, resp)
+
+            return cached
+
+        with self._lock:
+            self.misses += 1
+
+        self.store(url, resp)
+
+        return resp
+
+    def clear(self) -> None:
+        """Remove every response"""
+        conn = self._open()
+
+        with self._lock:
+            conn.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        """Close database connection of this process"""
+        conn = self._open()
+
+        with self._lock:
+            conn.close()
+
+    @property
+    def size(self) -> int:
+        """Get total bytes of stored bodies
+
+        Returns:
+            int -- size in bytes
+        """
+        conn = self._open()
+
+        with self._lock:
+            row = conn.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()
+
+        return row[0]
+
+    def __len__(self) -> int:
+        conn = self._open()
+
+        with self._lock:
+            row = conn.execute(
+                'SELECT COUNT(*) FROM responses').fetchone()
+
+        return row[0]
+
+
+_LOCK = threading.Lock()
+_CACHE = None  # type: typing.Optional[HttpCache]
+
+
+def get_http_cache() -> typing.Optional[HttpCache]:
+    """Get cache consulted when reading http(s) documents
+
+    Returns:
+        typing.Optional[HttpCache] -- cache, None if disabled
+    """
+    return _CACHE
+
+
+def set_http_cache(
+        cache: typing.Optional[HttpCache]) -> typing.Optional[HttpCache]:
+    """Set cache consulted when reading http(s) documents
+
+    Forked processes inherit it; spawned processes must set their own.
+
+    Arguments:
+        cache {typing.Optional[HttpCache]} -- cache, None to disable
+
+    Returns:
+        typing.Optional[HttpCache] -- previous cache
+    """
+    global _CACHE  # pylint: disable=global-statement
+
+    with _LOCK:
+        previous, _CACHE = _CACHE, cache
+
+    return previous
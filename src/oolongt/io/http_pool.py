@@ -0,0 +1,576 @@
+"""Pooled, persistent HTTP(S) connections"""
+import contextlib
+import http.client
+import socket
+import ssl
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+from ..constants import (
+    HTTP_BACKOFF, HTTP_IDLE_TIME, HTTP_MAX_IDLE, HTTP_MAX_PER_HOST,
+    HTTP_MAX_REDIRECTS, HTTP_MAX_WORKERS, HTTP_RETRIES, HTTP_TIMEOUT)
+from ..repr_able import ReprAble
+from ..typings import OptionalInt
+
+HostKey = typing.Tuple[str, str, int]
+Headers = typing.Dict[str, str]
+Sleep = typing.Callable[[float], typing.Any]
+Clock = typing.Callable[[], float]
+FetchResult = typing.Tuple[str, typing.Union['HttpResponse', Exception]]
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+CONNECTION_ERRORS = (OSError, http.client.HTTPException)
+
+_LOCAL = threading.local()
+
+
+def get_host_key(url: str) -> HostKey:
+    """Get scheme, host and port of `url`
+
+    Arguments:
+        url {str} -- http(s) URL
+
+    Raises:
+        ValueError -- unsupported scheme or no host
+
+    Returns:
+        HostKey -- scheme, host and port
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+
+    if (scheme not in DEFAULT_PORTS) or (not parts.hostname):
+        raise ValueError('unsupported URL: {!r}'.format(url))
+
+    return scheme, parts.hostname, parts.port or DEFAULT_PORTS[scheme]
+
+
+def uses_proxy(url: str) -> bool:
+    """Check whether proxy settings (e.g. `https_proxy`) apply to `url`
+
+    Arguments:
+        url {str} -- URL
+
+    Returns:
+        bool -- a proxy is set for the scheme and `url` is not bypassed
+    """
+    parts = urlsplit(url)
+
+    return (parts.scheme.lower() in getproxies()) and not proxy_bypass(
+        parts.hostname or '')
+
+
+def get_target(url: str) -> str:
+    """Get path and query of `url` for the request line
+
+    Arguments:
+        url {str} -- http(s) URL
+
+    Returns:
+        str -- request target
+    """
+    parts = urlsplit(url)
+    target = parts.path or '/'
+
+    return '{}?{}'.format(target, parts.query) if parts.query else target
+
+
+def get_deadline() -> typing.Optional[float]:
+    """Get deadline of requests in this thread (see `request_deadline`)
+
+    Returns:
+        typing.Optional[float] -- `time.monotonic` deadline, None if unset
+    """
+    return getattr(_LOCAL, 'deadline', None)
+
+
+@contextlib.contextmanager
+def request_deadline(timeout: typing.Optional[float]) -> typing.Iterator:
+    """Stop requests in this thread `timeout` seconds from now
+
+    Within the block, socket timeouts of `HttpPool` requests (including
+    retries and redirects) are cut to the time remaining, so a blocked
+    call returns soon after `timeout` instead of after `HttpPool.timeout`.
+    An enclosing, earlier deadline is kept.
+
+    Arguments:
+        timeout {typing.Optional[float]} -- seconds, None for no deadline
+    """
+    previous = get_deadline()
+    deadline = previous
+
+    if timeout is not None:
+        deadline = time.monotonic() + timeout
+
+        if previous is not None:
+            deadline = min(deadline, previous)
+
+    _LOCAL.deadline = deadline
+
+    try:
+        yield
+
+    finally:
+        _LOCAL.deadline = previous
+
+
+# pylint: disable=too-few-public-methods
+class HttpResponse(ReprAble):
+    """Complete response to a GET request"""
+    __slots__ = ['url', 'status', 'reason', 'headers', 'body']
+
+    def __init__(
+            self,
+            url: str,
+            status: int,
+            reason: str,
+            headers: Message,
+            body: bytes) -> None:
+        """Initialize response
+
+        Arguments:
+            url {str} -- final URL, after redirects
+            status {int} -- HTTP status code
+            reason {str} -- HTTP reason phrase
+            headers {Message} -- response headers
+            body {bytes} -- response body
+        """
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    def __repr__(self) -> str:
+        return self._repr_(self.url, self.status, len(self.body))
+
+
+# pylint: disable=too-many-instance-attributes
+class HttpPool:
+    """Keep-alive connections, reused per host
+
+    At most `max_per_host` requests to a host run at once; each returns
+    its connection to the pool for the next request to that host.
+    At most `max_idle` connections are kept idle, each for no more than
+    `max_idle_time` seconds. Connection errors, timeouts and 429/5xx
+    responses are retried after `backoff`, `2 * backoff`, ... seconds.
+
+    Connections are made directly; proxy settings are not consulted
+    (`io.get_stream` falls back to `urllib` when they apply).
+    """
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            max_per_host: int = HTTP_MAX_PER_HOST,
+            timeout: float = HTTP_TIMEOUT,
+            retries: int = HTTP_RETRIES,
+            backoff: float = HTTP_BACKOFF,
+            max_redirects: int = HTTP_MAX_REDIRECTS,
+            headers: typing.Optional[Headers] = None,
+            sleep: Sleep = time.sleep,
+            max_idle: int = HTTP_MAX_IDLE,
+            max_idle_time: float = HTTP_IDLE_TIME,
+            clock: Clock = time.monotonic) -> None:
+        """Initialize empty pool
+
+        Keyword Arguments:
+            max_per_host {int} -- concurrent connections per host
+                (default: {HTTP_MAX_PER_HOST})
+            timeout {float} -- socket timeout in seconds
+                (default: {HTTP_TIMEOUT})
+            retries {int} -- retries after the first attempt
+                (default: {HTTP_RETRIES})
+            backoff {float} -- seconds before first retry
+                (default: {HTTP_BACKOFF})
+            max_redirects {int} -- redirects to follow
+                (default: {HTTP_MAX_REDIRECTS})
+            headers {typing.Optional[Headers]} -- sent with every request
+                (default: {None})
+            sleep {Sleep} -- wait between retries (default: {time.sleep})
+            max_idle {int} -- idle connections kept, all hosts
+                (default: {HTTP_MAX_IDLE})
+            max_idle_time {float} -- seconds to keep idle connections
+                (default: {HTTP_IDLE_TIME})
+            clock {Clock} -- current time in seconds
+                (default: {time.monotonic})
+
+        Raises:
+            ValueError -- invalid connection limit
+        """
+        if max_per_host < 1:
+            raise ValueError(
+                'invalid connection limit: {!r}'.format(max_per_host))
+
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_redirects = max_redirects
+        self.headers = dict(headers or {})
+        self.sleep = sleep
+        self.max_idle = max_idle
+        self.max_idle_time = max_idle_time
+        self.clock = clock
+        self.connections = 0  # opened so far
+
+        self._lock = threading.Lock()
+        self._idle = {}  # type: typing.Dict[HostKey, list]
+        self._idle_count = 0
+        self._slots = {}  # type: typing.Dict[HostKey, threading.Semaphore]
+        self._context = None  # type: typing.Optional[ssl.SSLContext]
+
+    def _get_slot(self, key: HostKey) -> threading.Semaphore:
+        with self._lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(
+                    self.max_per_host)
+
+            return self._slots[key]
+
+    def _connect(self, key: HostKey) -> http.client.HTTPConnection:
+        """Open a new connection to host of `key`"""
+        scheme, host, port = key
+
+        with self._lock:
+            self.connections += 1
+
+        if scheme == 'https':
+            if self._context is None:
+                self._context = ssl.create_default_context()
+
+            return http.client.HTTPSConnection(
+                host, port, timeout=self.timeout, context=self._context)
+
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _checkout(
+            self,
+            key: HostKey) -> typing.Tuple[http.client.HTTPConnection, bool]:
+        """Get idle connection to host of `key`, else a new one
+
+        Returns:
+            typing.Tuple[http.client.HTTPConnection, bool] --
+                connection and whether it was reused
+        """
+        conn = None  # type: typing.Optional[http.client.HTTPConnection]
+
+        with self._lock:
+            expired = self._expire()
+            idle = self._idle.get(key)
+
+            if idle:
+                conn = idle.pop()[0]
+                self._idle_count -= 1
+
+                if not idle:
+                    del self._idle[key]
+
+        for stale in expired:
+            stale.close()
+
+        if conn is not None:
+            return conn, True
+
+        return self._connect(key), False
+
+    def _checkin(
+            self,
+            key: HostKey,
+            conn: http.client.HTTPConnection) -> None:
+        """Keep `conn` idle, or close it if too many are idle"""
+        with self._lock:
+            expired = self._expire()
+            idle = self._idle.setdefault(key, [])
+            kept = (
+                (len(idle) < self.max_per_host) and
+                (self._idle_count < self.max_idle))
+
+            if kept:
+                idle.append((conn, self.clock()))
+                self._idle_count += 1
+
+            elif not idle:
+                del self._idle[key]
+
+        if not kept:
+            expired.append(conn)
+
+        for stale in expired:
+            stale.close()
+
+    def _expire(self) -> typing.List[http.client.HTTPConnection]:
+        """Remove connections idle longer than `max_idle_time` (locked)
+
+        Returns:
+            typing.List[http.client.HTTPConnection] -- connections to close
+        """
+        since = self.clock() - self.max_idle_time
+        expired = []  # type: typing.List[http.client.HTTPConnection]
+
+        for key in list(self._idle):
+            idle = self._idle[key]
+
+            while idle and (idle[0][1] < since):
+                expired.append(idle.pop(0)[0])
+
+            if not idle:
+                del self._idle[key]
+
+        self._idle_count -= len(expired)
+
+        return expired
+
+    def _get_timeout(self) -> float:
+        """Get socket timeout, cut to the deadline of this thread
+
+        Raises:
+            socket.timeout -- deadline has passed
+        """
+        deadline = get_deadline()
+
+        if deadline is None:
+            return self.timeout
+
+        remaining = deadline - time.monotonic()
+
+        if remaining <= 0:
+            raise socket.timeout('request deadline passed')
+
+        return min(self.timeout, remaining)
+
+    def _send(
+            self,
+            url: str,
+            headers: Headers,
+            timeout: float) -> HttpResponse:
+        """Send one GET request over a pooled connection
+
+        A reused connection may have been closed by the server while
+        idle; that request is repeated once on a new connection.
+        """
+        key = get_host_key(url)
+        target = get_target(url)
+
+        while True:
+            conn, reused = self._checkout(key)
+            conn.timeout = timeout
+
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+
+            try:
+                conn.request('GET', target, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+
+            except CONNECTION_ERRORS as err:
+                conn.close()
+
+                if reused and not isinstance(err, socket.timeout):
+                    continue
+
+                raise
+
+            if resp.will_close:
+                conn.close()
+
+            else:
+                self._checkin(key, conn)
+
+            return HttpResponse(
+                url, resp.status, resp.reason, resp.headers, body)
+
+    def _attempt(self, url: str, headers: Headers) -> HttpResponse:
+        """GET `url`, retrying errors and 429/5xx responses"""
+        slot = self._get_slot(get_host_key(url))
+
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            timeout = self._get_timeout()
+
+            try:
+                with slot:
+                    resp = self._send(url, headers, timeout)
+
+            except CONNECTION_ERRORS:
+                if last:
+                    raise
+
+            else:
+                if last or (resp.status not in RETRY_STATUSES):
+                    return resp
+
+            self.sleep(self.backoff * 2 ** attempt)
+
+        raise AssertionError('unreachable')
+
+    def get(
+            self,
+            url: str,
+            headers: typing.Optional[Headers] = None) -> HttpResponse:
+        """GET `url`, following redirects
+
+        Arguments:
+            url {str} -- http(s) URL
+
+        Keyword Arguments:
+            headers {typing.Optional[Headers]} -- extra request headers
+                (default: {None})
+
+        Raises:
+            ValueError -- unsupported URL
+            HTTPError -- 4xx/5xx response or too many redirects
+            OSError -- connection failed or timed out
+
+        Returns:
+            HttpResponse -- final response (< 400)
+        """
+        all_headers = dict(self.headers)
+        all_headers.update(headers or {})
+
+        for _ in range(self.max_redirects + 1):
+            resp = self._attempt(url, all_headers)
+            location = resp.headers.get('Location')
+
+            if (resp.status not in REDIRECT_STATUSES) or not location:
+                break
+
+            url = urljoin(url, location)
+
+        else:
+            raise HTTPError(
+                url, resp.status, 'too many redirects', resp.headers, None)
+
+        if resp.status >= 400:
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+
+        return resp
+
+    def fetch_many(
+            self,
+            urls: typing.Iterable[str],
+            max_workers: OptionalInt = None,
+            headers: typing.Optional[Headers] = None
+    ) -> typing.Iterator[FetchResult]:
+        """GET every URL in `urls` concurrently, in input order
+
+        Requests to each host are still limited to `max_per_host`.
+        A URL that cannot be fetched yields its exception instead of
+        stopping the rest.
+
+        Arguments:
+            urls {typing.Iterable[str]} -- http(s) URLs
+
+        Keyword Arguments:
+            max_workers {OptionalInt} -- threads, None for
+                `max_per_host` per host, up to `HTTP_MAX_WORKERS`
+                (default: {None})
+            headers {typing.Optional[Headers]} -- extra request headers
+                (default: {None})
+
+        Returns:
+            typing.Iterator[FetchResult] -- URL and response or exception
+        """
+        url_list = list(urls)
+
+        if not url_list:
+            return
+
+        if max_workers is None:
+            hosts = set()
+
+            for url in url_list:
+                try:
+                    hosts.add(get_host_key(url))
+
+                except ValueError:
+                    pass
+
+            max_workers = min(
+                HTTP_MAX_WORKERS, max(len(hosts), 1) * self.max_per_host)
+
+        def fetch(url: str) -> FetchResult:
+            try:
+                return url, self.get(url, headers)
+
+            except Exception as err:  # pylint: disable=broad-except
+                return url, err
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            yield from executor.map(fetch, url_list)
+
+    def close(self) -> None:
+        """Close idle connections"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+            self._idle_count = 0
+
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+    def __enter__(self) -> 'HttpPool':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+_LOCK = threading.Lock()
+_POOL = None  # type: typing.Optional[HttpPool]
+
+
+def get_pool() -> HttpPool:
+    """Get pool used to read http(s) documents, creating it if unset
+
+    Returns:
+        HttpPool -- connection pool
+    """
+    global _POOL  # pylint: disable=global-statement
+
+    with _LOCK:
+        if _POOL is None:
+            _POOL = HttpPool()
+
+        return _POOL
+
+
+def set_pool(pool: typing.Optional[HttpPool]) -> typing.Optional[HttpPool]:
+    """Set pool used to read http(s) documents
+
+    Arguments:
+        pool {typing.Optional[HttpPool]} -- pool, None for a default pool
+
+    Returns:
+        typing.Optional[HttpPool] -- previous pool
+    """
+    global _POOL  # pylint: disable=global-statement
+
+    with _LOCK:
+        previous, _POOL = _POOL, pool
+
+    return previous
+
+
+def fetch_many(
+        urls: typing.Iterable[str],
+        max_workers: OptionalInt = None) -> typing.Iterator[FetchResult]:
+    """GET every URL in `urls` concurrently with the shared pool
+
+    Arguments:
+        urls {typing.Iterable[str]} -- http(s) URLs
+
+    Keyword Arguments:
+        max_workers {OptionalInt} -- threads (default: {None})
+
+    Returns:
+        typing.Iterator[FetchResult] -- URL and response or exception
+    """
+    return get_pool().fetch_many(urls, max_workers)
@@ -1,13 +1,20 @@
 """Simple I/O helpers"""
+import codecs
+import mmap
 import typing
+from io import BytesIO
 from json import JSONDecodeError, loads
 from pathlib import Path
 from re import findall
 from urllib import request
+from urllib.parse import urlsplit
 
-from ..constants import PKG_NAME, VERSION
+from ..constants import PKG_NAME, TEXT_CHUNK_SIZE, VERSION
+from ..instrument.instrument import FETCH, stage
 from ..pipe import pipe
 from ..typings import PathOrString
+from .http_cache import get_http_cache
+from .http_pool import get_pool, uses_proxy
 
 
 def is_supported_scheme(path: str) -> bool:
@@ -22,6 +29,18 @@ def is_supported_scheme(path: str) -> bool:
     return len(findall(r'^(file|ftp|https*):', path)) > 0
 
 
+def is_http(path: str) -> bool:
+    """Check for http(s) URL
+
+    Arguments:
+        path {str} -- path to file
+
+    Returns:
+        bool -- read through connection pool
+    """
+    return len(findall(r'^https?://', path.lower())) > 0
+
+
 def get_user_agent() -> str:
     """Get User-Agent header value
 
@@ -77,9 +96,114 @@ def get_path_url(path: PathOrString) -> str:
     return path_obj.absolute().as_uri()
 
 
+def get_local_path(path: PathOrString) -> typing.Optional[Path]:
+    """Get local file path of `path`, None if remote
+
+    Arguments:
+        path {PathOrString} -- local path or URL
+
+    Returns:
+        typing.Optional[Path] -- path to local file
+    """
+    path_obj, path_str = get_path_forms(path)
+
+    if path_str.lower().startswith('file:'):
+        return Path(request.url2pathname(urlsplit(path_str).path))
+
+    if is_supported_scheme(path_str):
+        return None
+
+    return path_obj
+
+
+def decode_chunks(
+        stream: typing.BinaryIO,
+        chunk_size: int = TEXT_CHUNK_SIZE) -> typing.Iterator[str]:
+    """Decode UTF-8 `stream` `chunk_size` bytes at a time
+
+    Characters split between chunks are decoded whole.
+
+    Arguments:
+        stream {typing.BinaryIO} -- binary stream
+
+    Keyword Arguments:
+        chunk_size {int} -- bytes per read (default: {TEXT_CHUNK_SIZE})
+
+    Returns:
+        typing.Iterator[str] -- text of each chunk
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+
+    for data in iter(lambda: stream.read(chunk_size), b''):
+        text = decoder.decode(data)
+
+        if text:
+            yield text
+
+    tail = decoder.decode(b'', True)
+
+    if tail:
+        yield tail
+
+
+def read_local(path: Path, binary: bool = False) -> typing.Any:
+    """Read local file at `path`, bypassing urllib
+
+    Text is decoded from a memory map of the file, so the only copy in
+    memory is the string. Files that cannot be mapped are decoded in
+    chunks.
+
+    Arguments:
+        path {Path} -- path to file
+
+    Keyword Arguments:
+        binary {bool} -- read as bytes (default: {False})
+
+    Returns:
+        typing.Any -- contents of file (str or bytes)
+    """
+    with path.open('rb') as stream:
+        if binary:
+            return stream.read()
+
+        try:
+            mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        except (OSError, ValueError):
+            return ''.join(decode_chunks(stream))
+
+        with mapped:
+            return str(mapped, 'utf-8')
+
+
+def iter_text(
+        path: PathOrString,
+        chunk_size: int = TEXT_CHUNK_SIZE) -> typing.Iterator[str]:
+    """Stream text of file at `path` in chunks
+
+    Arguments:
+        path {PathOrString} -- path to file
+
+    Keyword Arguments:
+        chunk_size {int} -- bytes per read (default: {TEXT_CHUNK_SIZE})
+
+    Returns:
+        typing.Iterator[str] -- text of file, chunk by chunk
+    """
+    local = get_local_path(path)
+    stream = get_stream(path) if local is None else local.open('rb')
+
+    with stream:
+        yield from decode_chunks(stream, chunk_size)
+
+
 def get_stream(path: PathOrString) -> typing.IO[typing.Any]:
     """Stream read file at `path`
 
+    http(s) URLs are read through the shared pool (and cache, if set),
+    unless proxy settings apply to them. Other URLs are opened with the
+    proxy settings in effect now (`urlopen` keeps those of its first use).
+
     Arguments:
         path {PathOrString} -- str or pathlib.Path
 
@@ -89,7 +213,21 @@ def get_stream(path: PathOrString) -> typing.IO[typing.Any]:
     Returns:
         typing.IO[typing.Any] -- io.TextIO or io.BufferedIOBase
     """
-    return pipe(path, get_path_url, request.urlopen)
+    path_str = str(path)
+
+    if is_http(path_str) and not uses_proxy(path_str):
+        headers = {'User-Agent': get_user_agent()}
+        cache = get_http_cache()
+
+        if cache is None:
+            resp = get_pool().get(path_str, headers)
+
+        else:
+            resp = cache.get(get_pool(), path_str, headers)
+
+        return BytesIO(resp.body)
+
+    return pipe(path, get_path_url, request.build_opener().open)
 
 
 def get_contents(path: PathOrString, binary=False) -> typing.Any:
@@ -101,10 +239,22 @@ def get_contents(path: PathOrString, binary=False) -> typing.Any:
     Returns:
         str -- contents of file
     """
-    with get_stream(path) as stream:
-        contents = stream.read()  # type: bytes
+    local = get_local_path(path)
+
+    with stage(FETCH) as timed:
+        if local is not None:
+            contents = read_local(local, binary)
 
-    return contents if binary else contents.decode('utf-8')
+        else:
+            with get_stream(path) as stream:
+                contents = stream.read()
+
+            if not binary:
+                contents = contents.decode('utf-8')
+
+        timed.items = len(contents)
+
+    return contents
 
 
 def read_file(path: PathOrString) -> str:
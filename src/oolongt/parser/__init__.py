@@ -2,3 +2,4 @@
 from .parser_config import ParserConfig  # noqa: F401
 from .parser import Parser  # noqa: F401
 from .scored_keyword import ScoredKeyword  # noqa: F401
+from .stem_cache import StemCache  # noqa: F401
@@ -0,0 +1,92 @@
+"""Tokenize-once analysis of a body of content"""
+import typing
+from array import array
+
+from ..repr_able import ReprAble
+from ..typings import StringList
+
+StemLists = typing.List[StringList]
+
+
+def is_contiguous(sentences: StringList, normalized: str) -> bool:
+    """Verify `sentences` are separated by single spaces in `normalized`
+
+    If so, the words of the body are exactly the words of its sentences.
+    Otherwise (a break without whitespace, ex: '"No."Yes'), the body
+    tokenizes differently from its sentences.
+
+    Arguments:
+        sentences {StringList} -- sentences split from `normalized`
+        normalized {str} -- body with whitespace runs as single spaces
+
+    Returns:
+        bool -- sentences rejoin into the normalized body
+    """
+    joined_len = sum(len(sent) for sent in sentences) + len(sentences) - 1
+
+    return max(joined_len, 0) == len(normalized.strip())
+
+
+def locate_sentences(
+        body: str,
+        sentences: StringList) -> typing.Tuple[array, array]:
+    """Find start and end offsets of each of `sentences` in `body`
+
+    Arguments:
+        body {str} -- text `sentences` were split from
+        sentences {StringList} -- sentences in content order
+
+    Raises:
+        ValueError -- sentence not found in `body` (in order)
+
+    Returns:
+        typing.Tuple[array, array] -- start offsets, end offsets
+    """
+    starts = array('q')
+    ends = array('q')
+    offset = 0
+
+    for sentence in sentences:
+        text = sentence.strip()
+        start = body.find(text, offset)
+
+        if start < 0:
+            raise ValueError('sentence not in body: {!r}'.format(text))
+
+        offset = start + len(text)
+        starts.append(start)
+        ends.append(offset)
+
+    return starts, ends
+
+
+# pylint: disable=too-few-public-methods
+class Analysis(ReprAble):
+    """Sentences of a body with their stems and the body's keyword stems"""
+    __slots__ = ['sentences', 'stems', 'key_stems', 'body']
+
+    def __init__(
+            self,
+            sentences: StringList,
+            stems: StemLists,
+            key_stems: StringList,
+            body: str = '') -> None:
+        """Initialize analysis
+
+        Arguments:
+            sentences {StringList} -- sentences in body
+            stems {StemLists} -- all stems of each sentence
+            key_stems {StringList} -- meaningful stems in body
+
+        Keyword Arguments:
+            body {str} -- body with whitespace runs as single spaces,
+                `sentences` are split from it (default: {''})
+        """
+        self.sentences = sentences
+        self.stems = stems
+        self.key_stems = key_stems
+        self.body = body
+
+    def __repr__(self) -> str:
+        return self._repr_(
+            self.sentences, self.stems, self.key_stems, self.body)
@@ -1,13 +1,18 @@
 """Text parser"""
 import typing
+from collections import Counter
 from re import sub
 
-from nltk.stem.porter import PorterStemmer
-from nltk.tokenize import sent_tokenize, word_tokenize
-
-from ..typings import StringList
+from ..constants import DEFAULT_STEM_CACHE_SIZE
+from ..instrument.instrument import SPLIT, STEM, stage
+from ..typings import OptionalInt, StringList
+from .analysis import Analysis, StemLists, is_contiguous
 from .parser_config import BUILTIN, DEFAULT_IDIOM, ParserConfig
 from .scored_keyword import ScoredKeyword
+from .stem_cache import StemCache
+from .stream import iter_runs, iter_sentences
+
+KeywordCounts = typing.Counter[str]
 
 
 def remove_punctuations(text: str) -> str:
@@ -24,12 +29,79 @@ def remove_punctuations(text: str) -> str:
     return unpunct
 
 
+def normalize_space(text: str) -> str:
+    """Replace whitespace runs in `text` with a single space
+
+    Arguments:
+        text {str} -- text
+
+    Returns:
+        str -- normalized text
+    """
+    return sub('\\s+', ' ', text)
+
+
+def sent_tokenize(text: str, language: str) -> StringList:
+    """Split `text` into sentences with NLTK (imported on first use)
+
+    Arguments:
+        text {str} -- text
+        language {str} -- NLTK language
+
+    Returns:
+        StringList -- sentences
+    """
+    # pylint: disable=import-outside-toplevel
+    from nltk.tokenize import sent_tokenize as tokenize
+
+    return tokenize(text, language=language)
+
+
+def word_tokenize(text: str, language: str) -> StringList:
+    """Split `text` into words with NLTK (imported on first use)
+
+    Arguments:
+        text {str} -- text
+        language {str} -- NLTK language
+
+    Returns:
+        StringList -- words
+    """
+    # pylint: disable=import-outside-toplevel
+    from nltk.tokenize import word_tokenize as tokenize
+
+    return tokenize(text, language=language)
+
+
+def score_keyword_counts(
+        counts: KeywordCounts,
+        total: OptionalInt = None) -> typing.List[ScoredKeyword]:
+    """List scored keywords from stem `counts`
+
+    Arguments:
+        counts {KeywordCounts} -- occurrences of each meaningful stem
+
+    Keyword Arguments:
+        total {OptionalInt} -- number of meaningful stems,
+            if known (default: {sum of counts})
+
+    Returns:
+        typing.List[ScoredKeyword] -- list of keywords, scored
+    """
+    if total is None:
+        total = sum(counts.values())
+
+    return [
+        ScoredKeyword(word, count, total) for word, count in counts.items()]
+
+
 class Parser:
     """Parse content for words and keywords"""
     def __init__(
             self,
             root: str = BUILTIN,
-            idiom: str = DEFAULT_IDIOM) -> None:
+            idiom: str = DEFAULT_IDIOM,
+            stem_cache_size: OptionalInt = DEFAULT_STEM_CACHE_SIZE) -> None:
         """Initialize class with `root`/`idiom`.json
 
         Keyword Arguments:
@@ -37,10 +109,15 @@ class Parser:
                 (default: {parser.BUILTIN})
             idiom {str} -- basename of idiom file
                 (default: {parser.DEFAULT_IDIOM})
+            stem_cache_size {OptionalInt} -- max. cached stems,
+                None for unbounded (default: {DEFAULT_STEM_CACHE_SIZE})
 
         Raises:
             ValueError: missing/invalid configuration file
         """
+        # pylint: disable=import-outside-toplevel
+        from nltk.stem.porter import PorterStemmer
+
         config = ParserConfig(root, idiom)
         isl = config.ideal_sentence_length
         language = config.language
@@ -50,6 +127,7 @@ class Parser:
         self.language = language          # type: str
         self.stop_words = stop_words      # type: StringList
         self._stemmer = PorterStemmer(mode=PorterStemmer.MARTIN_EXTENSIONS)
+        self.stem_cache = StemCache(self._stemmer.stem, stem_cache_size)
 
     def get_words(
             self,
@@ -74,7 +152,7 @@ class Parser:
             words = filter(self.is_not_stop_word, words)
 
         if stem:
-            words = map(self._stemmer.stem, words)
+            words = map(self.stem_cache.stem, words)
 
         return list(words)
 
@@ -131,15 +209,102 @@ class Parser:
         Returns:
             typing.List[ScoredKeyword] -- list of keywords, scored
         """
-        keyword_stems = self.get_key_stems(text)
-        unique_stems = list(set(keyword_stems))
+        return self.score_keywords(self.get_key_stems(text))
+
+    def count_keywords(
+            self,
+            text: typing.Union[str, typing.Iterable[str]]) -> KeywordCounts:
+        """Count meaningful stems in `text` without scoring them
+
+        Text may be streamed as an iterable of chunks (ex: `iter_text`),
+        counted a few words at a time.
+
+        Arguments:
+            text {typing.Union[str, typing.Iterable[str]]} --
+                text or chunks of text
+
+        Returns:
+            KeywordCounts -- occurrences of each meaningful stem
+        """
+        if isinstance(text, str):
+            return Counter(self.get_key_stems(text))
 
-        keywords = [
-            ScoredKeyword(word, keyword_stems.count(word), len(keyword_stems))
-            for word
-            in unique_stems]
+        counts = Counter()  # type: KeywordCounts
 
-        return keywords
+        for run in iter_runs(text):
+            counts.update(self.get_key_stems(run))
+
+        return counts
+
+    def score_keywords(  # pylint: disable=no-self-use
+            self,
+            keyword_stems: StringList) -> typing.List[ScoredKeyword]:
+        """List scored keywords from every meaningful stem in a text
+
+        Arguments:
+            keyword_stems {StringList} -- meaningful stems, sequentially
+
+        Returns:
+            typing.List[ScoredKeyword] -- list of keywords, scored
+        """
+        return score_keyword_counts(
+            Counter(keyword_stems), len(keyword_stems))
+
+    def analyze(self, text: str) -> Analysis:
+        """Split `text` into sentences, tokenizing and stemming each once
+
+        Keyword stems for the whole body are derived from the sentences,
+        so `analysis.key_stems` matches `get_key_stems(text)`.
+
+        Arguments:
+            text {str} -- body of content
+
+        Returns:
+            Analysis -- sentences, stems of each, keyword stems of body
+        """
+        normalized = normalize_space(text)
+
+        with stage(SPLIT) as timed:
+            sentences = sent_tokenize(normalized, self.language)
+            timed.items = len(sentences)
+
+        stems, key_stems = self.stem_sentences(sentences)
+
+        if not is_contiguous(sentences, normalized):
+            with stage(STEM):
+                key_stems = self.get_key_stems(text)
+
+        return Analysis(sentences, stems, key_stems, normalized)
+
+    def stem_sentences(
+            self,
+            sentences: StringList) -> typing.Tuple[StemLists, StringList]:
+        """List all stems in each of `sentences` and their meaningful stems
+
+        Arguments:
+            sentences {StringList} -- sentences
+
+        Returns:
+            typing.Tuple[StemLists, StringList] --
+                stems of each sentence, meaningful stems of all sentences
+        """
+        stem = self.stem_cache.stem
+        is_key = self.is_not_stop_word
+        all_stems = []  # type: StemLists
+        key_stems = []  # type: StringList
+
+        with stage(STEM) as timed:
+            for sentence in sentences:
+                words = self.split_words(sentence)
+                stems = [stem(word) for word in words]
+
+                all_stems.append(stems)
+                key_stems.extend(
+                    stems[i] for i, word in enumerate(words) if is_key(word))
+
+            timed.items = len(sentences)
+
+        return all_stems, key_stems
 
     def split_sentences(self, text: str) -> StringList:
         """List sentences in `text` via tokenizer sequentially
@@ -150,9 +315,32 @@ class Parser:
         Returns:
             StringList -- sentences in text
         """
-        normalized = sub('\\s+', ' ', text)
+        normalized = normalize_space(text)
+
+        with stage(SPLIT) as timed:
+            sentences = sent_tokenize(normalized, self.language)
+            timed.items = len(sentences)
+
+        return sentences
+
+    def iter_sentences(
+            self,
+            chunks: typing.Iterable[str]) -> typing.Iterator[str]:
+        """Stream sentences from `chunks` of text as they arrive
+
+        Same sentences as `split_sentences` of all chunks joined,
+        keeping only the unsettled end of the text in memory.
+
+        Arguments:
+            chunks {typing.Iterable[str]} -- text, in order
+                (ex: `iter_text`)
+
+        Returns:
+            typing.Iterator[str] -- sentences in order
+        """
+        normalized = (normalize_space(chunk) for chunk in chunks)
 
-        return sent_tokenize(normalized, language=self.language)
+        return iter_sentences(normalized, self.split_sentences)
 
     def split_words(self, text: str) -> typing.Iterator[str]:
         """List constituent words of `text` via tokenizer sequentially
@@ -164,7 +352,7 @@ class Parser:
             StringList -- words in text
         """
         bare = remove_punctuations(text).lower()
-        split = word_tokenize(bare.lower(), language=self.language)
+        split = word_tokenize(bare.lower(), self.language)
 
         return split
 
@@ -3,8 +3,6 @@ import typing
 from json import JSONDecodeError
 from pathlib import Path
 
-from nltk.corpus import stopwords
-
 from ..constants import (
     BUILTIN, DEFAULT_IDEAL_LENGTH, DEFAULT_IDIOM, DEFAULT_LANGUAGE,
     DEFAULT_NLTK_STOPS, DEFAULT_USER_STOPS)
@@ -44,7 +42,15 @@ def get_stop_words(idiom_spec: DictOfAny, language: str) -> set:
     use_nltk = bool(stop_cfg['nltk'])
     use_user = isinstance(stop_cfg['user'], list)
 
-    nltk = stopwords.words(language) if use_nltk else []
+    if use_nltk:
+        # pylint: disable=import-outside-toplevel
+        from nltk.corpus import stopwords
+
+        nltk = stopwords.words(language)
+
+    else:
+        nltk = []
+
     user = [str(word) for word in stop_cfg['user']] if use_user else []
 
     return set(nltk + user)
@@ -3,9 +3,11 @@ import typing
 
 import kinda
 
-from ..constants import KEYWORD_SCORE_K
+from ..constants import COMPOSITE_TOLERANCE, KEYWORD_SCORE_K
 from ..repr_able import ReprAble
 
+KeywordSortKey = typing.Tuple[int, int, str]
+
 
 def score_keyword(  # pylint: disable=invalid-name
         count: int,
@@ -71,13 +73,14 @@ def compare_word(word_a: str, word_b: str) -> int:
 
 class ScoredKeyword(ReprAble):
     """Keyword data"""
-    __slots__ = ['word', 'count', 'of', 'score']
+    __slots__ = ['word', 'count', 'of', 'score', '_sort_key']
 
     def __init__(self, word: str, count: int, total: int) -> None:
         self.word = str(word).lower()
         self.count = int(count)
         self.of = int(total)  # pylint: disable=invalid-name
         self.score = score_keyword(self.count, self.of)
+        self._sort_key = get_sort_key(self)
 
     def __str__(self) -> str:
         return self.word
@@ -85,20 +88,23 @@ class ScoredKeyword(ReprAble):
     def __repr__(self) -> str:
         return self._repr_(self.word, self.count, self.of)
 
-    def __lt__(self, other) -> bool:
-        cmp = compare_keywords(self, other)
+    @property
+    def sort_key(self) -> KeywordSortKey:
+        """Quantized score, word length, and word
 
-        return cmp < (0, 0, 0)
+        Returns:
+            KeywordSortKey -- key to order keywords (see `get_sort_key`)
+        """
+        return self._sort_key
 
-    def __eq__(self, other) -> bool:
-        cmp = compare_keywords(self, other)
+    def __lt__(self, other) -> bool:
+        return self.sort_key < other.sort_key
 
-        return cmp == (0, 0, 0)
+    def __eq__(self, other) -> bool:
+        return self.sort_key == other.sort_key
 
     def __gt__(self, other) -> bool:
-        cmp = compare_keywords(self, other)
-
-        return cmp > (0, 0, 0)
+        return self.sort_key > other.sort_key
 
 
 def compare_keywords(
@@ -117,3 +123,23 @@ def compare_keywords(
         compare_score(kw_a.score, kw_b.score),
         len(kw_a.word) - len(kw_b.word),
         compare_word(kw_a.word, kw_b.word), )
+
+
+def get_sort_key(keyword: ScoredKeyword) -> KeywordSortKey:
+    """Get key to sort `keyword` as `compare_keywords` orders it
+
+    Keyword scores are shares of one body, so any two are either equal
+    or far beyond the tolerance of `kinda.eq`; comparing plain tuples
+    gives the same order without a method call per comparison.
+
+    Arguments:
+        keyword {ScoredKeyword} -- keyword
+
+    Returns:
+        KeywordSortKey --
+            score / `COMPOSITE_TOLERANCE`, word length, word
+    """
+    return (
+        round(keyword.score / COMPOSITE_TOLERANCE),
+        len(keyword.word),
+        keyword.word)
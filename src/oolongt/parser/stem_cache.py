@@ -0,0 +1,87 @@
+"""Memoized word stemming"""
+import typing
+from functools import lru_cache
+
+from ..constants import DEFAULT_STEM_CACHE_SIZE
+from ..repr_able import ReprAble
+from ..typings import OptionalInt
+
+StemFunc = typing.Callable[[str], str]
+
+
+class StemCache(ReprAble):
+    """Bounded LRU cache in front of a stemmer"""
+    def __init__(
+            self,
+            stem_func: StemFunc,
+            size: OptionalInt = DEFAULT_STEM_CACHE_SIZE) -> None:
+        """Wrap `stem_func` in a cache of `size` words
+
+        Arguments:
+            stem_func {StemFunc} -- function to stem a single word
+
+        Keyword Arguments:
+            size {OptionalInt} -- max. cached words,
+                None for unbounded, 0 to disable
+                (default: {DEFAULT_STEM_CACHE_SIZE})
+        """
+        self._stem_func = stem_func
+        self._size = size
+        self._cached = lru_cache(maxsize=size)(stem_func)
+
+    @property
+    def size(self) -> OptionalInt:
+        """Get maximum number of cached stems
+
+        Returns:
+            OptionalInt -- size limit (None: unbounded)
+        """
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        """Get number of stems served from cache
+
+        Returns:
+            int -- cache hits
+        """
+        return self._cached.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        """Get number of stems computed by stemmer
+
+        Returns:
+            int -- cache misses
+        """
+        return self._cached.cache_info().misses
+
+    @property
+    def length(self) -> int:
+        """Get number of cached stems
+
+        Returns:
+            int -- current cache size
+        """
+        return self._cached.cache_info().currsize
+
+    def stem(self, word: str) -> str:
+        """Get stem of `word`, least recently used words evicted
+
+        Arguments:
+            word {str} -- word
+
+        Returns:
+            str -- stem of word
+        """
+        return self._cached(word)
+
+    def clear(self) -> None:
+        """Empty cache and reset counters"""
+        self._cached.cache_clear()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        return self._repr_(self._stem_func, size=self.size)
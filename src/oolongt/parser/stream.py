@@ -0,0 +1,174 @@
+"""Split and count streams of text in bounded memory"""
+import re
+import typing
+
+from ..constants import STREAM_MAX_TAIL
+from ..typings import StringList
+from .analysis import locate_sentences
+
+Splitter = typing.Callable[[str], StringList]
+
+LAST_SPACE = re.compile(r'\s\S*\Z')
+
+
+def find_unsettled(text: str, starts: typing.Sequence[int]) -> int:
+    """Get index of first sentence that appending to `text` may change
+
+    The tokenizer decides each break from the words on either side, so
+    a break is settled once the first word after it is complete, i.e.
+    followed by whitespace. A sentence settles only if the next one
+    starts after a space, so it can be split again on its own.
+
+    Arguments:
+        text {str} -- normalized text
+        starts {typing.Sequence[int]} -- offset of each sentence in `text`
+
+    Returns:
+        int -- index of first unsettled sentence
+    """
+    last_word = len(text) if text.endswith(' ') else text.rfind(' ') + 1
+
+    for idx in range(len(starts) - 1, 0, -1):
+        start = starts[idx]
+
+        if (start < last_word) and (text[start - 1] == ' '):
+            return idx
+
+    return 0
+
+
+def force_break(text: str, split: Splitter) -> typing.Tuple[StringList, str]:
+    """Split `text` before its last word, even if sentences may change
+
+    Arguments:
+        text {str} -- normalized text
+        split {Splitter} -- split normalized text into sentences
+
+    Returns:
+        typing.Tuple[StringList, str] -- sentences, last word
+    """
+    cut = text.rfind(' ')
+
+    if cut < 1:
+        return split(text), ''
+
+    return split(text[:cut]), text[cut + 1:]
+
+
+def iter_sentences(
+        chunks: typing.Iterable[str],
+        split: Splitter,
+        max_tail: int = STREAM_MAX_TAIL) -> typing.Iterator[str]:
+    """Split sentences from normalized `chunks` of text as they arrive
+
+    Same sentences as `split` of all chunks joined. Only text that may
+    still change (usually the last sentence) is kept between chunks,
+    and it is split again only once as much text has arrived after it,
+    so the whole stream is split in linear time. Past `max_tail`
+    characters without a settled break (ex: unpunctuated text), a break
+    is forced before the last word.
+
+    Arguments:
+        chunks {typing.Iterable[str]} -- text with whitespace runs
+            as single spaces, in order
+        split {Splitter} -- split normalized text into sentences
+
+    Keyword Arguments:
+        max_tail {int} -- characters of unsettled text kept
+            (default: {STREAM_MAX_TAIL})
+
+    Returns:
+        typing.Iterator[str] -- sentences in order
+    """
+    tail = ''
+    parts = []  # type: StringList
+    fresh = 0  # characters of `parts`
+    spaced = False  # last character received is a space
+
+    for chunk in chunks:
+        if spaced and chunk.startswith(' '):
+            chunk = chunk[1:]
+
+        if not chunk:
+            continue
+
+        parts.append(chunk)
+        fresh += len(chunk)
+        spaced = chunk.endswith(' ')
+
+        if fresh < len(tail):
+            continue
+
+        tail += ''.join(parts)
+        parts, fresh = [], 0
+        sentences = split(tail)
+        starts, _ = locate_sentences(tail, sentences)
+        unsettled = find_unsettled(tail, starts)
+
+        if unsettled:
+            yield from sentences[:unsettled]
+
+            tail = tail[starts[unsettled]:]
+
+        if len(tail) > max_tail:
+            forced, tail = force_break(tail, split)
+
+            yield from forced
+
+    tail += ''.join(parts)
+
+    if tail:
+        yield from split(tail)
+
+
+def find_word_cut(text: str, max_carry: int = STREAM_MAX_TAIL) -> int:
+    """Get offset just after the last whitespace in `text`
+
+    Arguments:
+        text {str} -- text
+
+    Keyword Arguments:
+        max_carry {int} -- longest last word to leave after the offset
+            (default: {STREAM_MAX_TAIL})
+
+    Returns:
+        int -- offset (0 if no whitespace, `len(text)` if the last word
+            is longer than `max_carry`)
+    """
+    match = LAST_SPACE.search(text)
+    cut = match.start() + 1 if match else 0
+
+    return len(text) if len(text) - cut > max_carry else cut
+
+
+def iter_runs(
+        chunks: typing.Iterable[str],
+        max_carry: int = STREAM_MAX_TAIL) -> typing.Iterator[str]:
+    """Regroup `chunks` of text so no word is split between them
+
+    Each piece ends at whitespace (except the last), so words of the
+    pieces are the words of the whole text. A word longer than
+    `max_carry` characters is cut instead of held.
+
+    Arguments:
+        chunks {typing.Iterable[str]} -- text, in order
+
+    Keyword Arguments:
+        max_carry {int} -- characters held after the last whitespace
+            (default: {STREAM_MAX_TAIL})
+
+    Returns:
+        typing.Iterator[str] -- text, cut at whitespace
+    """
+    carry = ''
+
+    for chunk in chunks:
+        text = carry + chunk
+        cut = find_word_cut(text, max_carry)
+        carry = text[cut:]
+
+        if cut:
+            yield text[:cut]
+
+    if carry:
+        yield carry
@@ -0,0 +1,34 @@
+"""Process pools with initialized workers"""
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+from .typings import OptionalInt
+
+
+def get_process_pool(
+        max_workers: OptionalInt,
+        initializer: typing.Callable,
+        initargs: tuple) -> ProcessPoolExecutor:
+    """Start a process pool, calling `initializer` in each worker
+
+    Before Python 3.7, `ProcessPoolExecutor` takes no initializer;
+    `initializer` then runs in this process, and forked workers inherit
+    its state (spawned workers start uninitialized).
+
+    Arguments:
+        max_workers {OptionalInt} -- worker processes, None for one
+            per CPU
+        initializer {typing.Callable} -- worker setup
+        initargs {tuple} -- arguments of `initializer`
+
+    Returns:
+        ProcessPoolExecutor -- process pool
+    """
+    try:
+        return ProcessPoolExecutor(
+            max_workers, initializer=initializer, initargs=initargs)
+
+    except TypeError:
+        initializer(*initargs)
+
+        return ProcessPoolExecutor(max_workers)
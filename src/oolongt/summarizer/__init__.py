@@ -1,3 +1,6 @@
 """Initialize summarizer subpackage"""
+from .registry import get_parser, get_summarizer, invalidate  # noqa: F401
+from .scored_batch import ScoredBatch  # noqa: F401
 from .scored_sentence import ScoredSentence  # noqa: F401
+from .sharded import score_sharded  # noqa: F401
 from .summarizer import Summarizer  # noqa: F401
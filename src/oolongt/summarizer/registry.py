@@ -0,0 +1,103 @@
+"""Shared Summarizer/Parser instances"""
+import threading
+import typing
+
+from ..cache.result_cache import forget_config_digests
+from ..constants import BUILTIN, DEFAULT_IDIOM
+from ..parser import Parser
+from .summarizer import Summarizer
+
+RegistryKey = typing.Tuple[str, str]
+
+_LOCK = threading.Lock()
+_SUMMARIZERS = {}  # type: typing.Dict[RegistryKey, Summarizer]
+
+
+def get_key(root: typing.Any, idiom: typing.Any) -> RegistryKey:
+    """Get registry key for `root`/`idiom`
+
+    Arguments:
+        root {typing.Any} -- root directory of idiom config
+        idiom {typing.Any} -- basename of idiom config
+
+    Returns:
+        RegistryKey -- (root, idiom) as strings
+    """
+    return str(root), str(idiom)
+
+
+def get_summarizer(
+        root: str = BUILTIN,
+        idiom: str = DEFAULT_IDIOM) -> Summarizer:
+    """Get shared Summarizer for `root`/`idiom`.json
+
+    Keyword Arguments:
+        root {str} -- root directory of idiom config
+            (default: {BUILTIN})
+        idiom {str} -- basename of idiom config
+            (default: {DEFAULT_IDIOM})
+
+    Raises:
+        ValueError: missing/invalid configuration file
+
+    Returns:
+        Summarizer -- warm summarizer, shared process-wide
+    """
+    key = get_key(root, idiom)
+
+    try:
+        return _SUMMARIZERS[key]
+
+    except KeyError:
+        pass
+
+    with _LOCK:
+        if key not in _SUMMARIZERS:
+            _SUMMARIZERS[key] = Summarizer(*key)
+
+        return _SUMMARIZERS[key]
+
+
+def get_parser(root: str = BUILTIN, idiom: str = DEFAULT_IDIOM) -> Parser:
+    """Get shared Parser for `root`/`idiom`.json
+
+    Keyword Arguments:
+        root {str} -- root directory of idiom config
+            (default: {BUILTIN})
+        idiom {str} -- basename of idiom config
+            (default: {DEFAULT_IDIOM})
+
+    Returns:
+        Parser -- parser of the shared summarizer
+    """
+    return get_summarizer(root, idiom).parser
+
+
+def invalidate(
+        root: typing.Optional[str] = None,
+        idiom: typing.Optional[str] = None) -> int:
+    """Discard shared instances matching `root` and/or `idiom`
+
+    Omitted arguments match anything, so `invalidate()` clears
+    the registry (e.g. after editing an idiom file). Digests of
+    matching configs in result cache keys are discarded too.
+
+    Keyword Arguments:
+        root {typing.Optional[str]} -- root directory (default: {None})
+        idiom {typing.Optional[str]} -- basename of idiom (default: {None})
+
+    Returns:
+        int -- number of instances discarded
+    """
+    with _LOCK:
+        keys = [
+            key for key in _SUMMARIZERS
+            if (root is None or key[0] == str(root)) and
+            (idiom is None or key[1] == str(idiom))]
+
+        for key in keys:
+            del _SUMMARIZERS[key]
+
+    forget_config_digests(root, idiom)
+
+    return len(keys)
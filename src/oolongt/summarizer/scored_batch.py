@@ -0,0 +1,119 @@
+"""Compact scores of every sentence in a body"""
+import typing
+from array import array
+
+from ..parser.analysis import locate_sentences
+from ..repr_able import ReprAble
+from ..typings import StringList
+from .scored_sentence import ScoredSentence
+from .sentence_score import (
+    score_keyword_frequency, score_position, score_total)
+
+TldsScores = typing.Tuple[float, float, float, float]
+
+
+# pylint: disable=too-many-instance-attributes
+class ScoredBatch(ReprAble):
+    """Scores of every sentence in a body, stored as arrays
+
+    Sentence text is kept as offsets into the body; `ScoredSentence`
+    views are created on demand.
+    """
+    __slots__ = [
+        'body', 'of', 'index', 'start', 'end',
+        'title', 'length', 'dbs', 'sbs', 'position', 'total']
+
+    def __init__(
+            self,
+            body: str,
+            sentences: StringList,
+            tlds_scores: typing.Iterable[TldsScores]) -> None:
+        """Initialize batch
+
+        Arguments:
+            body {str} -- text `sentences` were split from
+            sentences {StringList} -- sentences in content order
+            tlds_scores {typing.Iterable[TldsScores]} --
+                title, length, DBS, and SBS scores of each sentence
+        """
+        self.body = body
+        self.of = len(sentences)  # pylint: disable=invalid-name
+        self.start, self.end = locate_sentences(body, sentences)
+        self.index = array('q', range(self.of))
+        self.title = array('d')
+        self.length = array('d')
+        self.dbs = array('d')
+        self.sbs = array('d')
+        self.position = array('d')
+        self.total = array('d')
+
+        for idx, (title, length, dbs, sbs) in enumerate(tlds_scores):
+            position = score_position(idx, self.of)
+            keyword = score_keyword_frequency(dbs, sbs)
+
+            self.title.append(title)
+            self.length.append(length)
+            self.dbs.append(dbs)
+            self.sbs.append(sbs)
+            self.position.append(position)
+            self.total.append(score_total(title, keyword, length, position))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, key: int) -> ScoredSentence:
+        return ScoredSentence(
+            self.get_text(key),
+            self.index[key],
+            self.of,
+            self.get_tlds(key))
+
+    def __iter__(self) -> typing.Iterator[ScoredSentence]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __repr__(self) -> str:
+        return self._repr_(self.body, self.get_texts(), list(
+            self.get_tlds(idx) for idx in range(len(self))))
+
+    def get_text(self, key: int) -> str:
+        """Get text of sentence `key`
+
+        Arguments:
+            key {int} -- position of sentence in batch
+
+        Returns:
+            str -- text of sentence
+        """
+        return self.body[self.start[key]:self.end[key]]
+
+    def get_texts(self) -> StringList:
+        """List text of every sentence
+
+        Returns:
+            StringList -- sentences in content order
+        """
+        return [self.get_text(idx) for idx in range(len(self))]
+
+    def get_tlds(self, key: int) -> TldsScores:
+        """Get title, length, DBS and SBS scores of sentence `key`
+
+        Arguments:
+            key {int} -- position of sentence in batch
+
+        Returns:
+            TldsScores -- feature scores
+        """
+        return (
+            self.title[key], self.length[key], self.dbs[key], self.sbs[key])
+
+    def get_ranking(self) -> typing.List[int]:
+        """List positions of sentences from best to worst
+
+        Ties keep content order, as with `sorted(..., reverse=True)`.
+
+        Returns:
+            typing.List[int] -- positions, best first
+        """
+        return sorted(
+            range(len(self)), key=self.total.__getitem__, reverse=True)
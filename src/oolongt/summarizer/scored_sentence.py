@@ -54,6 +54,10 @@ class ScoredSentence(ReprAble):
     def score(self):
         return self._score
 
+    @property
+    def sort_key(self) -> int:
+        return self._score.sort_key
+
     def __str__(self) -> str:
         return self.text
 
@@ -71,10 +75,10 @@ class ScoredSentence(ReprAble):
         )
 
     def __eq__(self, other) -> bool:
-        return self.score.total == other.score.total
+        return self.sort_key == other.sort_key
 
     def __lt__(self, other) -> bool:
-        return self.score.total < other.score.total
+        return self.sort_key < other.sort_key
 
     def __gt__(self, other) -> bool:
-        return self.score.total > other.score.total
+        return self.sort_key > other.sort_key
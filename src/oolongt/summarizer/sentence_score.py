@@ -116,6 +116,7 @@ class SentenceScore(ReprAble):
         self._keyword = None  # type: Optional[float]
 
         self._total = None    # type: Optional[float]
+        self._sort_key = None  # type: Optional[int]
 
     @property
     def title(self) -> float:
@@ -167,8 +168,20 @@ class SentenceScore(ReprAble):
 
         return self._total
 
+    @property
+    def sort_key(self) -> int:
+        """Total score in units of `COMPOSITE_TOLERANCE`
+
+        Returns:
+            int -- key to order scores by total
+        """
+        if self._sort_key is None:
+            self._sort_key = round(self.total / COMPOSITE_TOLERANCE)
+
+        return self._sort_key
+
     def __lt__(self, other) -> bool:
-        return self.total < other.total
+        return self.sort_key < other.sort_key
 
     def __eq__(self, other) -> bool:
         equal = kinda.eq(
@@ -179,7 +192,7 @@ class SentenceScore(ReprAble):
         return equal
 
     def __gt__(self, other) -> bool:
-        return self.total > other.total
+        return self.sort_key > other.sort_key
 
     def __str__(self) -> str:
         return str(self.total)
@@ -0,0 +1,182 @@
+"""Map-reduce scoring of very large bodies of content"""
+import os
+import typing
+from collections import Counter
+
+from ..constants import BUILTIN, DEFAULT_IDIOM, DEFAULT_SHARD_SIZE
+from ..parser.analysis import StemLists, is_contiguous  # noqa: F401
+from ..parser.parser import KeywordCounts, normalize_space
+from ..process_pool import get_process_pool
+from ..typings import OptionalInt, StringList
+from .registry import get_summarizer
+from .scored_batch import TldsScores
+from .scored_sentence import ScoredSentence
+from .summarizer import KeywordTable, tabulate_counts
+
+StemJob = typing.Tuple[int, StringList]
+ScoreJob = typing.Tuple[int, StringList, KeywordTable]
+
+_IDIOM = (BUILTIN, DEFAULT_IDIOM)  # type: typing.Tuple[str, str]
+_STEMS = {}  # type: typing.Dict[int, StemLists]
+
+
+def init_worker(root: str, idiom: str) -> None:
+    """Store idiom and load language data in a worker process
+
+    Arguments:
+        root {str} -- root directory of idiom data
+        idiom {str} -- basename of idiom file
+    """
+    global _IDIOM  # pylint: disable=global-statement
+    _IDIOM = (root, idiom)
+
+    get_summarizer(root, idiom).parser.get_all_stems('Load the stemmer.')
+
+
+def stem_shard(job: StemJob) -> KeywordCounts:
+    """Stem each sentence of a shard, keeping stems in this worker
+
+    Arguments:
+        job {StemJob} -- index of shard, sentences in shard
+
+    Returns:
+        KeywordCounts -- occurrences of meaningful stems
+    """
+    index, sentences = job
+    parser = get_summarizer(*_IDIOM).parser
+    stems, key_stems = parser.stem_sentences(sentences)
+    _STEMS[index] = stems
+
+    return Counter(key_stems)
+
+
+def score_shard(job: ScoreJob) -> typing.List[TldsScores]:
+    """Score stems of each sentence in a shard against keyword table
+
+    The shard must have been stemmed by `stem_shard` in this worker.
+
+    Arguments:
+        job {ScoreJob} -- index of shard, stemmed key words in title,
+            score of top keywords by stem
+
+    Returns:
+        typing.List[TldsScores] -- feature scores of each sentence
+    """
+    index, title_kw_stems, kw_table = job
+    stem_lists = _STEMS.pop(index)
+    summarizer = get_summarizer(*_IDIOM)
+
+    return [
+        summarizer.score_tlds(stems, title_kw_stems, kw_table)
+        for stems in stem_lists]
+
+
+def split_shards(
+        items: typing.Sequence,
+        shard_size: int) -> typing.List[typing.Sequence]:
+    """Split `items` into consecutive shards
+
+    Runs in the calling process: `score_sharded` splits the whole body
+    into sentences here, serially, before any shard is stemmed.
+
+    Arguments:
+        items {typing.Sequence} -- items
+        shard_size {int} -- items per shard
+
+    Returns:
+        typing.List[typing.Sequence] -- shards of `items`
+    """
+    return [
+        items[start:start + shard_size]
+        for start in range(0, len(items), shard_size)]
+
+
+def score_sharded(  # pylint: disable=too-many-arguments,too-many-locals
+        body: str,
+        title: str,
+        root: str = BUILTIN,
+        idiom: str = DEFAULT_IDIOM,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        max_workers: OptionalInt = None) -> typing.List[ScoredSentence]:
+    """List and score all sentences in `body` with a pool of processes
+
+    Sentences are stemmed and counted shard by shard, the counts are
+    merged into the top keywords of the whole body, then each shard is
+    scored against them. Same result as `Summarizer.get_all_sentences`.
+
+    Each worker keeps the stems of its shards between the two passes,
+    so only sentences go out, and only counts and scores come back.
+    Splitting the body into sentences is serial, in this process (as is
+    counting keywords of a body whose sentences are not contiguous).
+
+    Arguments:
+        body {str} -- body of content
+        title {str} -- title of content
+
+    Keyword Arguments:
+        root {str} -- root directory of idiom data (default: {BUILTIN})
+        idiom {str} -- basename of idiom file (default: {DEFAULT_IDIOM})
+        shard_size {int} -- sentences per shard
+            (default: {DEFAULT_SHARD_SIZE})
+        max_workers {OptionalInt} -- worker processes, None for one
+            per CPU (default: {None})
+
+    Raises:
+        ValueError -- invalid shard size
+
+    Returns:
+        typing.List[ScoredSentence] -- list of scored sentences
+    """
+    if shard_size < 1:
+        raise ValueError('invalid shard size: {!r}'.format(shard_size))
+
+    summarizer = get_summarizer(root, idiom)
+    parser = summarizer.parser
+    normalized = normalize_space(body)
+    sentences = parser.split_sentences(normalized)
+
+    if len(sentences) <= shard_size:
+        return summarizer.get_all_sentences(body, title)
+
+    title_kw_stems = parser.get_key_stems(title)
+    shards = split_shards(sentences, shard_size)
+    num_workers = min(max_workers or os.cpu_count() or 1, len(shards))
+
+    # one process per executor, so each shard is scored where it was stemmed
+    executors = [
+        get_process_pool(1, init_worker, (root, idiom))
+        for _ in range(num_workers)]
+
+    def submit(index: int, func: typing.Callable, job: tuple):
+        return executors[index % num_workers].submit(func, job)
+
+    try:
+        counted = [
+            submit(index, stem_shard, (index, shard))
+            for index, shard in enumerate(shards)]
+        counts = Counter()  # type: typing.Counter[str]
+
+        for future in counted:
+            counts.update(future.result())
+
+        if not is_contiguous(sentences, normalized):
+            counts = parser.count_keywords(body)
+
+        kw_table = tabulate_counts(counts)
+        scored = [
+            submit(index, score_shard, (index, title_kw_stems, kw_table))
+            for index in range(len(shards))]
+        tlds_scores = [
+            tlds
+            for future in scored
+            for tlds in future.result()]
+
+    finally:
+        for executor in executors:
+            executor.shutdown()
+
+    of = len(sentences)  # pylint: disable=invalid-name
+
+    return [
+        ScoredSentence(text, idx, of, tlds_scores[idx])
+        for idx, text in enumerate(sentences)]
@@ -1,10 +1,23 @@
 """Text summarizer"""
 import typing
-
-from ..constants import BUILTIN, DEFAULT_IDIOM, TOP_KEYWORD_MIN_RANK
+from collections import Counter
+from heapq import nlargest
+from operator import attrgetter
+
+from ..constants import (
+    BACKEND_NUMPY, BACKEND_PYTHON, BUILTIN, DEFAULT_BACKEND, DEFAULT_IDIOM,
+    TOP_KEYWORD_MIN_RANK)
+from ..instrument.instrument import KEYWORDS, SCORE, SORT, stage
 from ..parser import Parser, ScoredKeyword
+from ..parser.analysis import Analysis
+from ..parser.parser import KeywordCounts
 from ..typings import StringList
+from .scored_batch import ScoredBatch, TldsScores
 from .scored_sentence import ScoredSentence
+from .vectorized import ScoreArrays, has_numpy, score_arrays
+
+KeywordList = typing.List[ScoredKeyword]
+KeywordTable = typing.Dict[str, float]
 
 
 def pluck_keyword_words(
@@ -44,13 +57,51 @@ def get_top_keyword_threshold(kws: typing.Sequence[ScoredKeyword]) -> float:
     if not kws:
         return 0
 
-    limit = TOP_KEYWORD_MIN_RANK
-    minimum = sorted(
-        kws, reverse=True)[:limit].pop()  # type: ScoredKeyword
+    top_kws = nlargest(
+        TOP_KEYWORD_MIN_RANK, kws, key=attrgetter('sort_key'))
+    minimum = top_kws[-1]  # type: ScoredKeyword
 
     return minimum.score
 
 
+def filter_top_keywords(keywords: KeywordList) -> KeywordList:
+    """List 1st-10th ranked `keywords`
+
+    Arguments:
+        keywords {KeywordList} -- scored keywords
+
+    Returns:
+        KeywordList -- most frequent keywords
+    """
+    minimum = get_top_keyword_threshold(keywords)
+
+    return [kw for kw in keywords if kw.score >= minimum]
+
+
+def filter_top_counts(counts: KeywordCounts) -> KeywordList:
+    """List 1st-10th ranked keywords in stem `counts`
+
+    Equivalent to `filter_top_keywords(score_keyword_counts(counts))`,
+    but only the top keywords are scored.
+
+    Arguments:
+        counts {KeywordCounts} -- occurrences of each meaningful stem
+
+    Returns:
+        KeywordList -- most frequent keywords
+    """
+    if not counts:
+        return []
+
+    total = sum(counts.values())
+    minimum = nlargest(TOP_KEYWORD_MIN_RANK, counts.values())[-1]
+
+    return [
+        ScoredKeyword(word, count, total)
+        for word, count in counts.items()
+        if count >= minimum]
+
+
 def score_by_title(
         title_kw_stems: StringList,
         sentence_stems: StringList) -> float:
@@ -77,50 +128,124 @@ def score_by_title(
     return score
 
 
-def score_by_dbs(
-        sentence_words: StringList,
+def tabulate_keywords(
         top_kws: typing.Sequence[ScoredKeyword],
-        top_kw_words: StringList) -> float:
+        top_kw_words: StringList) -> KeywordTable:
+    """Map each of `top_kw_words` to the score of its keyword
+
+    Build once per document; lookups replace `list.index` scans.
+    For repeated words, the first keyword wins (as with `list.index`).
+
+    Arguments:
+        top_kws {typing.Sequence[ScoredKeyword]} -- top keywords in body
+        top_kw_words {StringList} -- values of 'word' in top_keywords
+
+    Returns:
+        KeywordTable -- score by stem
+    """
+    table = {}  # type: KeywordTable
+
+    for word, keyword in zip(top_kw_words, top_kws):
+        table.setdefault(word, keyword.score)
+
+    return table
+
+
+def tabulate_counts(counts: KeywordCounts) -> KeywordTable:
+    """Get score of top keywords by stem from stem `counts`
+
+    Arguments:
+        counts {KeywordCounts} -- occurrences of each meaningful stem
+
+    Returns:
+        KeywordTable -- score by stem
+    """
+    top_kws = filter_top_counts(counts)
+
+    return tabulate_keywords(top_kws, pluck_keyword_words(top_kws))
+
+
+def score_dbs(sentence_words: StringList, kw_table: KeywordTable) -> float:
     """Score sentence (`sentence_word_list`) by keyword density
 
     Arguments:
         sentence_words {StringList} --
             sequential list of words in sentence
-        top_kws {typing.List[dict]} --
-            top keywords in content body
-        top_kw_words {StringList} --
-            values of 'word' in top_keywords
+        kw_table {KeywordTable} -- score of top keywords by stem
 
     Returns:
         float  -- density based score
     """
-    k = len(list(set(sentence_words) & set(top_kw_words))) + 1
+    k = len(kw_table.keys() & set(sentence_words)) + 1
     summ = 0.0
-    first_word = {}   # type: typing.Dict[str, float]
-    second_word = {}  # type: typing.Dict[str, float]
+    prev_i = -1
+    prev_score = 0.0
 
     for i, word in enumerate(sentence_words):
-        if word in top_kw_words:
-            index = top_kw_words.index(word)
+        score = kw_table.get(word)
 
-            if first_word == {}:
-                first_word = {
-                    'i': i,
-                    'score': top_kws[index].score}
-            else:
-                second_word = first_word
-                first_word = {
-                    'i': i,
-                    'score': top_kws[index].score}
-                distance = first_word['i'] - second_word['i']
+        if score is None:
+            continue
+
+        if prev_i > -1:
+            distance = i - prev_i
+            summ += (score * prev_score) / (distance ** 2)
 
-                summ += (first_word['score'] * second_word['score']) / (distance ** 2)  # noqa
+        prev_i = i
+        prev_score = score
 
     dbs = (1.0 / k * (k + 1.0)) * summ
 
     return dbs
 
 
+def score_sbs(sentence_words: StringList, kw_table: KeywordTable) -> float:
+    """Score sentence (`words`) by summation
+
+    Arguments:
+        sentence_words {StringList} --
+            sequential list of words in sentence
+        kw_table {KeywordTable} -- score of top keywords by stem
+
+    Returns:
+        float -- score
+    """
+    summ = 0.0
+
+    if len(sentence_words) == summ:
+        return summ
+
+    for word in sentence_words:
+        score = kw_table.get(word)
+
+        if score is not None:
+            summ += score
+
+    sbs = 1.0 / len(sentence_words) * summ
+
+    return sbs
+
+
+def score_by_dbs(
+        sentence_words: StringList,
+        top_kws: typing.Sequence[ScoredKeyword],
+        top_kw_words: StringList) -> float:
+    """Score sentence (`sentence_word_list`) by keyword density
+
+    Arguments:
+        sentence_words {StringList} --
+            sequential list of words in sentence
+        top_kws {typing.List[dict]} --
+            top keywords in content body
+        top_kw_words {StringList} --
+            values of 'word' in top_keywords
+
+    Returns:
+        float  -- density based score
+    """
+    return score_dbs(sentence_words, tabulate_keywords(top_kws, top_kw_words))
+
+
 def score_by_sbs(
         sentence_words: StringList,
         top_kws: typing.Sequence[ScoredKeyword],
@@ -136,20 +261,28 @@ def score_by_sbs(
     Returns:
         float -- score
     """
-    summ = 0.0
+    return score_sbs(sentence_words, tabulate_keywords(top_kws, top_kw_words))
 
-    if len(sentence_words) == summ:
-        return summ
 
-    for word in [x for x in sentence_words if x in top_kw_words]:
-        index = top_kw_words.index(word)
-        score = top_kws[index].score
+def get_backend(backend: str) -> str:
+    """Get available scoring backend, preferring `backend`
 
-        summ += score
+    Arguments:
+        backend {str} -- BACKEND_PYTHON or BACKEND_NUMPY
 
-    sbs = 1.0 / len(sentence_words) * summ
+    Raises:
+        ValueError -- unknown backend
 
-    return sbs
+    Returns:
+        str -- `backend` if available, else BACKEND_PYTHON
+    """
+    if backend not in (BACKEND_PYTHON, BACKEND_NUMPY):
+        raise ValueError('unknown scoring backend: {!r}'.format(backend))
+
+    if backend == BACKEND_NUMPY and not has_numpy():
+        return BACKEND_PYTHON
+
+    return backend
 
 
 class Summarizer:
@@ -157,8 +290,20 @@ class Summarizer:
     def __init__(
             self,
             root: str = BUILTIN,
-            idiom: str = DEFAULT_IDIOM) -> None:
+            idiom: str = DEFAULT_IDIOM,
+            backend: str = DEFAULT_BACKEND) -> None:
+        """Initialize parser for `root`/`idiom`.json
+
+        Keyword Arguments:
+            root {str} -- root directory of idiom data
+                (default: {BUILTIN})
+            idiom {str} -- basename of idiom file
+                (default: {DEFAULT_IDIOM})
+            backend {str} -- scoring backend, NumPy falls back to Python
+                if not installed (default: {DEFAULT_BACKEND})
+        """
         self.parser = Parser(root, idiom)
+        self.backend = get_backend(backend)
 
     def get_all_sentences(
             self, body: str, title: str) -> typing.List[ScoredSentence]:
@@ -171,20 +316,147 @@ class Summarizer:
         Returns:
             list[ScoredSentence] -- list of scored sentences
         """
-        sentences = self.parser.split_sentences(body)
-        title_kw_stems = self.parser.get_key_stems(title)
-        top_kws = self.get_top_keywords(body)
-        top_kw_stems = pluck_keyword_words(top_kws)
+        analysis, title_kw_stems, kw_table = self._analyze(body, title)
+        sentences = analysis.sentences
         of = len(sentences)  # pylint: disable=invalid-name
 
-        scored_sentences = [
-            self.get_sentence(
-                text, idx, of,
-                title_kw_stems, top_kws, top_kw_stems)
-            for idx, text in enumerate(sentences)]
+        with stage(SCORE) as timed:
+            timed.items = of
+
+            if self.backend == BACKEND_NUMPY:
+                arrays = self.get_score_arrays(
+                    analysis.stems, title_kw_stems, kw_table)
+
+                return [
+                    ScoredSentence(text, idx, of, arrays.get_tlds(idx))
+                    for idx, text in enumerate(sentences)]
+
+            scored_sentences = [
+                self.score_stems(
+                    text, analysis.stems[idx], idx, of,
+                    title_kw_stems, kw_table)
+                for idx, text in enumerate(sentences)]
 
         return scored_sentences
 
+    def get_batch(self, body: str, title: str) -> ScoredBatch:
+        """Score all sentences in `text` into a compact batch
+
+        Arguments:
+            body {str} -- body of content
+            title {str} -- title of content
+
+        Returns:
+            ScoredBatch -- scores of every sentence
+        """
+        analysis, title_kw_stems, kw_table = self._analyze(body, title)
+
+        with stage(SCORE) as timed:
+            timed.items = len(analysis.sentences)
+
+            if self.backend == BACKEND_NUMPY:
+                arrays = self.get_score_arrays(
+                    analysis.stems, title_kw_stems, kw_table)
+                tlds_scores = map(arrays.get_tlds, range(len(arrays)))
+
+            else:
+                tlds_scores = (
+                    self.score_tlds(stems, title_kw_stems, kw_table)
+                    for stems in analysis.stems)
+
+            return ScoredBatch(
+                analysis.body, analysis.sentences, tlds_scores)
+
+    def rank_sentences(
+            self, body: str, title: str) -> typing.List[ScoredSentence]:
+        """List and score all sentences in `text`, best first
+
+        Arguments:
+            body {str} -- body of content
+            title {str} -- title of content
+
+        Returns:
+            list[ScoredSentence] -- scored sentences, best first
+        """
+        if self.backend != BACKEND_NUMPY:
+            sentences = self.get_all_sentences(body, title)
+
+            with stage(SORT) as timed:
+                timed.items = len(sentences)
+
+                return sorted(
+                    sentences, key=attrgetter('sort_key'), reverse=True)
+
+        analysis, title_kw_stems, kw_table = self._analyze(body, title)
+        texts = analysis.sentences
+        of = len(texts)  # pylint: disable=invalid-name
+
+        with stage(SCORE) as timed:
+            timed.items = of
+            arrays = self.get_score_arrays(
+                analysis.stems, title_kw_stems, kw_table)
+
+        with stage(SORT) as timed:
+            timed.items = of
+            ranking = arrays.get_ranking()
+
+        return [
+            ScoredSentence(texts[idx], idx, of, arrays.get_tlds(idx))
+            for idx in ranking]
+
+    def _analyze(
+            self,
+            body: str,
+            title: str) -> typing.Tuple[Analysis, StringList, KeywordTable]:
+        """Analyze `body` and `title` for scoring
+
+        Arguments:
+            body {str} -- body of content
+            title {str} -- title of content
+
+        Returns:
+            typing.Tuple[Analysis, StringList, KeywordTable] --
+                analysis of body, key stems of title, top keyword table
+        """
+        analysis = self.parser.analyze(body)
+        title_kw_stems = self.parser.get_key_stems(title)
+        kw_table = self.get_keyword_table(analysis.key_stems)
+
+        return analysis, title_kw_stems, kw_table
+
+    def get_keyword_table(self, key_stems: StringList) -> KeywordTable:
+        """Get score of top keywords by stem from every meaningful stem
+
+        Arguments:
+            key_stems {StringList} -- meaningful stems in body
+
+        Returns:
+            KeywordTable -- score by stem
+        """
+        with stage(KEYWORDS) as timed:
+            timed.items = len(key_stems)
+
+            return tabulate_counts(Counter(key_stems))
+
+    def get_score_arrays(
+            self,
+            stem_lists: typing.List[StringList],
+            title_kw_stems: StringList,
+            kw_table: KeywordTable) -> ScoreArrays:
+        """Score every sentence at once with NumPy
+
+        Arguments:
+            stem_lists {typing.List[StringList]} -- all stems of each sentence
+            title_kw_stems {StringList} -- stemmed key words in title
+            kw_table {KeywordTable} -- score of top keywords by stem
+
+        Returns:
+            ScoreArrays -- scores of every sentence
+        """
+        return score_arrays(
+            stem_lists, title_kw_stems, kw_table,
+            self.parser.ideal_sentence_length)
+
     def get_top_keywords(self, body: str) -> typing.List[ScoredKeyword]:
         """List 1st-10th ranked keywords in `text`
 
@@ -194,11 +466,9 @@ class Summarizer:
         Returns:
             list[ScoredKeyword] -- most frequent keywords
         """
-        keywords = self.parser.get_keywords(body)
-        minimum = get_top_keyword_threshold(keywords)
-        top_kws = [kw for kw in keywords if kw.score >= minimum]
+        counts = self.parser.count_keywords(body)
 
-        return top_kws
+        return filter_top_counts(counts)
 
     def get_sentence(  # pylint: disable=too-many-arguments,invalid-name
             self,
@@ -222,22 +492,62 @@ class Summarizer:
             ScoredSentence -- scored sentence
         """
         sentence_stems = self.parser.get_all_stems(text)
+        kw_table = tabulate_keywords(top_kws, top_kw_stems)
 
-        title_score = score_by_title(title_kw_stems, sentence_stems)
-        length_score = self.score_by_length(sentence_stems)
-        dbs_score = score_by_dbs(
-            sentence_stems, top_kws, top_kw_stems)
-        sbs_score = score_by_sbs(
-            sentence_stems, top_kws, top_kw_stems)
+        return self.score_stems(
+            text, sentence_stems, index, of, title_kw_stems, kw_table)
 
+    def score_stems(  # pylint: disable=too-many-arguments,invalid-name
+            self,
+            text: str,
+            sentence_stems: StringList,
+            index: int,
+            of: int,
+            title_kw_stems: StringList,
+            kw_table: KeywordTable) -> ScoredSentence:
+        """Score sentence (`text`) already split into `sentence_stems`
+
+        Arguments:
+            text {str} -- text of sentence
+            sentence_stems {StringList} -- all stems in sentence
+            index {int} -- index of sentence in overall text (zero based)
+            of {int} -- len() of sentences in `text`
+            title_kw_stems {StringList} -- stemmed key words in title
+            kw_table {KeywordTable} -- score of top keywords by stem
+
+        Returns:
+            ScoredSentence -- scored sentence
+        """
         scored = ScoredSentence(
             text,
             index,
             of,
-            (title_score, length_score, dbs_score, sbs_score))
+            self.score_tlds(sentence_stems, title_kw_stems, kw_table))
 
         return scored
 
+    def score_tlds(
+            self,
+            sentence_stems: StringList,
+            title_kw_stems: StringList,
+            kw_table: KeywordTable) -> TldsScores:
+        """Get title, length, DBS and SBS scores of `sentence_stems`
+
+        Arguments:
+            sentence_stems {StringList} -- all stems in sentence
+            title_kw_stems {StringList} -- stemmed key words in title
+            kw_table {KeywordTable} -- score of top keywords by stem
+
+        Returns:
+            TldsScores -- feature scores
+        """
+        title_score = score_by_title(title_kw_stems, sentence_stems)
+        length_score = self.score_by_length(sentence_stems)
+        dbs_score = score_dbs(sentence_stems, kw_table)
+        sbs_score = score_sbs(sentence_stems, kw_table)
+
+        return title_score, length_score, dbs_score, sbs_score
+
     def score_by_length(self, sentence_words: StringList) -> float:
         """Score sentence by its count of `sentence_word_list` vs. ideal
 
@@ -0,0 +1,293 @@
+"""Vectorized sentence scoring (optional, requires NumPy)
+
+Every operation mirrors the pure-Python scorers in the same order,
+so results match them exactly, not approximately. NumPy is imported
+by each function (via `load_numpy`), on first use.
+"""
+import typing
+from importlib import import_module
+
+from ..constants import COMPOSITE_TOLERANCE, SENTENCE_SCORE_K
+from ..typings import StringList
+from .sentence_score import POSITION_SCORES
+
+numpy = None  # pylint: disable=invalid-name
+
+StemLists = typing.List[StringList]
+Vocabulary = typing.Dict[str, int]
+
+
+def has_numpy() -> bool:
+    """Report availability of NumPy
+
+    Returns:
+        bool -- NumPy is installed and importable
+    """
+    try:
+        load_numpy()
+
+    except ImportError:
+        return False
+
+    return True
+
+
+def load_numpy() -> typing.Any:
+    """Import NumPy for the scoring functions
+
+    Returns:
+        module -- numpy
+    """
+    global numpy  # pylint: disable=global-statement,invalid-name
+
+    if numpy is None:
+        numpy = import_module('numpy')
+
+    return numpy
+
+
+def encode_stems(
+        stem_lists: StemLists,
+        vocab: Vocabulary) -> typing.Tuple[typing.Any, typing.Any]:
+    """Encode stems of every sentence as integer IDs in one flat array
+
+    Arguments:
+        stem_lists {StemLists} -- all stems of each sentence
+        vocab {Vocabulary} -- ID by stem (new stems are added)
+
+    Returns:
+        typing.Tuple[numpy.ndarray, numpy.ndarray] --
+            stem IDs, number of stems in each sentence
+    """
+    load_numpy()
+
+    ids = [
+        vocab.setdefault(stem, len(vocab))
+        for stems in stem_lists
+        for stem in stems]
+    lengths = [len(stems) for stems in stem_lists]
+
+    return numpy.array(ids, dtype=numpy.int64), numpy.array(
+        lengths, dtype=numpy.int64)
+
+
+def lookup_table(
+        vocab: Vocabulary,
+        words: typing.Iterable[str],
+        values: typing.Iterable[float]) -> typing.Any:
+    """Get value of each vocabulary ID (0.0 if absent)
+
+    Arguments:
+        vocab {Vocabulary} -- ID by stem
+        words {typing.Iterable[str]} -- stems
+        values {typing.Iterable[float]} -- value of each stem
+
+    Returns:
+        numpy.ndarray -- value by ID
+    """
+    load_numpy()
+
+    table = numpy.zeros(len(vocab), dtype=numpy.float64)
+
+    for word, value in zip(words, values):
+        if word in vocab:
+            table[vocab[word]] = value
+
+    return table
+
+
+def calc_dbs(
+        ids: typing.Any,
+        sent_idx: typing.Any,
+        token_pos: typing.Any,
+        kw_scores: typing.Any,
+        num_sentences: int) -> typing.Any:
+    """Score each sentence by keyword density (see `score_dbs`)
+
+    Arguments:
+        ids {numpy.ndarray} -- stem IDs of every token
+        sent_idx {numpy.ndarray} -- sentence index of every token
+        token_pos {numpy.ndarray} -- position of every token in sentence
+        kw_scores {numpy.ndarray} -- keyword score by ID (0.0 if none)
+        num_sentences {int} -- number of sentences
+
+    Returns:
+        numpy.ndarray -- density based scores
+    """
+    load_numpy()
+
+    is_kw = kw_scores[ids] > 0.0
+    kw_ids = ids[is_kw]
+    kw_sent = sent_idx[is_kw]
+    kw_pos = token_pos[is_kw]
+    kw_score = kw_scores[kw_ids]
+
+    # pairs of consecutive keywords in the same sentence
+    paired = kw_sent[1:] == kw_sent[:-1]
+    distance = (kw_pos[1:] - kw_pos[:-1])[paired]
+    pair_score = (kw_score[1:] * kw_score[:-1])[paired] / (distance ** 2)
+    summ = numpy.bincount(
+        kw_sent[1:][paired], weights=pair_score, minlength=num_sentences)
+
+    # distinct keywords in each sentence
+    span = len(kw_scores)
+    unique_sent = numpy.unique(kw_sent * span + kw_ids) // span
+    k = numpy.bincount(unique_sent, minlength=num_sentences) + 1.0
+
+    return (1.0 / k * (k + 1.0)) * summ
+
+
+def calc_sbs(
+        ids: typing.Any,
+        sent_idx: typing.Any,
+        lengths: typing.Any,
+        kw_scores: typing.Any,
+        num_sentences: int) -> typing.Any:
+    """Score each sentence by summation (see `score_sbs`)
+
+    Arguments:
+        ids {numpy.ndarray} -- stem IDs of every token
+        sent_idx {numpy.ndarray} -- sentence index of every token
+        lengths {numpy.ndarray} -- number of stems in each sentence
+        kw_scores {numpy.ndarray} -- keyword score by ID (0.0 if none)
+        num_sentences {int} -- number of sentences
+
+    Returns:
+        numpy.ndarray -- summation scores
+    """
+    load_numpy()
+
+    summ = numpy.bincount(
+        sent_idx, weights=kw_scores[ids], minlength=num_sentences)
+    safe_len = numpy.maximum(lengths, 1)
+
+    return numpy.where(lengths > 0, 1.0 / safe_len * summ, 0.0)
+
+
+def calc_position(num_sentences: int) -> typing.Any:
+    """Score each sentence by position (see `score_position`)
+
+    Arguments:
+        num_sentences {int} -- number of sentences
+
+    Returns:
+        numpy.ndarray -- position scores
+    """
+    load_numpy()
+
+    num_ranks = len(POSITION_SCORES)
+    index = numpy.arange(num_sentences, dtype=numpy.float64)
+    rank = numpy.ceil((index + 1) / float(num_sentences) * num_ranks)
+
+    return numpy.array(POSITION_SCORES)[rank.astype(numpy.int64) - 1]
+
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
+class ScoreArrays:
+    """Feature, position, and composite scores of all sentences"""
+    def __init__(
+            self,
+            title: typing.Any,
+            length: typing.Any,
+            dbs: typing.Any,
+            sbs: typing.Any,
+            position: typing.Any) -> None:
+        """Calculate composite scores from feature scores
+
+        Arguments:
+            title {numpy.ndarray} -- title scores
+            length {numpy.ndarray} -- length scores
+            dbs {numpy.ndarray} -- density based scores
+            sbs {numpy.ndarray} -- summation based scores
+            position {numpy.ndarray} -- position scores
+        """
+        load_numpy()
+
+        self.title = title
+        self.length = length
+        self.dbs = dbs
+        self.sbs = sbs
+        self.position = position
+        self.keyword = SENTENCE_SCORE_K * (sbs + dbs)
+
+        total = (
+            title * 1.5 +
+            self.keyword * 2.0 +
+            length * 0.5 +
+            position * 1.0) / 4.0
+        self.total = numpy.rint(
+            total / COMPOSITE_TOLERANCE) * COMPOSITE_TOLERANCE
+
+    def __len__(self) -> int:
+        return len(self.total)
+
+    def get_tlds(self, index: int) -> typing.Tuple[float, float, float, float]:
+        """Get title, length, DBS and SBS scores of sentence `index`
+
+        Arguments:
+            index {int} -- index of sentence
+
+        Returns:
+            typing.Tuple[float, float, float, float] -- feature scores
+        """
+        return (
+            float(self.title[index]),
+            float(self.length[index]),
+            float(self.dbs[index]),
+            float(self.sbs[index]))
+
+    def get_ranking(self) -> typing.List[int]:
+        """List sentence indexes from best to worst
+
+        Ties keep content order, as with `sorted(..., reverse=True)`.
+
+        Returns:
+            typing.List[int] -- indexes, best first
+        """
+        return numpy.argsort(-self.total, kind='stable').tolist()
+
+
+def score_arrays(
+        stem_lists: StemLists,
+        title_kw_stems: StringList,
+        kw_table: typing.Dict[str, float],
+        ideal: int) -> ScoreArrays:
+    """Score every sentence at once
+
+    Arguments:
+        stem_lists {StemLists} -- all stems of each sentence
+        title_kw_stems {StringList} -- stemmed key words in title
+        kw_table {typing.Dict[str, float]} -- score of top keywords by stem
+        ideal {int} -- ideal sentence length
+
+    Returns:
+        ScoreArrays -- scores of every sentence
+    """
+    load_numpy()
+
+    num_sentences = len(stem_lists)
+    vocab = {}  # type: Vocabulary
+    ids, lengths = encode_stems(stem_lists, vocab)
+    sent_idx = numpy.repeat(numpy.arange(num_sentences), lengths)
+    starts = numpy.cumsum(lengths) - lengths
+    token_pos = numpy.arange(len(ids)) - numpy.repeat(starts, lengths)
+
+    if title_kw_stems:
+        title_ids = lookup_table(
+            vocab, title_kw_stems, [1.0] * len(title_kw_stems))
+        matched = numpy.bincount(
+            sent_idx, weights=title_ids[ids], minlength=num_sentences)
+        title = matched / float(len(title_kw_stems))
+
+    else:
+        title = numpy.zeros(num_sentences, dtype=numpy.float64)
+
+    ideal_f = float(ideal)
+    length = (ideal_f - numpy.abs(ideal_f - lengths)) / ideal_f
+
+    kw_scores = lookup_table(vocab, kw_table.keys(), kw_table.values())
+    dbs = calc_dbs(ids, sent_idx, token_pos, kw_scores, num_sentences)
+    sbs = calc_sbs(ids, sent_idx, lengths, kw_scores, num_sentences)
+    position = calc_position(num_sentences)
+
+    return ScoreArrays(title, length, dbs, sbs, position)
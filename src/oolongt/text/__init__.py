@@ -1,2 +1,3 @@
 """Initialize summarizer subpackage"""
+from .incremental import IncrementalSummarizer  # noqa
 from .text import score_body_sentences, summarize  # noqa
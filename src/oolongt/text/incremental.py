@@ -0,0 +1,345 @@
+"""Incremental summarization of growing content"""
+import typing
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
+
+from ..constants import BUILTIN, DEFAULT_IDIOM, DEFAULT_LENGTH
+from ..parser.analysis import locate_sentences
+from ..parser.parser import normalize_space
+from ..parser.stream import find_unsettled, find_word_cut
+from ..summarizer import ScoredSentence, get_summarizer
+from ..summarizer.sentence_score import (
+    POSITION_SCORES, SentenceScore, calc_rank)
+from ..summarizer.summarizer import (
+    KeywordTable, score_by_title, score_dbs, score_sbs, tabulate_counts)
+from ..typings import StringList
+from .text import ScoredSentenceList, get_slice_length
+
+ScorePair = typing.Tuple[float, float]
+RankKey = typing.Tuple[int, int]
+
+
+def get_rank_starts(total: int) -> typing.List[int]:
+    """Get index of first sentence in each position rank
+
+    Arguments:
+        total {int} -- number of sentences
+
+    Returns:
+        typing.List[int] -- first index of ranks 1 to 10
+    """
+    num_ranks = len(POSITION_SCORES)
+    starts = []  # type: typing.List[int]
+
+    for rank in range(1, num_ranks + 1):
+        low, high = 0, total
+
+        while low < high:
+            mid = (low + high) // 2
+
+            if calc_rank(mid, total, num_ranks) < rank:
+                low = mid + 1
+
+            else:
+                high = mid
+
+        starts.append(low)
+
+    return starts
+
+
+def get_moved(old_of: int, new_of: int) -> typing.Set[int]:
+    """List sentences whose position rank differs between two lengths
+
+    Arguments:
+        old_of {int} -- earlier number of sentences
+        new_of {int} -- current number of sentences
+
+    Returns:
+        typing.Set[int] -- indexes below both lengths that changed rank
+    """
+    moved = set()  # type: typing.Set[int]
+
+    if min(old_of, new_of) < 1 or old_of == new_of:
+        return moved
+
+    for old, new in zip(get_rank_starts(old_of), get_rank_starts(new_of)):
+        moved.update(range(min(old, new), min(max(old, new), old_of, new_of)))
+
+    return moved
+
+
+# pylint: disable=too-many-instance-attributes
+class IncrementalSummarizer:
+    """Summarize content that grows by appending text
+
+    `summary()` matches `summarize()` of all appended text exactly.
+    Only the last sentences are split again on append; sentences keep
+    their stems, title and length scores, and are rescored by keyword
+    only when the score of one of their keywords changes (or by position
+    when their rank moves). Keywords are counted as text arrives, so no
+    update reads the whole body again. Keyword scores are relative to
+    the total count, though, so most appends still rescore sentences
+    that contain top keywords.
+    """
+    def __init__(
+            self,
+            title: str = '',
+            root: str = BUILTIN,
+            idiom: str = DEFAULT_IDIOM) -> None:
+        """Initialize empty content
+
+        Keyword Arguments:
+            title {str} -- title of content (default: {''})
+            root {str} -- root directory of idiom config
+                (default: {BUILTIN})
+            idiom {str} -- basename of idiom config
+                (default: {DEFAULT_IDIOM})
+        """
+        self.summarizer = get_summarizer(root, idiom)
+        self.parser = self.summarizer.parser
+        self.title_kw_stems = self.parser.get_key_stems(title)
+
+        self._chunks = []  # type: StringList
+        self._counted = 0  # chunks in `_body_counts`
+        self._carry = ''  # last word of counted chunks
+        self._body_counts = Counter()  # type: typing.Counter[str]
+        self._tail = ''
+        self._lead = False
+        self._settled = 0
+        self._settled_len = 0
+        self._settled_sum = 0
+        self._tail_sum = 0
+        self._unscored = 0
+
+        self._texts = []  # type: StringList
+        self._stems = []  # type: typing.List[StringList]
+        self._key_stems = []  # type: typing.List[StringList]
+        self._title_length = []  # type: typing.List[ScorePair]
+        self._dbs_sbs = []  # type: typing.List[typing.Optional[ScorePair]]
+        self._keys = []  # type: typing.List[int]
+        self._scored_of = 0
+
+        self._counts = Counter()  # type: typing.Counter[str]
+        self._sentences_by_stem = {}  # type: typing.Dict[str, set]
+        self._kw_table = {}  # type: KeywordTable
+
+    @property
+    def body(self) -> str:
+        """All appended text
+
+        Returns:
+            str -- body of content
+        """
+        return ''.join(self._chunks)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def append(self, text: str) -> None:
+        """Append `text` to body of content
+
+        Arguments:
+            text {str} -- text to append
+        """
+        normalized = normalize_space(text)
+
+        if not normalized:
+            return
+
+        if not (self._chunks or self._tail):
+            self._lead = normalized.startswith(' ')
+
+        if self._tail.endswith(' ') and normalized.startswith(' '):
+            normalized = normalized[1:]
+
+        self._chunks.append(text)
+        self._drop_tail()
+        self._tail += normalized
+        self._split_tail()
+
+    def _drop_tail(self) -> None:
+        """Forget unsettled sentences"""
+        for key_stems in self._key_stems[self._settled:]:
+            self._counts.subtract(key_stems)
+
+        for stem in {s for ks in self._key_stems[self._settled:] for s in ks}:
+            if self._counts[stem] < 1:
+                del self._counts[stem]
+
+        self._unscored = min(self._unscored, self._settled)
+
+        del self._texts[self._settled:]
+        del self._stems[self._settled:]
+        del self._key_stems[self._settled:]
+        del self._title_length[self._settled:]
+        del self._dbs_sbs[self._settled:]
+        del self._keys[self._unscored:]
+
+    def _split_tail(self) -> None:
+        """Split, stem and count unsettled text, then settle what is safe"""
+        tail = self._tail
+        sentences = self.parser.split_sentences(tail)
+        starts, _ = locate_sentences(tail, sentences)
+
+        for sentence in sentences:
+            stems, key_stems = self.parser.stem_sentences([sentence])
+            self._texts.append(sentence.strip())
+            self._stems.append(stems[0])
+            self._key_stems.append(key_stems)
+            self._title_length.append((
+                score_by_title(self.title_kw_stems, stems[0]),
+                self.summarizer.score_by_length(stems[0])))
+            self._dbs_sbs.append(None)
+            self._counts.update(key_stems)
+
+        unsettled = find_unsettled(tail, starts)
+        lengths = [len(sentence) for sentence in sentences]
+
+        for idx in range(self._settled, self._settled + unsettled):
+            for stem in self._stems[idx]:
+                self._sentences_by_stem.setdefault(stem, set()).add(idx)
+
+        if unsettled:
+            cut = starts[unsettled]
+            self._tail = tail[cut:]
+            self._settled += unsettled
+            self._settled_len += cut
+            self._settled_sum += sum(lengths[:unsettled])
+
+        self._tail_sum = sum(lengths[unsettled:])
+
+    def is_contiguous(self) -> bool:
+        """Verify sentences are separated by single spaces in body
+
+        Same as `is_contiguous` of the whole normalized body.
+
+        Returns:
+            bool -- sentences rejoin into the normalized body
+        """
+        if not (self._settled or self._tail.strip()):
+            stripped_len = 0
+
+        else:
+            stripped_len = (
+                self._settled_len + len(self._tail) -
+                int(self._lead) - int(self._tail.endswith(' ')))
+
+        joined_len = self._settled_sum + self._tail_sum + len(self) - 1
+
+        return max(joined_len, 0) == stripped_len
+
+    def get_keyword_table(self) -> KeywordTable:
+        """Get score of top keywords by stem in body
+
+        Returns:
+            KeywordTable -- score by stem
+        """
+        if self.is_contiguous():
+            return tabulate_counts(self._counts)
+
+        return tabulate_counts(self._count_body())
+
+    def _count_body(self) -> typing.Counter[str]:
+        """Count keywords of body, as `Parser.count_keywords` would
+
+        Only chunks appended since the last count are read; they are
+        counted up to their last whitespace, so no word is split.
+
+        Returns:
+            typing.Counter[str] -- occurrences of each meaningful stem
+        """
+        pending = self._chunks[self._counted:]
+        self._counted = len(self._chunks)
+
+        if pending:
+            text = self._carry + ''.join(pending)
+            cut = find_word_cut(text)
+            self._body_counts.update(self.parser.get_key_stems(text[:cut]))
+            self._carry = text[cut:]
+
+        counts = self._body_counts.copy()
+        counts.update(self.parser.get_key_stems(self._carry))
+
+        return counts
+
+    def _get_stale(self, kw_table: KeywordTable) -> typing.Set[int]:
+        """List sentences without keyword scores for `kw_table`
+
+        Arguments:
+            kw_table {KeywordTable} -- score of top keywords by stem
+
+        Returns:
+            typing.Set[int] -- indexes of sentences to rescore
+        """
+        old_table = self._kw_table
+        stale = set(range(self._unscored, len(self)))
+
+        for stem in kw_table.keys() | old_table.keys():
+            if kw_table.get(stem) != old_table.get(stem):
+                stale.update(self._sentences_by_stem.get(stem, ()))
+
+        return stale
+
+    def _rescore(self) -> None:
+        """Rescore sentences with changed keyword or position scores"""
+        kw_table = self.get_keyword_table()
+        of = len(self)  # pylint: disable=invalid-name
+        stale = self._get_stale(kw_table)
+
+        for idx in stale:
+            stems = self._stems[idx]
+            self._dbs_sbs[idx] = (
+                score_dbs(stems, kw_table), score_sbs(stems, kw_table))
+
+        stale.update(get_moved(self._scored_of, of))
+        self._keys.extend([0] * (of - len(self._keys)))
+
+        for idx in stale:
+            self._keys[idx] = SentenceScore(
+                idx, of,
+                *(self._title_length[idx] + self._dbs_sbs[idx])).sort_key
+
+        self._kw_table = kw_table
+        self._unscored = of
+        self._scored_of = of
+
+    def get_all_sentences(self) -> ScoredSentenceList:
+        """List and score all sentences in body
+
+        Returns:
+            ScoredSentenceList -- scored sentences in content order
+        """
+        self._rescore()
+        of = len(self)  # pylint: disable=invalid-name
+
+        return [
+            ScoredSentence(
+                text, idx, of, self._title_length[idx] + self._dbs_sbs[idx])
+            for idx, text in enumerate(self._texts)]
+
+    def summary(self, limit: float = DEFAULT_LENGTH) -> StringList:
+        """Get `limit` best sentences from body in content order
+
+        Arguments:
+            limit {float} -- sentences to return (int) or
+                fraction of total (float) (default: {DEFAULT_LENGTH})
+
+        Returns:
+            StringList -- top sentences in content order
+        """
+        self._rescore()
+        best = {}  # type: typing.Dict[str, RankKey]
+
+        for idx, text in enumerate(self._texts):
+            rank_key = (self._keys[idx], -idx)
+            kept = best.get(text)
+
+            if (kept is None) or (rank_key > kept):
+                best[text] = rank_key
+
+        slice_len = get_slice_length(limit, len(best))
+        top = nlargest(slice_len, best.items(), key=itemgetter(1))
+
+        return [text for text, _ in sorted(top, key=lambda x: -x[1][1])]
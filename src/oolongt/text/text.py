@@ -1,9 +1,12 @@
 """Simple sentence scoring & summarization functions"""
 import typing
+from heapq import nlargest
+from operator import attrgetter
 
 from .. import BUILTIN, DEFAULT_IDIOM, DEFAULT_LENGTH
-from ..pipe import pipe
-from ..summarizer import ScoredSentence, Summarizer
+from ..cache.result_cache import cache_result
+from ..instrument.instrument import SORT, stage
+from ..summarizer import ScoredSentence, get_summarizer
 from ..typings import StringList
 
 ScoredSentenceList = typing.List[ScoredSentence]
@@ -16,6 +19,8 @@ def score_body_sentences(
         idiom: str = DEFAULT_IDIOM) -> ScoredSentenceList:
     """List and score every sentence in `body`
 
+    Consults the active result cache, if any (see `set_cache`).
+
     Arguments:
         body {str} -- body of content
         title {str} -- title of content
@@ -28,10 +33,10 @@ def score_body_sentences(
         typing.List[ScoredSentence] --
             List of sentences with scoring and metadata
     """
-    summarizer = Summarizer(root, idiom)
-    sentences = summarizer.get_all_sentences(body, title)
+    def compute() -> ScoredSentenceList:
+        return get_summarizer(root, idiom).get_all_sentences(body, title)
 
-    return sentences
+    return cache_result(compute, 'sentences', body, title, root, idiom)
 
 
 def sort_sentences_by_score(
@@ -44,7 +49,7 @@ def sort_sentences_by_score(
     Returns:
         ScoredSentenceList -- sorted list
     """
-    return sorted(sentences, reverse=True)
+    return sorted(sentences, key=attrgetter('sort_key'), reverse=True)
 
 
 def dedupe_sentences(sentences: ScoredSentenceList) -> ScoredSentenceList:
@@ -57,17 +62,61 @@ def dedupe_sentences(sentences: ScoredSentenceList) -> ScoredSentenceList:
     Returns:
         ScoredSentenceList -- de-duplicated sentences
     """
-    texts = []  # type: typing.List[str]
+    texts = set()  # type: typing.Set[str]
     unique = []  # type: ScoredSentenceList
 
     for sent in sentences:
         if sent.text not in texts:
-            texts.append(sent.text)
+            texts.add(sent.text)
             unique.append(sent)
 
     return unique
 
 
+def get_rank_key(sentence: ScoredSentence) -> typing.Tuple[int, int]:
+    """Get key to rank `sentence` by score, then content order
+
+    Arguments:
+        sentence {ScoredSentence} -- scored sentence
+
+    Returns:
+        typing.Tuple[int, int] -- sort key, negative index
+    """
+    return sentence.sort_key, -sentence.index
+
+
+def select_best_sentences(
+        sentences: ScoredSentenceList,
+        limit: float) -> ScoredSentenceList:
+    """Get best unique `sentences` in score order, qty: `limit`
+
+    Same as sorting, deduping and slicing `sentences` (in content order),
+    but only the best copy of each text is kept and only the top `limit`
+    are ordered.
+
+    Arguments:
+        sentences {ScoredSentenceList} -- all scored sentences
+        limit {float} -- # of sentences (see `get_slice_length`)
+
+    Returns:
+        ScoredSentenceList -- best sentences, best first
+    """
+    best = {}  # type: typing.Dict[str, ScoredSentence]
+
+    with stage(SORT) as timed:
+        timed.items = len(sentences)
+
+        for sent in sentences:
+            kept = best.get(sent.text)
+
+            if (kept is None) or (get_rank_key(sent) > get_rank_key(kept)):
+                best[sent.text] = sent
+
+        slice_len = get_slice_length(limit, len(best))
+
+        return nlargest(slice_len, best.values(), key=get_rank_key)
+
+
 def get_slice_length(nominal: float, total: int) -> int:
     """Calculate actual number of sentences to return
 
@@ -114,13 +163,9 @@ def get_best_sentences(
     Returns:
         list[ScoredSentence] -- best sentences from source text
     """
-    sentences = pipe(
-        score_body_sentences(body, title, root, idiom),
-        sort_sentences_by_score,
-        dedupe_sentences)
-    slice_len = get_slice_length(limit, len(sentences))
+    sentences = score_body_sentences(body, title, root, idiom)
 
-    return sentences[:slice_len]
+    return select_best_sentences(sentences, limit)
 
 
 def summarize(
@@ -136,6 +181,8 @@ def summarize(
     else:
         len(return) = min(limit, len(sentences))
 
+    Consults the active result cache, if any (see `set_cache`).
+
     Arguments:
         body {str} -- body of content
         title {str} -- title of content
@@ -151,6 +198,10 @@ def summarize(
     Returns:
         StringList -- top sentences in content order
     """
-    sentences = get_best_sentences(body, title, limit, root, idiom)
+    def compute() -> StringList:
+        sentences = select_best_sentences(
+            get_summarizer(root, idiom).get_all_sentences(body, title), limit)
+
+        return [s.text for s in sorted(sentences, key=lambda x: x.index)]
 
-    return [s.text for s in sorted(sentences, key=lambda x: x.index)]
+    return cache_result(compute, 'summary', body, title, root, idiom, limit)
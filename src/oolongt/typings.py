@@ -4,6 +4,7 @@ import typing
 
 PathOrString = typing.Union[str, pathlib.Path]
 OptionalString = typing.Optional[str]
+OptionalInt = typing.Optional[int]
 StringList = typing.List[str]
 AnyList = typing.List[typing.Any]
 OptionalStringList = typing.Union[OptionalString, StringList]
@@ -1,3 +1,4 @@
 """Initialize ugly_soup subpackage"""
+from .fast_soup import FastSoup  # noqa: F401
 from .ugly_query import UglyQuery  # noqa: F401
 from .ugly_soup import UglySoup  # noqa: F401
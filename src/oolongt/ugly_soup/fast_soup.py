@@ -0,0 +1,190 @@
+"""UglySoup that skips ignored markup and stops once queries settle"""
+import re
+import typing
+from collections import Counter
+
+from bs4.element import Tag
+
+from .ugly_soup import UglySoup
+
+TagTest = typing.Callable[[Tag], bool]
+
+
+def accept_tag(tag: Tag) -> bool:  # pylint: disable=unused-argument
+    """Qualify any tag
+
+    Arguments:
+        tag {Tag} -- BeautifulSoup tag
+
+    Returns:
+        bool -- True
+    """
+    return True
+
+
+class StopParsing(Exception):
+    """Every query is settled; the rest of the markup is irrelevant"""
+
+
+def count_start_tags(html: str, names: typing.Iterable[str]) -> Counter:
+    """Count what could be start tags of each of `names` in `html`
+
+    Overcounts (e.g. tags in comments or scripts), never undercounts.
+
+    Arguments:
+        html {str} -- markup
+        names {typing.Iterable[str]} -- tag names
+
+    Returns:
+        Counter -- count by name
+    """
+    if not names:
+        return Counter()
+
+    pattern = r'<({})(?=[\s/>\x00]|$)'.format(
+        '|'.join(re.escape(name) for name in names))
+
+    return Counter(
+        match.lower() for match in re.findall(pattern, html, re.IGNORECASE))
+
+
+# pylint: disable=abstract-method,too-many-ancestors
+class FastSoup(UglySoup):
+    """Parse only as much as queries need
+
+    Subtrees of `ignore_tags` are dropped while parsing, leaving the same
+    tree as `decompose()`-ing them afterwards. Each query is a sequence of
+    tag names, as in `UglySoup.query`; parsing stops once the first
+    qualifying tag of every query is complete and no earlier tag can
+    appear in the rest of the markup.
+    """
+    def __init__(
+            self,
+            html: str,
+            ignore_tags: typing.Iterable[str] = (),
+            queries: typing.Sequence[typing.Sequence[str]] = (),
+            tests: typing.Optional[typing.Dict[str, TagTest]] = None,
+            **kwargs) -> None:
+        """Parse `html`
+
+        Arguments:
+            html {str} -- markup
+
+        Keyword Arguments:
+            ignore_tags {typing.Iterable[str]} -- tags to drop
+                (default: {()})
+            queries {typing.Sequence[typing.Sequence[str]]} --
+                tag names of each query, in order of preference
+                (default: {()})
+            tests {typing.Optional[typing.Dict[str, TagTest]]} --
+                which tags of a name qualify, by name (default: all)
+        """
+        self._ignore_tags = frozenset(ignore_tags)
+        self._queries = [list(query) for query in queries]
+        self._tests = tests or {}
+        self._watched = {name for query in self._queries for name in query}
+        self._total = count_start_tags(html, self._watched)
+        self._seen = Counter()  # type: typing.Counter[str]
+        self._first = {}  # type: typing.Dict[str, Tag]
+        self._closed = set()  # type: typing.Set[str]
+        self._skipped = []  # type: typing.List[str]
+
+        try:
+            super().__init__(html, **kwargs)
+
+        except StopParsing:
+            self.markup = None
+            self.builder.soup = None
+
+    def is_settled(self) -> bool:
+        """Check whether every query has its answer
+
+        Returns:
+            bool -- parsing may stop
+        """
+        return bool(self._queries) and all(
+            self._is_query_settled(query) for query in self._queries)
+
+    def _is_query_settled(self, query: typing.List[str]) -> bool:
+        for name in query:
+            if name in self._first:
+                return name in self._closed
+
+            if self._seen[name] < self._total[name]:
+                return False
+
+        return True
+
+    def _check(self) -> None:
+        if self.is_settled():
+            raise StopParsing()
+
+    def _skip_start(self, name: str) -> None:
+        """Drop start tag `name`, inside or starting an ignored subtree"""
+        if not self._skipped:
+            self.endData()
+
+        if not self.builder.can_be_empty_element(name):
+            self._skipped.append(name)
+
+    def _skip_end(self, name: str) -> bool:
+        """Drop end tag `name` inside an ignored subtree
+
+        Arguments:
+            name {str} -- tag name
+
+        Returns:
+            bool -- tag was dropped, else it closes an ancestor
+        """
+        if name in self._skipped:
+            del self._skipped[len(self._skipped) - 1 -
+                              self._skipped[::-1].index(name):]
+
+            return True
+
+        if not any(tag.name == name for tag in self.tagStack[1:]):
+            return True
+
+        self._skipped = []
+
+        return False
+
+    def handle_starttag(self, name, *args, **kwargs):
+        if name in self._watched:
+            self._seen[name] += 1
+
+        if self._skipped or (name in self._ignore_tags):
+            self._skip_start(name)
+            self._check()
+
+            return None
+
+        tag = super().handle_starttag(name, *args, **kwargs)
+
+        if (tag is not None) and (name in self._watched) and (
+                name not in self._first) and (
+                    self._tests.get(name, accept_tag)(tag)):
+            self._first[name] = tag
+
+        self._check()
+
+        return tag
+
+    def handle_endtag(self, name, *args, **kwargs):
+        if self._skipped and self._skip_end(name):
+            return
+
+        super().handle_endtag(name, *args, **kwargs)
+        self._check()
+
+    def handle_data(self, data):
+        if not self._skipped:
+            super().handle_data(data)
+
+    def popTag(self):  # pylint: disable=invalid-name
+        tag = self.tagStack[-1] if self.tagStack else None
+
+        if (tag is not None) and (self._first.get(tag.name) is tag):
+            self._closed.add(tag.name)
+
+        return super().popTag()
@@ -0,0 +1,4 @@
+"""initialize subpackage"""
+from .baseline import compare, format_change, load, save  # noqa
+from .cases import get_cases  # noqa
+from .measure import measure  # noqa
@@ -0,0 +1,86 @@
+"""Store and compare benchmark results"""
+import typing
+from collections import OrderedDict
+from pathlib import Path
+
+Regression = typing.Tuple[str, str, float, float]
+
+COMPARED = ('p50', 'peak_kb')
+
+
+def load(path: Path) -> OrderedDict:
+    """Load results from JSON at `path` (empty if missing)
+
+    Arguments:
+        path {Path} -- path to baseline
+
+    Returns:
+        OrderedDict -- measurements by case name
+    """
+    from ..util import json_data
+
+    if not path.exists():
+        return OrderedDict()
+
+    return json_data.read(path)
+
+
+def save(results: OrderedDict, path: Path):
+    """Write `results` as JSON to `path`
+
+    Arguments:
+        results {OrderedDict} -- measurements by case name
+        path {Path} -- path to write
+    """
+    from ..util import json_data
+
+    json_data.write(results, path)
+
+
+def compare(
+        results: OrderedDict,
+        baseline: OrderedDict,
+        margin: float) -> typing.List[Regression]:
+    """List measurements more than `margin` worse than `baseline`
+
+    Only cases and measurements in both are compared.
+
+    Arguments:
+        results {OrderedDict} -- measurements by case name
+        baseline {OrderedDict} -- baseline measurements by case name
+        margin {float} -- allowed increase, e.g. .25 for 25%
+
+    Returns:
+        typing.List[Regression] -- case, measurement, baseline, result
+    """
+    regressions = []  # type: typing.List[Regression]
+
+    for name, result in results.items():
+        expected = baseline.get(name, {})
+
+        for key in COMPARED:
+            if key not in expected:
+                continue
+
+            old, new = expected[key], result[key]
+
+            if new > old * (1 + margin):
+                regressions.append((name, key, old, new))
+
+    return regressions
+
+
+def format_change(old: float, new: float) -> str:
+    """Format relative change from `old` to `new`
+
+    Arguments:
+        old {float} -- baseline measurement
+        new {float} -- result
+
+    Returns:
+        str -- change as percentage, e.g. '+30%'
+    """
+    if not old:
+        return '+inf%' if new else '+0%'
+
+    return '{:+.0%}'.format(new / old - 1)
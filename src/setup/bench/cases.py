@@ -0,0 +1,224 @@
+"""Benchmark cases over sample and synthetic content
+
+The library and test samples are imported when cases are listed, not
+with this module, so setup.py does not load them for other commands.
+"""
+import random
+import subprocess
+import sys
+import typing
+from pathlib import Path
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from src.oolongt.parser import Parser
+    from src.oolongt.summarizer import Summarizer
+    from tests.typings import Sample
+
+Case = typing.Tuple[str, typing.Callable[[], typing.Any], int, str]
+
+KB = 1024
+MB = KB * KB
+SYNTHETIC_SIZES = (KB, 10 * KB, 100 * KB, MB, 10 * MB)
+LARGE_SIZES = (50 * MB, )  # only with `--large`
+SYNTHETIC_SEED = 0
+DOCUMENT_EXTS = ('.docx', '.html', '.pdf', '.txt')
+TEXT_SAMPLES = ('cambodia', 'cameroon', 'canada', 'essay_snark')
+IMPORT_MODULES = ('src.oolongt', 'src.oolongt.cli')
+
+
+def format_size(size: int) -> str:
+    """Format `size` in bytes as KB/MB
+
+    Arguments:
+        size {int} -- size in bytes
+
+    Returns:
+        str -- e.g. '10KB'
+    """
+    if size >= MB:
+        return '{}MB'.format(size // MB)
+
+    return '{}KB'.format(size // KB)
+
+
+def get_samples(text_dir: Path) -> typing.List['Sample']:
+    """List full-length text samples in `text_dir`
+
+    Arguments:
+        text_dir {Path} -- path to sample JSON
+
+    Returns:
+        typing.List[Sample] -- samples
+    """
+    from tests.typings import Sample
+
+    return [Sample(text_dir, name) for name in TEXT_SAMPLES]
+
+
+def synthesize(sentences: typing.List[str], size: int, seed: int) -> str:
+    """Join shuffled `sentences` until the text is `size` bytes or more
+
+    Arguments:
+        sentences {typing.List[str]} -- pool of sentences
+        size {int} -- minimum size in bytes (UTF-8)
+        seed {int} -- random seed
+
+    Returns:
+        str -- text
+    """
+    rand = random.Random(seed)
+    parts = []  # type: typing.List[str]
+    length = -1
+
+    while length < size:
+        sentence = rand.choice(sentences)
+        parts.append(sentence)
+        length += len(sentence.encode('utf-8')) + 1
+
+    return ' '.join(parts)
+
+
+def run_import(module: str, root: Path) -> None:
+    """Import `module` in a fresh interpreter
+
+    Arguments:
+        module {str} -- module name
+        root {Path} -- working directory
+    """
+    subprocess.run(
+        [sys.executable, '-c', 'import ' + module], cwd=str(root), check=True)
+
+
+def get_import_cases(root: Path) -> typing.Iterator[Case]:
+    """List a startup case for each of IMPORT_MODULES
+
+    Arguments:
+        root {Path} -- project root
+
+    Returns:
+        typing.Iterator[Case] -- name, function, items, unit
+    """
+    for module in IMPORT_MODULES:
+        yield (
+            'import/' + module,
+            lambda m=module: run_import(m, root),
+            1, 'imports')
+
+
+def get_sample_cases(
+        samples: typing.List['Sample'],
+        parser: 'Parser',
+        summarizer: 'Summarizer') -> typing.Iterator[Case]:
+    """List keyword, scoring and summary cases of `samples`
+
+    Arguments:
+        samples {typing.List[Sample]} -- text samples
+        parser {Parser} -- parser
+        summarizer {Summarizer} -- summarizer
+
+    Returns:
+        typing.Iterator[Case] -- name, function, items, unit
+    """
+    from src.oolongt.text import summarize
+
+    for samp in samples:
+        body, title = samp.body, samp.title
+        count = len(parser.split_sentences(body))
+
+        yield (
+            'get_keywords/' + samp.name,
+            lambda b=body: parser.get_keywords(b),
+            count, 'sentences')
+        yield (
+            'get_all_sentences/' + samp.name,
+            lambda b=body, t=title: summarizer.get_all_sentences(b, t),
+            count, 'sentences')
+        yield (
+            'summarize/' + samp.name,
+            lambda b=body, t=title: summarize(b, t),
+            count, 'sentences')
+
+
+def get_document_cases(content_dir: Path) -> typing.Iterator[Case]:
+    """List a document case for each supported file in `content_dir`
+
+    Arguments:
+        content_dir {Path} -- path to sample documents
+
+    Returns:
+        typing.Iterator[Case] -- name, function, items, unit
+    """
+    from src.oolongt.files import get_document
+
+    for path in sorted(content_dir.iterdir()):
+        if path.suffix in DOCUMENT_EXTS:
+            yield (
+                'get_document/' + path.name,
+                lambda p=str(path): get_document(p, None),
+                1, 'documents')
+
+
+def get_synthetic_cases(
+        samples: typing.List['Sample'],
+        parser: 'Parser',
+        sizes: typing.Iterable[int]) -> typing.Iterator[Case]:
+    """List summary cases of synthetic text of each of `sizes`
+
+    Arguments:
+        samples {typing.List[Sample]} -- source of sentences
+        parser {Parser} -- parser
+        sizes {typing.Iterable[int]} -- sizes of text in bytes
+
+    Returns:
+        typing.Iterator[Case] -- name, function, items, unit
+    """
+    from src.oolongt.text import summarize
+
+    sentences = [
+        sentence
+        for samp in samples
+        for sentence in parser.split_sentences(samp.body)]
+
+    for size in sizes:
+        body = synthesize(sentences, size, SYNTHETIC_SEED)
+        count = len(parser.split_sentences(body))
+
+        yield (
+            'summarize/synthetic-' + format_size(size),
+            lambda b=body: summarize(b, 'Synthetic Document'),
+            count, 'sentences')
+
+
+def get_cases(
+        data_dir: Path,
+        sizes: typing.Iterable[int] = SYNTHETIC_SIZES,
+        match: str = '') -> typing.Iterator[Case]:
+    """List every benchmark case whose name contains `match`
+
+    Arguments:
+        data_dir {Path} -- path to test data
+
+    Keyword Arguments:
+        sizes {typing.Iterable[int]} -- sizes of synthetic text in bytes
+            (default: {SYNTHETIC_SIZES})
+        match {str} -- part of case name (default: {''})
+
+    Returns:
+        typing.Iterator[Case] -- name, function, items, unit
+    """
+    from src.oolongt.parser import Parser
+    from src.oolongt.summarizer import Summarizer
+
+    parser = Parser()
+    summarizer = Summarizer()
+    samples = get_samples(data_dir.joinpath('text'))
+    cases = (
+        get_import_cases(data_dir.parent.parent),
+        get_sample_cases(samples, parser, summarizer),
+        get_document_cases(data_dir.joinpath('content')),
+        get_synthetic_cases(samples, parser, sizes))
+
+    for group in cases:
+        for case in group:
+            if match in case[0]:
+                yield case
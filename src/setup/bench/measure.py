@@ -0,0 +1,102 @@
+"""Time and trace memory of a benchmark case"""
+import math
+import tracemalloc
+import typing
+from collections import OrderedDict
+from time import perf_counter
+
+MIN_RUNS = 5
+MIN_TIME = 1.0  # seconds
+MAX_TIME = 30.0  # seconds
+
+
+def percentile(vals: typing.List[float], pct: float) -> float:
+    """Get `pct` percentile of `vals` (nearest rank)
+
+    Arguments:
+        vals {typing.List[float]} -- list of values
+        pct {float} -- percentile (0-100)
+
+    Returns:
+        float -- value at percentile
+    """
+    ordered = sorted(vals)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+
+    return ordered[rank - 1]
+
+
+def time_runs(func: typing.Callable) -> typing.List[float]:
+    """Call `func` until there are enough runs or time runs out
+
+    At least one run, `MIN_RUNS` if they fit in `MAX_TIME` seconds,
+    and more until `MIN_TIME` seconds have passed.
+
+    Arguments:
+        func {typing.Callable} -- benchmark case
+
+    Returns:
+        typing.List[float] -- seconds of each run
+    """
+    latencies = []  # type: typing.List[float]
+    elapsed = 0.0
+
+    while not latencies or (
+            (elapsed < MAX_TIME) and
+            ((len(latencies) < MIN_RUNS) or (elapsed < MIN_TIME))):
+        start = perf_counter()
+        func()
+        latencies.append(perf_counter() - start)
+        elapsed += latencies[-1]
+
+    return latencies
+
+
+def trace_peak(func: typing.Callable) -> int:
+    """Get peak memory allocated by one call of `func`
+
+    Arguments:
+        func {typing.Callable} -- benchmark case
+
+    Returns:
+        int -- peak allocation in bytes
+    """
+    tracemalloc.start()
+
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def measure(func: typing.Callable, items: int, unit: str) -> OrderedDict:
+    """Measure latency, throughput and peak memory of `func`
+
+    Arguments:
+        func {typing.Callable} -- benchmark case
+        items {int} -- items processed by each call
+        unit {str} -- name of items, e.g. 'sentences'
+
+    Returns:
+        OrderedDict -- measurements
+    """
+    func()  # warm up caches and lazy loaders
+    latencies = time_runs(func)
+    mean = sum(latencies) / len(latencies)
+
+    result = OrderedDict()  # type: OrderedDict[str, typing.Any]
+    result['unit'] = unit
+    result['items'] = items
+    result['runs'] = len(latencies)
+    result['mean'] = mean
+    result['p50'] = percentile(latencies, 50)
+    result['p90'] = percentile(latencies, 90)
+    result['p99'] = percentile(latencies, 99)
+    result['per_second'] = items / mean if mean else 0.0
+    result['peak_kb'] = trace_peak(func) / 1024
+
+    return result
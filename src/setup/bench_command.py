@@ -0,0 +1,102 @@
+"""Run benchmarks"""
+import platform
+import sys
+import typing  # noqa  pylint: disable=unused-import
+from collections import OrderedDict
+from pathlib import Path
+
+from .bench import compare, format_change, get_cases, load, measure, save
+from .bench.cases import KB, LARGE_SIZES, SYNTHETIC_SIZES
+from .oolongt_task import OolongtTask
+
+BENCH_DIR = 'bench'
+
+
+# pylint: disable=attribute-defined-outside-init
+class BenchCommand(OolongtTask):
+    """Benchmark command"""
+    user_options = [
+        ('baseline=', 'b', 'path to baseline JSON [bench/baseline.json]'),
+        ('output=', 'o', 'path to results JSON [bench/results.json]'),
+        ('margin=', 'm', 'allowed regression, e.g. 0.25 for 25% [0.25]'),
+        ('sizes=', 's', 'synthetic sizes in KB [1,10,100,1024,10240]'),
+        ('large', 'l', 'also summarize 50 MB of synthetic text'),
+        ('match=', 'k', 'only cases with names containing this'),
+        ('save', None, 'save results as baseline'),
+    ]
+    boolean_options = ['large', 'save']
+
+    def initialize_options(self):
+        """initialize options"""
+        super().initialize_options()
+        self.baseline = str(self.get_project_path(BENCH_DIR, 'baseline.json'))
+        self.output = str(self.get_project_path(BENCH_DIR, 'results.json'))
+        self.margin = '0.25'
+        self.sizes = ','.join(str(size // KB) for size in SYNTHETIC_SIZES)
+        self.large = False
+        self.match = ''
+        self.save = False
+
+    def finalize_options(self):
+        """parse options"""
+        self.margin = float(self.margin)
+        self.sizes = [int(size) * KB for size in self.sizes.split(',') if size]
+
+        if self.large:
+            self.sizes.extend(LARGE_SIZES)
+
+    def announce_result(self, name: str, result: OrderedDict):
+        """Print one line of results
+
+        Arguments:
+            name {str} -- case name
+            result {OrderedDict} -- measurements
+        """
+        self.announce(
+            '{:36s} p50 {:10.2f} ms  p99 {:10.2f} ms  '
+            '{:10.0f} {}/s  peak {:9.0f} KB'.format(
+                name, result['p50'] * 1000, result['p99'] * 1000,
+                result['per_second'], result['unit'], result['peak_kb']),
+            level=2)
+
+    def run(self):
+        """Run benchmarks, then compare against or save baseline"""
+        self.announce('running benchmarks', level=2)
+
+        meta = OrderedDict()  # type: OrderedDict[str, typing.Any]
+        meta['python'] = platform.python_version()
+        meta['platform'] = platform.platform()
+        results = OrderedDict()  # type: OrderedDict[str, typing.Any]
+        data_dir = self.get_project_path('tests', 'data')
+
+        for name, func, items, unit in get_cases(
+                data_dir, self.sizes, self.match):
+            results[name] = measure(func, items, unit)
+            self.announce_result(name, results[name])
+
+        report = OrderedDict([('meta', meta), ('results', results)])
+        save(report, Path(self.output))
+
+        baseline_path = Path(self.baseline)
+        baseline = load(baseline_path)
+
+        if self.save or not baseline:
+            save(report, baseline_path)
+            self.announce('saved baseline: {}'.format(baseline_path), level=2)
+
+            return
+
+        regressions = compare(
+            results, baseline.get('results', {}), self.margin)
+
+        for name, key, old, new in regressions:
+            self.announce(
+                'REGRESSION {}: {} {:.6g} -> {:.6g} ({})'.format(
+                    name, key, old, new, format_change(old, new)),
+                level=4)
+
+        if regressions:
+            sys.exit(1)
+
+        self.announce(
+            'no regressions beyond {:.0%}'.format(self.margin), level=2)
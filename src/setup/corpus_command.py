@@ -0,0 +1,66 @@
+"""Generate synthetic corpus
+
+The generator is imported when the command runs; importing the generate
+subpackage loads the test data generators and the library with it.
+"""
+from pathlib import Path
+
+from .generate_command import OUTPUT_DIR
+from .oolongt_task import OolongtTask
+
+
+# pylint: disable=attribute-defined-outside-init
+class CorpusCommand(OolongtTask):
+    """Synthetic corpus command"""
+    user_options = [
+        ('output=', 'o', 'output directory [generated_data/corpus]'),
+        ('count=', 'c', 'documents per format [10]'),
+        ('size=', 's', 'text per document in KB [100]'),
+        ('sentences=', 'n', 'sentences per document (overrides size)'),
+        ('vocabulary=', 'v', 'distinct words [5000]'),
+        ('zipf=', 'z', 'word frequency exponent, 0 for uniform [1.1]'),
+        ('duplicates=', 'd', 'duplicate sentence rate [0.0]'),
+        ('formats=', 'f', 'extensions [txt,html,docx,pdf]'),
+        ('seed=', None, 'random seed [0]'),
+    ]
+
+    def initialize_options(self):
+        """initialize options"""
+        from .generate.corpus import FORMATS
+
+        super().initialize_options()
+        self.output = str(self.get_project_path(OUTPUT_DIR, 'corpus'))
+        self.count = '10'
+        self.size = '100'
+        self.sentences = None
+        self.vocabulary = '5000'
+        self.zipf = '1.1'
+        self.duplicates = '0.0'
+        self.formats = ','.join(FORMATS)
+        self.seed = '0'
+
+    def finalize_options(self):
+        """parse options"""
+        from .generate.corpus import KB, CorpusSpec
+
+        self.count = int(self.count)
+        self.formats = [fmt for fmt in self.formats.split(',') if fmt]
+        self.spec = CorpusSpec(
+            int(self.size) * KB,
+            int(self.sentences) if self.sentences else None,
+            int(self.vocabulary),
+            float(self.zipf),
+            float(self.duplicates),
+            seed=int(self.seed))
+
+    def run(self):
+        """Generate corpus"""
+        from .generate.corpus import generate_corpus
+
+        self.announce('generating corpus: {}'.format(self.output), level=2)
+
+        for path in generate_corpus(
+                Path(self.output), self.count, self.spec, self.formats):
+            self.announce(
+                '{:24s} {:12,d} bytes'.format(path.name, path.stat().st_size),
+                level=2)
@@ -0,0 +1,481 @@
+"""Deterministic synthetic corpus generator for scale testing
+
+Documents are streamed to disk paragraph by paragraph, so neither a
+document nor the corpus is ever held in memory.
+"""
+import itertools
+import random
+import typing
+import zipfile
+from collections import deque
+from html import escape as escape_html
+from pathlib import Path
+from xml.sax.saxutils import escape as escape_xml
+
+KB = 1024
+FORMATS = ('txt', 'html', 'docx', 'pdf')
+SYLLABLES = (
+    'ba', 'be', 'bi', 'bo', 'da', 'de', 'di', 'do', 'fa', 'fe', 'ka', 'ke',
+    'ki', 'ko', 'la', 'le', 'li', 'lo', 'ma', 'me', 'mi', 'mo', 'na', 'ne',
+    'ni', 'no', 'pa', 'pe', 'po', 'ra', 're', 'ri', 'ro', 'sa', 'se', 'si',
+    'so', 'ta', 'te', 'ti', 'to', 'va', 've', 'vo', 'za', 'ze', 'zi', 'zo')
+DUPLICATE_POOL = 1000  # recent sentences eligible to repeat
+PARAGRAPH_SENTENCES = 5
+PDF_LINE_CHARS = 90
+PDF_PAGE_LINES = 50
+
+Paragraphs = typing.Iterator[typing.List[str]]
+
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
+class CorpusSpec:
+    """Shape of generated documents"""
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            size: int = 100 * KB,
+            sentences: typing.Optional[int] = None,
+            vocabulary: int = 5000,
+            zipf: float = 1.1,
+            duplicate_rate: float = 0.0,
+            sentence_length: int = 20,
+            seed: int = 0) -> None:
+        """Initialize spec
+
+        Keyword Arguments:
+            size {int} -- text per document in bytes (default: {100 * KB})
+            sentences {typing.Optional[int]} -- sentences per document,
+                overrides `size` (default: {None})
+            vocabulary {int} -- distinct words (default: {5000})
+            zipf {float} -- exponent of word frequency by rank,
+                0 for uniform (default: {1.1})
+            duplicate_rate {float} -- chance a sentence repeats
+                an earlier one (default: {0.0})
+            sentence_length {int} -- mean words per sentence
+                (default: {20})
+            seed {int} -- random seed (default: {0})
+
+        Raises:
+            ValueError -- invalid spec
+        """
+        if not 0 <= duplicate_rate < 1:
+            raise ValueError(
+                'invalid duplicate rate: {!r}'.format(duplicate_rate))
+
+        if (vocabulary < 1) or (sentence_length < 1):
+            raise ValueError('vocabulary and sentence length must be > 0')
+
+        self.size = size
+        self.sentences = sentences
+        self.vocabulary = vocabulary
+        self.zipf = zipf
+        self.duplicate_rate = duplicate_rate
+        self.sentence_length = sentence_length
+        self.seed = seed
+
+
+def get_vocabulary(count: int, seed: int) -> typing.List[str]:
+    """List `count` distinct pronounceable words
+
+    Arguments:
+        count {int} -- number of words
+        seed {int} -- random seed
+
+    Returns:
+        typing.List[str] -- words, most frequent first
+    """
+    rand = random.Random(seed)
+    words = []  # type: typing.List[str]
+    seen = set()  # type: typing.Set[str]
+
+    while len(words) < count:
+        syllables = rand.randint(1, 4)
+        word = ''.join(rand.choice(SYLLABLES) for _ in range(syllables))
+
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+
+    return words
+
+
+def get_cum_weights(count: int, zipf: float) -> typing.List[float]:
+    """Get cumulative Zipf weights of `count` ranks
+
+    Arguments:
+        count {int} -- number of ranks
+        zipf {float} -- exponent
+
+    Returns:
+        typing.List[float] -- cumulative weights
+    """
+    return list(itertools.accumulate(
+        1 / (rank ** zipf) for rank in range(1, count + 1)))
+
+
+def iter_sentences(spec: CorpusSpec, seed: int) -> typing.Iterator[str]:
+    """Generate sentences forever
+
+    Arguments:
+        spec {CorpusSpec} -- shape of documents
+        seed {int} -- random seed
+
+    Returns:
+        typing.Iterator[str] -- sentences
+    """
+    rand = random.Random(seed)
+    vocab = get_vocabulary(spec.vocabulary, spec.seed)
+    cum_weights = get_cum_weights(spec.vocabulary, spec.zipf)
+    recent = deque(maxlen=DUPLICATE_POOL)  # type: typing.Deque[str]
+    mean = spec.sentence_length
+
+    while True:
+        if recent and (rand.random() < spec.duplicate_rate):
+            yield rand.choice(recent)
+
+            continue
+
+        length = max(1, min(3 * mean, int(rand.gauss(mean, mean / 3))))
+        words = rand.choices(vocab, cum_weights=cum_weights, k=length)
+        sentence = ' '.join(words).capitalize() + '.'
+        recent.append(sentence)
+
+        yield sentence
+
+
+def iter_paragraphs(spec: CorpusSpec, seed: int) -> Paragraphs:
+    """Generate paragraphs until document is `spec.size` or sentences
+
+    Arguments:
+        spec {CorpusSpec} -- shape of documents
+        seed {int} -- random seed
+
+    Returns:
+        Paragraphs -- lists of sentences
+    """
+    sentences = iter_sentences(spec, seed)
+    remaining = spec.sentences
+    size = 0
+    paragraph = []  # type: typing.List[str]
+
+    while (size < spec.size) if remaining is None else (remaining > 0):
+        sentence = next(sentences)
+        paragraph.append(sentence)
+        size += len(sentence) + 1
+
+        if remaining is not None:
+            remaining -= 1
+
+        if len(paragraph) == PARAGRAPH_SENTENCES:
+            yield paragraph
+            paragraph = []
+
+    if paragraph:
+        yield paragraph
+
+
+def write_txt(path: Path, title: str, paragraphs: Paragraphs):
+    """Write plain text document
+
+    Arguments:
+        path {Path} -- output path
+        title {str} -- title of document (first line)
+        paragraphs {Paragraphs} -- body of document
+    """
+    with path.open('w', encoding='utf-8') as stream:
+        stream.write(title + '\n')
+
+        for paragraph in paragraphs:
+            stream.write('\n' + ' '.join(paragraph) + '\n')
+
+
+def write_html(path: Path, title: str, paragraphs: Paragraphs):
+    """Write HTML document
+
+    Arguments:
+        path {Path} -- output path
+        title {str} -- title of document
+        paragraphs {Paragraphs} -- body of document
+    """
+    with path.open('w', encoding='utf-8') as stream:
+        stream.write(
+            '<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+            '<title>{0}</title></head>\n<body><article><h1>{0}</h1>\n'.format(
+                escape_html(title)))
+
+        for paragraph in paragraphs:
+            stream.write(
+                '<p>{}</p>\n'.format(escape_html(' '.join(paragraph))))
+
+        stream.write('</article></body></html>\n')
+
+
+DOCX_PARTS = (
+    ('[Content_Types].xml', (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'content-types"><Default Extension="rels" ContentType="application/'
+        'vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"'
+        '/><Override PartName="/docProps/core.xml" ContentType="application/'
+        'vnd.openxmlformats-package.core-properties+xml"/></Types>')),
+    ('_rels/.rels', (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/'
+        '2006/relationships"><Relationship Id="rId1" Type="http://schemas.'
+        'openxmlformats.org/officeDocument/2006/relationships/officeDocument"'
+        ' Target="word/document.xml"/><Relationship Id="rId2" Type="http://'
+        'schemas.openxmlformats.org/package/2006/relationships/metadata/'
+        'core-properties" Target="docProps/core.xml"/></Relationships>')),
+    ('word/_rels/document.xml.rels', (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/'
+        '2006/relationships"></Relationships>')),
+)
+DOCX_CORE = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/'
+    '2006/metadata/core-properties" xmlns:dc="http://purl.org/dc/elements/'
+    '1.1/"><dc:title>{}</dc:title></cp:coreProperties>')
+DOCX_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/'
+    '2006/main"><w:body>')
+DOCX_PARAGRAPH = '<w:p><w:r><w:t>{}</w:t></w:r></w:p>'
+DOCX_TAIL = '</w:body></w:document>'
+DOCX_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+
+def get_zip_info(name: str) -> zipfile.ZipInfo:
+    """Get fixed-date, compressed archive member `name`
+
+    Arguments:
+        name {str} -- name of member
+
+    Returns:
+        zipfile.ZipInfo -- member info
+    """
+    info = zipfile.ZipInfo(name, DOCX_TIMESTAMP)
+    info.compress_type = zipfile.ZIP_DEFLATED
+
+    return info
+
+
+def write_docx(path: Path, title: str, paragraphs: Paragraphs):
+    """Write Word XML document
+
+    Arguments:
+        path {Path} -- output path
+        title {str} -- title of document (core properties)
+        paragraphs {Paragraphs} -- body of document
+    """
+    with zipfile.ZipFile(str(path), 'w') as archive:
+        for name, xml in DOCX_PARTS:
+            archive.writestr(get_zip_info(name), xml)
+
+        archive.writestr(
+            get_zip_info('docProps/core.xml'),
+            DOCX_CORE.format(escape_xml(title)))
+
+        with archive.open(
+                get_zip_info('word/document.xml'), 'w',
+                force_zip64=True) as xml:
+            xml.write(DOCX_HEAD.encode('utf-8'))
+
+            for paragraph in paragraphs:
+                xml.write(DOCX_PARAGRAPH.format(
+                    escape_xml(' '.join(paragraph))).encode('utf-8'))
+
+            xml.write(DOCX_TAIL.encode('utf-8'))
+
+
+def escape_pdf(text: str) -> str:
+    """Escape `text` for a PDF string literal
+
+    Arguments:
+        text {str} -- text
+
+    Returns:
+        str -- escaped text
+    """
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def wrap_lines(paragraphs: Paragraphs) -> typing.Iterator[str]:
+    """Wrap paragraphs at `PDF_LINE_CHARS`, blank line after each
+
+    Arguments:
+        paragraphs {Paragraphs} -- body of document
+
+    Returns:
+        typing.Iterator[str] -- lines
+    """
+    for paragraph in paragraphs:
+        line = ''
+
+        for word in ' '.join(paragraph).split(' '):
+            if line and (len(line) + len(word) >= PDF_LINE_CHARS):
+                yield line
+                line = ''
+
+            line = '{} {}'.format(line, word) if line else word
+
+        yield line
+        yield ''
+
+
+class PdfWriter:
+    """Write PDF objects in order, tracking offsets for the xref table"""
+    def __init__(self, stream: typing.BinaryIO) -> None:
+        self.stream = stream
+        self.offsets = {}  # type: typing.Dict[int, int]
+        self.position = 0
+        self.write(b'%PDF-1.4\n')
+
+    def write(self, data: bytes):
+        """Write raw `data`"""
+        self.stream.write(data)
+        self.position += len(data)
+
+    def add(self, num: int, body: bytes):
+        """Write object `num` with `body`"""
+        self.offsets[num] = self.position
+        self.write(b'%d 0 obj\n' % num + body + b'\nendobj\n')
+
+    def close(self, root: int, info: int):
+        """Write xref table and trailer"""
+        start = self.position
+        count = max(self.offsets) + 1
+        self.write(b'xref\n0 %d\n0000000000 65535 f \n' % count)
+
+        for num in range(1, count):
+            self.write(b'%010d 00000 n \n' % self.offsets[num])
+
+        self.write(
+            b'trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\n'
+            b'startxref\n%d\n%%%%EOF\n' % (count, root, info, start))
+
+
+def write_pdf(path: Path, title: str, paragraphs: Paragraphs):
+    """Write PDF document, one page per `PDF_PAGE_LINES` lines
+
+    Arguments:
+        path {Path} -- output path
+        title {str} -- title of document (document info)
+        paragraphs {Paragraphs} -- body of document
+    """
+    catalog, pages, font, info = 1, 2, 3, 4
+    kids = []  # type: typing.List[int]
+    lines = wrap_lines(paragraphs)
+
+    with path.open('wb') as stream:
+        pdf = PdfWriter(stream)
+        pdf.add(
+            font, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+        pdf.add(info, '<< /Title ({}) >>'.format(
+            escape_pdf(title)).encode('latin-1', 'replace'))
+        page_lines = list(itertools.islice(lines, PDF_PAGE_LINES))
+        num = info + 1
+
+        while page_lines:
+            content = 'BT /F1 10 Tf 12 TL 50 760 Td\n{}\nET'.format('\n'.join(
+                '({}) Tj T*'.format(escape_pdf(line))
+                for line in page_lines)).encode('latin-1', 'replace')
+            pdf.add(num, b'<< /Length %d >>\nstream\n%s\nendstream' % (
+                len(content), content))
+            pdf.add(num + 1, (
+                b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] '
+                b'/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>'
+                % (pages, font, num)))
+            kids.append(num + 1)
+            num += 2
+            page_lines = list(itertools.islice(lines, PDF_PAGE_LINES))
+
+        pdf.add(pages, b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+            b' '.join(b'%d 0 R' % kid for kid in kids), len(kids)))
+        pdf.add(catalog, b'<< /Type /Catalog /Pages %d 0 R >>' % pages)
+        pdf.close(catalog, info)
+
+
+WRITERS = {
+    'txt': write_txt,
+    'html': write_html,
+    'docx': write_docx,
+    'pdf': write_pdf,
+}
+
+
+def get_title(spec: CorpusSpec, seed: int) -> str:
+    """Generate title of document
+
+    Arguments:
+        spec {CorpusSpec} -- shape of documents
+        seed {int} -- random seed
+
+    Returns:
+        str -- title
+    """
+    sentence = next(iter_sentences(spec, seed))
+
+    return ' '.join(sentence.rstrip('.').split(' ')[:6]).title()
+
+
+def generate_document(
+        path: Path,
+        spec: CorpusSpec,
+        index: int = 0) -> Path:
+    """Write document `index` of corpus to `path` (format by suffix)
+
+    The same spec and index always produce the same document.
+
+    Arguments:
+        path {Path} -- output path (.txt, .html, .docx, or .pdf)
+        spec {CorpusSpec} -- shape of documents
+
+    Keyword Arguments:
+        index {int} -- position of document in corpus (default: {0})
+
+    Raises:
+        ValueError -- unsupported format
+
+    Returns:
+        Path -- output path
+    """
+    fmt = path.suffix.lstrip('.')
+
+    if fmt not in WRITERS:
+        raise ValueError('unsupported format: {!r}'.format(fmt))
+
+    seed = spec.seed * 1000003 + index
+    path.parent.mkdir(parents=True, exist_ok=True)
+    WRITERS[fmt](path, get_title(spec, -seed), iter_paragraphs(spec, seed))
+
+    return path
+
+
+def generate_corpus(
+        output_dir: Path,
+        count: int,
+        spec: CorpusSpec,
+        formats: typing.Sequence[str] = FORMATS) -> typing.Iterator[Path]:
+    """Write `count` documents in each of `formats` to `output_dir`
+
+    Document `i` has the same text in every format.
+
+    Arguments:
+        output_dir {Path} -- output directory
+        count {int} -- documents per format
+        spec {CorpusSpec} -- shape of documents
+
+    Keyword Arguments:
+        formats {typing.Sequence[str]} -- extensions (default: {FORMATS})
+
+    Returns:
+        typing.Iterator[Path] -- path of each document, as written
+    """
+    for index in range(count):
+        for fmt in formats:
+            path = output_dir.joinpath('doc-{:06d}.{}'.format(index, fmt))
+
+            yield generate_document(path, spec, index)
@@ -1,5 +1,4 @@
 """Generate test data"""
-from .generate import keywords, merge, sentences  # noqa
 from .oolongt_task import OolongtTask
 
 OUTPUT_DIR = 'generated_data'
@@ -9,6 +8,8 @@ class GenerateCommand(OolongtTask):
     """Data generation command"""
     def run(self):
         """Generate test data"""
+        from .generate import keywords, merge, sentences
+
         self.announce('generating test data', level=2)
 
         input_dir = self.get_project_path('tests', 'data', 'text')
@@ -0,0 +1,149 @@
+"""Test asyncio subpackage"""
+import asyncio
+import threading
+import typing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from src.oolongt.aio import aget_document, ascore_sentences, asummarize
+from src.oolongt.aio.aio import offload
+from src.oolongt.files import get_document
+from src.oolongt.io.http_pool import get_deadline
+from src.oolongt.text import score_body_sentences, summarize
+from tests.constants import DOC_PATH, SAMPLES
+from tests.helpers import get_sample
+from tests.params.summarizer import get_inst_comp, param_samples
+from tests.typings.sample import Sample
+
+PATH = str(DOC_PATH.joinpath('basic.html'))
+
+
+def run(coro: typing.Awaitable) -> typing.Any:
+    """Run `coro` to completion in a new event loop
+
+    Stands in for `asyncio.run` (Python 3.7+).
+
+    Arguments:
+        coro {typing.Awaitable} -- coroutine
+
+    Returns:
+        typing.Any -- return value of `coro`
+    """
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coro)
+
+    finally:
+        loop.close()
+
+
+def test_aget_document():
+    """Test `aget_document`"""
+    doc = run(aget_document(PATH))
+    expected = get_document(PATH, None)
+
+    assert (doc.body, doc.title) == (expected.body, expected.title)
+
+    with pytest.raises(ValueError):
+        run(aget_document(str(DOC_PATH.joinpath('missing.txt'))))
+
+
+@param_samples(SAMPLES)
+def test_asummarize(samp: Sample):
+    """Test `asummarize` matches `summarize`
+
+    Arguments:
+        samp {Sample} -- sample data
+    """
+    expected = summarize(samp.body, samp.title, 3)
+
+    with ProcessPoolExecutor(1) as executor:
+        received = run(asummarize(
+            samp.body, samp.title, 3, executor=executor))
+
+    assert received == expected
+
+
+def test_ascore_sentences():
+    """Test `ascore_sentences` matches `score_body_sentences`"""
+    samp = get_sample(SAMPLES[0])
+    expected = score_body_sentences(samp.body, samp.title)
+    received = run(ascore_sentences(samp.body, samp.title))
+
+    assert list(map(get_inst_comp, received)) == list(
+        map(get_inst_comp, expected))
+
+
+def test_offload_concurrent():
+    """Test offloaded calls leave the event loop free"""
+    release = threading.Event()
+
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            blocked = asyncio.ensure_future(
+                offload(release.wait, 5, executor=executor))
+            await asyncio.sleep(0)
+            assert not blocked.done()
+
+            release.set()
+
+            return await blocked
+
+    assert run(main()) is True
+
+
+def test_offload_timeout():
+    """Test `offload` timeout"""
+    release = threading.Event()
+
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            try:
+                await offload(
+                    release.wait, 5, executor=executor, timeout=.01)
+
+            finally:
+                release.set()
+
+    with pytest.raises(asyncio.TimeoutError):
+        run(main())
+
+
+def test_offload_deadline():
+    """Test `offload` passes timeout down to HTTP requests"""
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            return (
+                await offload(get_deadline, executor=executor, timeout=5),
+                await offload(get_deadline, executor=executor))
+
+    limited, unlimited = run(main())
+
+    assert limited is not None
+    assert unlimited is None
+
+
+def test_offload_cancel():
+    """Test cancelled `offload` skips queued work"""
+    release = threading.Event()
+    calls = []
+
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            busy = asyncio.ensure_future(
+                offload(release.wait, 5, executor=executor))
+            queued = asyncio.ensure_future(
+                offload(calls.append, 1, executor=executor))
+            await asyncio.sleep(0)
+            queued.cancel()
+            release.set()
+            await busy
+
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+
+    run(main())
+
+    assert calls == []
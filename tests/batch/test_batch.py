@@ -0,0 +1,142 @@
+"""Test batch subpackage"""
+import time
+
+import pytest
+
+from src.oolongt.batch import BatchResult, summarize_many
+from src.oolongt.batch.batch import (
+    CHUNKS_PER_WORKER, chunk_jobs, summarize_source)
+from src.oolongt.content import TextContent
+from src.oolongt.files import get_document
+from tests.constants import DOC_PATH
+from tests.helpers import assert_ex
+from tests.params.helpers import parametrize
+
+PATHS = [
+    str(DOC_PATH.joinpath(name))
+    for name in ('basic.txt', 'basic.html', 'intermed.txt', 'intermed.html')]
+MISSING = str(DOC_PATH.joinpath('missing.txt'))
+
+
+def get_expected(source, limit: float = 3):
+    """Summarize `source` in this process
+
+    Arguments:
+        source {Source} -- path to document or content
+
+    Keyword Arguments:
+        limit {float} -- length of summary (default: {3})
+
+    Returns:
+        tuple -- title and summary
+    """
+    content = get_document(source, None) if isinstance(source, str) else source
+
+    return content.title, content.summarize(limit)
+
+
+@parametrize(
+    'size,expected',
+    ((1, [[0], [1], [2]]), (2, [[0, 1], [2]]), (5, [[0, 1, 2]])),
+    ('one', 'two', 'all'))
+def test_chunk_jobs(size: int, expected: list):
+    """Test `chunk_jobs` in batch subpackage
+
+    Arguments:
+        size {int} -- documents per chunk
+        expected {list} -- indexes in each chunk
+    """
+    received = [
+        [index for index, _ in chunk]
+        for chunk in chunk_jobs('abc', size)]
+
+    assert (received == expected), assert_ex('chunks', received, expected)
+
+
+def test_summarize_source():
+    """Test `summarize_source` in batch subpackage"""
+    received = summarize_source((3, PATHS[0]), 3)
+
+    assert (received.index, received.path, received.ok) == (3, PATHS[0], True)
+    assert (received.title, received.summary) == get_expected(PATHS[0])
+
+
+def test_summarize_source_error():
+    """Test `summarize_source` captures errors"""
+    received = summarize_source((0, MISSING))
+
+    assert not received.ok
+    assert received.error.startswith('ValueError: Unable to read')
+    assert received.summary is None
+
+
+@parametrize(
+    'chunk_size,ordered',
+    ((1, True), (3, True), (2, False)),
+    ('ordered', 'chunked', 'as_completed'))
+def test_summarize_many(chunk_size: int, ordered: bool):
+    """Test `summarize_many` in batch subpackage
+
+    Arguments:
+        chunk_size {int} -- documents sent to a worker at a time
+        ordered {bool} -- yield in input order
+    """
+    content = TextContent('Spam is tasty. Eggs are tasty too.', 'Spam')
+    sources = PATHS + [MISSING, content]
+    results = list(summarize_many(
+        sources, 3, max_workers=2, chunk_size=chunk_size, ordered=ordered))
+
+    if ordered:
+        assert [res.index for res in results] == list(range(len(sources)))
+
+    results.sort(key=lambda res: res.index)
+
+    for source, res in zip(sources, results):
+        if source == MISSING:
+            assert not res.ok
+
+        else:
+            received = (res.title, res.summary)
+            expected = get_expected(source)
+
+            assert (received == expected), assert_ex(
+                'summary', received, expected, hint=res.path)
+
+
+@parametrize('ordered', (True, False), ('ordered', 'as_completed'))
+def test_summarize_many_lazy(ordered: bool):
+    """Test `summarize_many` reads ahead a bounded window and stops early
+
+    Arguments:
+        ordered {bool} -- yield in input order
+    """
+    consumed = []
+
+    def sources():
+        for idx in range(1000):
+            consumed.append(idx)
+
+            yield PATHS[idx % len(PATHS)]
+
+    results = summarize_many(sources(), 3, max_workers=2, ordered=ordered)
+    first = next(results)
+    start = time.monotonic()
+    results.close()
+
+    assert first.ok
+    assert len(consumed) <= 2 * CHUNKS_PER_WORKER + 2
+    assert time.monotonic() - start < 5
+
+
+def test_summarize_many_chunk_size():
+    """Test `summarize_many` rejects invalid chunk size"""
+    with pytest.raises(ValueError):
+        summarize_many(PATHS, chunk_size=0)
+
+
+def test_batch_result():
+    """Test `BatchResult`"""
+    res = BatchResult(1, 'spam.txt', 'Spam', ['Spam.'])
+
+    assert res.ok
+    assert repr(res) == "BatchResult(1, 'spam.txt', 'Spam', ['Spam.'], None)"
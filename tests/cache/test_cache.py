@@ -0,0 +1,243 @@
+"""Test cache subpackage"""
+import os
+import pickle
+
+import pytest
+
+from src.oolongt.cache import MemoryCache, SqliteCache, set_cache
+from src.oolongt.cache.result_cache import get_key
+from src.oolongt.constants import BUILTIN, DEFAULT_IDIOM
+from src.oolongt.summarizer import invalidate
+from src.oolongt.text import score_body_sentences, summarize
+from tests.helpers import assert_ex, get_sample
+from tests.params.helpers import parametrize
+
+KEY_ARGS = ('summary', 'Body. Text.', 'Title', BUILTIN, DEFAULT_IDIOM, 3)
+
+
+class Clock:
+    """Manually advanced clock"""
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def get_caches(tmp_path, **kwargs):
+    """Initialize one cache of each backend
+
+    Arguments:
+        tmp_path {pathlib.Path} -- temporary directory
+
+    Returns:
+        list -- memory and SQLite caches
+    """
+    return [
+        MemoryCache(**kwargs),
+        SqliteCache(tmp_path.joinpath('cache.db'), **kwargs)]
+
+
+@parametrize(
+    'idx,value',
+    ((0, 'sentences'), (1, 'Body. Text'), (2, 'Title.'),
+     (4, 'missing'), (5, 4)),
+    ('kind', 'body', 'title', 'idiom', 'limit'))
+def test_get_key(idx: int, value):
+    """Test `get_key` changes with each argument
+
+    Arguments:
+        idx {int} -- position of argument
+        value {typing.Any} -- other value of argument
+    """
+    args = list(KEY_ARGS)
+    args[idx] = value
+
+    assert get_key(*KEY_ARGS) == get_key(*KEY_ARGS)
+    assert get_key(*args) != get_key(*KEY_ARGS)
+
+
+def test_get_key_limit():
+    """Test `get_key` matches equal limits of either type"""
+    args = list(KEY_ARGS)
+    args[5] = float(args[5])
+
+    assert get_key(*args) == get_key(*KEY_ARGS)
+
+
+def test_get_key_config(tmp_path):
+    """Test `get_key` changes with idiom config after `invalidate`"""
+    config = tmp_path.joinpath('custom.json')
+    config.write_text('{"ideal": 20}')
+    args = ('summary', 'Body.', 'Title', str(tmp_path), 'custom', 3)
+    expected = get_key(*args)
+
+    config.write_text('{"ideal": 10}')
+
+    assert get_key(*args) == expected
+
+    invalidate(str(tmp_path), 'custom')
+
+    assert get_key(*args) != expected
+
+
+@pytest.mark.parametrize('idx', (0, 1), ids=('memory', 'sqlite'))
+def test_get_set(tmp_path, idx: int):
+    """Test storing and fetching results
+
+    Arguments:
+        idx {int} -- position of backend in `get_caches`
+    """
+    cache = get_caches(tmp_path)[idx]
+
+    with pytest.raises(KeyError):
+        cache.get('a')
+
+    cache.set('a', ['x', 'y'])
+    received = cache.get('a')
+    received.append('z')
+
+    assert cache.get('a') == ['x', 'y']
+    assert len(cache) == 1
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize('idx', (0, 1), ids=('memory', 'sqlite'))
+def test_max_size(tmp_path, idx: int):
+    """Test least recently used entries are evicted
+
+    Arguments:
+        idx {int} -- position of backend in `get_caches`
+    """
+    cache = get_caches(tmp_path, max_size=2)[idx]
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert len(cache) == 2
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+
+    with pytest.raises(KeyError):
+        cache.get('b')
+
+
+@pytest.mark.parametrize('idx', (0, 1), ids=('memory', 'sqlite'))
+def test_ttl(tmp_path, idx: int):
+    """Test entries expire
+
+    Arguments:
+        idx {int} -- position of backend in `get_caches`
+    """
+    clock = Clock()
+    cache = get_caches(tmp_path, ttl=60, clock=clock)[idx]
+    cache.set('a', 1)
+    clock.now += 30
+    cache.set('b', 2)
+    clock.now += 30
+
+    assert len(cache) == 1
+    assert cache.get('b') == 2
+
+    with pytest.raises(KeyError):
+        cache.get('a')
+
+
+def test_fetch():
+    """Test `fetch` computes only on miss"""
+    cache = MemoryCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+
+        return len(calls)
+
+    assert (cache.fetch('a', compute), cache.fetch('a', compute)) == (1, 1)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_sqlite_persists(tmp_path):
+    """Test SQLite results outlive the connection"""
+    path = tmp_path.joinpath('cache.db')
+    cache = SqliteCache(path)
+    cache.set('a', {'b': [1, 2]})
+    cache.close()
+
+    assert SqliteCache(path).get('a') == {'b': [1, 2]}
+
+
+def test_sqlite_pickle(tmp_path):
+    """Test `SqliteCache` reopens database when unpickled"""
+    cache = SqliteCache(tmp_path.joinpath('cache.db'))
+    cache.set('a', [1, 2])
+
+    copy = pickle.loads(pickle.dumps(cache))
+
+    try:
+        assert copy.get('a') == [1, 2]
+
+    finally:
+        copy.close()
+        cache.close()
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork')
+def test_sqlite_fork(tmp_path):
+    """Test `SqliteCache` opens a new connection in forked process"""
+    cache = SqliteCache(tmp_path.joinpath('cache.db'))
+    cache.set('a', [1, 2])
+    inherited = cache._open()  # pylint: disable=protected-access
+
+    pid = os.fork()
+
+    if pid == 0:  # pragma: no cover
+        try:
+            reopened = cache._open()  # pylint: disable=protected-access
+            cache.set('b', [3])
+            found = cache.get('a') == [1, 2]
+            os._exit(0 if found and (reopened is not inherited) else 1)
+
+        finally:
+            os._exit(2)
+
+    _, status = os.waitpid(pid, 0)
+
+    assert os.WIFEXITED(status) and (os.WEXITSTATUS(status) == 0)
+    assert cache.get('b') == [3]
+
+    cache.close()
+
+
+@pytest.mark.parametrize('idx', (0, 1), ids=('memory', 'sqlite'))
+def test_text_functions(tmp_path, idx: int):
+    """Test `summarize` and `score_body_sentences` consult active cache
+
+    Arguments:
+        idx {int} -- position of backend in `get_caches`
+    """
+    samp = get_sample('cambodia')
+    expected_summary = summarize(samp.body, samp.title, 3)
+    expected_texts = [
+        s.text for s in score_body_sentences(samp.body, samp.title)]
+    cache = get_caches(tmp_path)[idx]
+    previous = set_cache(cache)
+
+    try:
+        for _ in range(2):
+            summary = summarize(samp.body, samp.title, 3)
+            texts = [
+                s.text for s in score_body_sentences(samp.body, samp.title)]
+
+            assert (summary == expected_summary), assert_ex(
+                'summary', summary, expected_summary)
+            assert (texts == expected_texts), assert_ex(
+                'sentences', texts, expected_texts)
+
+    finally:
+        set_cache(previous)
+
+    assert (cache.hits, cache.misses) == (2, 2)
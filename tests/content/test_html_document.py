@@ -2,9 +2,9 @@
 from src.oolongt.content import HtmlDocument
 from src.oolongt.content.content import norm_text
 from src.oolongt.content.html_document import (
-    get_body, get_og_title, get_source, get_title, process)
+    get_body, get_og_title, get_source, get_title, process, process_fast)
 from src.oolongt.io import read_file
-from src.oolongt.ugly_soup import UglySoup
+from src.oolongt.ugly_soup import FastSoup, UglySoup
 from test_text_document import TestTextDocument
 from tests.params.content import (
     DocumentInit, compare_document, get_doc_path, param_document_init,
@@ -14,6 +14,21 @@ from tests.params.helpers import parametrize
 STEMS = ('basic', 'intermed')
 EXTENSION = 'html'
 BASIC_INTERMED = STEMS
+TRICKY_HTML = (
+    '<html><head><title>T</title></head><body>'
+    '<script>var x = "<main>";</script>'
+    '<aside><main>Not this</main><div>deep<aside>er</aside></div></aside>'
+    '<main>Main <b>body</b><img src="x"/> &amp; <code>code</code> ok</main>'
+    '<meta property="og:title" content="Late"></body></html>',
+    '<title>Only</title><article>Art <style>p {}</style>icle'
+    '<p>para</article><p>after',
+    '<body>No main <aside>unclosed <p>ignored</body><title>After</title>',
+    '<meta property="og:title" content="OG"><title>T</title>'
+    '<main>first</main><main>second</main>',
+    '  <TITLE>Upper</TITLE>\n<Main>\n  spaced\n<script>\n</script>\n'
+    '  text  </MAIN>',
+)
+TRICKY_IDS = ('late-og', 'article', 'unclosed', 'og-first', 'case')
 
 
 def get_path(stem: str) -> str:
@@ -87,6 +102,52 @@ def test_get_source(stem: str):
     assert received == expected
 
 
+@parametrize('html', TRICKY_HTML, TRICKY_IDS)
+def test_process_fast(html: str):
+    """Test `process_fast` finds the same body and title as `process`
+
+    Arguments:
+        html {str} -- document HTML
+    """
+    src = process(html)
+    expected = (get_body(src), get_title(src))
+
+    fast = process_fast(html)
+    received = (get_body(fast), get_title(fast))
+
+    assert isinstance(fast, FastSoup)
+    assert received == expected
+
+
+def test_process_fast_stops():
+    """Test `process_fast` stops parsing once body and title are found"""
+    html = (
+        '<meta property="og:title" content="OG"><main>first</main>'
+        '<main>second</main><p>tail</p>')
+
+    received = process_fast(html)
+
+    assert received.is_settled()
+    assert 'second' not in str(received)
+    assert 'tail' not in str(received)
+
+
+@parametrize('stem', BASIC_INTERMED, BASIC_INTERMED)
+def test_get_source_fast(stem: str):
+    """Test `get_source` for HtmlDocument in fast mode
+
+    Arguments:
+        stem {str} -- stem of sample path
+    """
+    path = get_path(stem)
+    expected = get_source(path)
+
+    received = get_source(path, True)
+
+    assert get_body(received) == get_body(expected)
+    assert get_title(received) == get_title(expected)
+
+
 @parametrize('stem', BASIC_INTERMED, BASIC_INTERMED)
 def test_get_body(stem: str):
     """Test `get_body` for HtmlDocument
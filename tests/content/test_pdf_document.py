@@ -1,8 +1,12 @@
 """Test `PdfDocument` content class"""
-from PyPDF2 import PdfFileReader
+from io import BytesIO
+
+from PyPDF2 import PdfFileReader, PdfFileWriter
 
 from src.oolongt.content import PdfDocument
-from src.oolongt.content.pdf_document import get_body, get_page, get_title
+from src.oolongt.content.pdf_document import (
+    get_body, get_body_parallel, get_page, get_title, iter_document_pages,
+    iter_pages, split_pages)
 from src.oolongt.io import get_stream
 from test_binary_document import TestBinaryDocument
 from tests.params.content import (
@@ -88,6 +92,106 @@ def test_get_title(stem: str, expected: str):
     assert received == expected
 
 
+def get_multipage(num_pages: int) -> bytes:
+    """Repeat page of basic PDF `num_pages` times
+
+    Arguments:
+        num_pages {int} -- number of pages
+
+    Returns:
+        bytes -- PDF file contents
+    """
+    with get_stream(get_path('basic')) as stream:
+        page = PdfFileReader(BytesIO(stream.read())).getPage(0)
+
+    writer = PdfFileWriter()
+
+    for _ in range(num_pages):
+        writer.addPage(page)
+
+    output = BytesIO()
+    writer.write(output)
+
+    return output.getvalue()
+
+
+@parametrize(
+    'start,stop,expected',
+    ((0, None, 5), (2, None, 3), (0, 2, 2), (1, 99, 4), (0, 0, 0)),
+    ('all', 'start', 'stop', 'over', 'none'))
+def test_iter_pages(start: int, stop, expected: int):
+    """Test `iter_pages` for PdfDocument
+
+    Arguments:
+        start {int} -- first page number
+        stop {OptionalInt} -- page number to stop before
+        expected {int} -- number of pages
+    """
+    src = PdfFileReader(BytesIO(get_multipage(5)))
+    received = list(iter_pages(src, start, stop))
+
+    assert len(received) == expected
+    assert all(page.strip() == 'Basic body' for page in received)
+
+
+def test_iter_document_pages():
+    """Test `iter_document_pages` for PdfDocument"""
+    pages = iter_document_pages(get_path('basic'))
+
+    assert next(pages).strip() == 'Basic body'
+    assert list(pages) == []
+
+
+@parametrize(
+    'num_pages,size,expected',
+    ((5, 2, [(0, 2), (2, 4), (4, 5)]), (4, 4, [(0, 4)]), (0, 3, [])),
+    ('partial', 'exact', 'empty'))
+def test_split_pages(num_pages: int, size: int, expected: list):
+    """Test `split_pages` for PdfDocument
+
+    Arguments:
+        num_pages {int} -- number of pages
+        size {int} -- pages per range
+        expected {list} -- page ranges
+    """
+    assert split_pages(num_pages, size) == expected
+
+
+@parametrize(
+    'max_pages,size', ((None, 2), (3, 2), (None, 16)),
+    ('all', 'limit', 'serial'))
+def test_get_body_parallel(max_pages, size: int):
+    """Test `get_body_parallel` matches `get_body`
+
+    Arguments:
+        max_pages {OptionalInt} -- page limit
+        size {int} -- pages per task
+    """
+    data = get_multipage(7)
+    src = PdfFileReader(BytesIO(data))
+    expected = get_body(src, max_pages)
+    received = get_body_parallel(src, data, max_pages, 2, size)
+
+    assert received == expected
+
+
+@parametrize(
+    'max_pages,max_workers,expected',
+    ((None, 2, 'Basic body'), (0, 1, ''), (0, 2, '')),
+    ('parallel', 'limit', 'parallel limit'))
+def test_pdf_document_options(max_pages, max_workers, expected: str):
+    """Test page limit and workers of `PdfDocument`
+
+    Arguments:
+        max_pages {OptionalInt} -- page limit
+        max_workers {OptionalInt} -- worker processes
+        expected {str} -- expected body
+    """
+    doc = PdfDocument(get_path('basic'), max_pages, max_workers)
+
+    assert (doc.body.strip(), doc.title) == (expected, 'Basic Title')
+
+
 class TestPdfDocument(TestBinaryDocument):
     """Test `PdfDocument` content class"""
     @param_document_init(SUBJECT, EXTENSION, STEMS)
@@ -1,8 +1,41 @@
 """Test files subpackage"""
-from src.oolongt.files.files import get_document, get_handler
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from src.oolongt.files.files import get_document, get_handler, get_handlers
 from src.oolongt.typings import OptionalString
+from tests.helpers import assert_ex
 from tests.params.content import compare_document
 from tests.params.files import param_get_document, param_get_handler
+from tests.params.helpers import parametrize
+
+ROOT = Path(__file__).parents[2]
+HEAVY_MODULES = ('bs4', 'docx2python', 'nltk', 'numpy', 'PyPDF2')
+LOADED_SCRIPT = (
+    'import json, sys\n'
+    'import src.oolongt.cli\n'
+    'from src.oolongt.files.files import get_handler\n'
+    'get_handler({!r})\n'
+    'print(json.dumps(sorted(m for m in {!r} if m in sys.modules)))')
+
+
+def get_loaded(path: str) -> list:
+    """List heavy modules loaded to find handler of `path`
+
+    Arguments:
+        path {str} -- path to document
+
+    Returns:
+        list -- names of loaded modules
+    """
+    script = LOADED_SCRIPT.format(path, HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, '-c', script], cwd=str(ROOT),
+        stdout=subprocess.PIPE, check=True).stdout
+
+    return json.loads(output.decode('utf-8'))
 
 
 @param_get_handler()
@@ -35,3 +68,33 @@ def test_get_document(path: str, ext: OptionalString, expected: tuple):
     received = get_document(path, ext)
 
     assert compare_document(received, expected)
+
+
+@parametrize(
+    'path,expected',
+    (
+        ('notes.txt', []),
+        ('report.pdf', ['PyPDF2']),
+        ('page.html', ['bs4']),
+    ),
+    ('txt', 'pdf', 'html'))
+def test_lazy_imports(path: str, expected: list):
+    """Test only the handler of `path` (and its dependencies) is imported
+
+    Arguments:
+        path {str} -- path to document
+        expected {list} -- heavy modules loaded
+    """
+    received = get_loaded(path)
+
+    assert (received == expected), assert_ex(
+        'loaded modules', received, expected, hint=path)
+
+
+def test_get_handlers():
+    """Test `get_handlers` lists handlers in order of precedence"""
+    expected = ['DocxDocument', 'PdfDocument', 'HtmlDocument']
+
+    received = [handler.__name__ for handler in get_handlers()]
+
+    assert received == expected
@@ -0,0 +1,109 @@
+"""Test instrument subpackage"""
+import threading
+
+from src.oolongt.files import get_document
+from src.oolongt.instrument import Recorder, StageStats, recording, stage
+from src.oolongt.instrument.instrument import NULL_STAGE
+from src.oolongt.summarizer import Summarizer
+from tests.constants import DOC_PATH
+from tests.helpers import assert_ex, get_sample
+from tests.params.helpers import parametrize
+
+
+def test_stage_disabled():
+    """Test `stage` does nothing outside `recording`"""
+    assert stage('split') is NULL_STAGE
+
+    with stage('split') as timed:
+        timed.items = 3
+
+
+def test_stage_stats():
+    """Test `StageStats.add`"""
+    stats = StageStats()
+    stats.add(2.0, 1.0, 3)
+    stats.add(1.0, .5, 4)
+
+    received = (stats.calls, stats.wall, stats.cpu, stats.items)
+    expected = (2, 3.0, 1.5, 7)
+
+    assert (received == expected), assert_ex('totals', received, expected)
+
+
+def test_recording():
+    """Test nested recorders and callbacks"""
+    calls = []
+    outer = Recorder(lambda *args: calls.append(args))
+
+    with recording(outer):
+        with stage('a') as timed:
+            timed.items = 2
+
+        with recording() as inner:
+            with stage('b'):
+                pass
+
+    with stage('a'):
+        pass
+
+    assert [name for name, *_ in calls] == ['a', 'b']
+    assert (outer.stages['a'].items, outer.stages['b'].calls) == (2, 1)
+    assert list(inner.stages) == ['b']
+
+    outer.reset()
+
+    assert outer.as_dict() == {}
+
+
+def test_recording_thread():
+    """Test stages of other threads are not recorded"""
+    def work():
+        with stage('a'):
+            pass
+
+    with recording() as rec:
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    assert rec.as_dict() == {}
+
+
+@parametrize(
+    'method', ('get_all_sentences', 'rank_sentences', 'get_batch'),
+    ('all', 'rank', 'batch'))
+def test_summarizer(method: str):
+    """Test stages of `Summarizer`
+
+    Arguments:
+        method {str} -- name of scoring method
+    """
+    samp = get_sample('cambodia')
+    score = getattr(Summarizer(), method)
+
+    with recording() as rec:
+        received = score(samp.body, samp.title)
+
+    stats = rec.as_dict()
+    expected = {'split', 'stem', 'keywords', 'score'}
+
+    if method == 'rank_sentences':
+        expected.add('sort')
+
+    assert (set(stats) == expected), assert_ex(
+        'stages', sorted(stats), sorted(expected))
+    assert stats['split']['items'] == len(received)
+    assert stats['score']['items'] == len(received)
+    assert all(stats[name]['wall'] >= 0 for name in stats)
+
+
+def test_get_document():
+    """Test stages of `get_document`"""
+    with recording() as rec:
+        doc = get_document(str(DOC_PATH.joinpath('basic.html')), None)
+
+    stats = rec.as_dict()
+
+    assert set(stats) == {'fetch', 'extract'}
+    assert stats['extract']['items'] == len(doc.body)
+    assert stats['fetch']['items'] > 0
@@ -0,0 +1,138 @@
+"""Local HTTP server for I/O tests"""
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MODIFIED = 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serve test routes over keep-alive connections"""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+    def reply(self, status: int, body: bytes = b'', **headers) -> None:
+        """Send complete response"""
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+
+        for key, val in headers.items():
+            self.send_header(key.replace('_', '-'), val)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Route request by path"""
+        server = self.server
+        server.ports.add(self.client_address[1])
+        server.hits[self.path] += 1
+        hits = server.hits[self.path]
+
+        if self.path.startswith('/slow'):
+            with server.lock:
+                server.active += 1
+                server.peak = max(server.peak, server.active)
+
+            time.sleep(.05)
+
+            with server.lock:
+                server.active -= 1
+
+            self.reply(200, self.path.encode())
+
+        elif self.path == '/flaky':
+            self.reply(200 if hits > 2 else 503, b'finally')
+
+        elif self.path == '/moved':
+            self.reply(302, Location='/page?q=1')
+
+        elif self.path == '/loop':
+            self.reply(302, Location='/loop')
+
+        elif self.path == '/missing':
+            self.reply(404)
+
+        elif self.path.startswith('/etag'):
+            etag = '"v{}"'.format(server.version)
+
+            if self.headers.get('If-None-Match') == etag:
+                self.reply(304, ETag=etag)
+
+            else:
+                body = '{} v{}'.format(self.path, server.version).encode()
+                self.reply(200, body, ETag=etag)
+
+        elif self.path == '/modified':
+            if self.headers.get('If-Modified-Since') == MODIFIED:
+                self.reply(304)
+
+            else:
+                self.reply(200, b'modified', Last_Modified=MODIFIED)
+
+        elif self.path == '/nostore':
+            self.reply(200, b'private', Cache_Control='no-store', ETag='"x"')
+
+        elif self.path == '/versioned':
+            if server.version == 1:
+                self.reply(200, b'v1', ETag='"v1"')
+
+            elif server.version == 2:
+                self.reply(200, b'v2', Cache_Control='no-store')
+
+            else:
+                self.reply(404)
+
+        elif self.path == '/hang':
+            time.sleep(.5)
+            self.reply(200)
+
+        else:
+            agent = self.headers.get('User-Agent', '')
+            self.reply(200, 'page {} {}'.format(self.path, agent).encode())
+
+
+class Server(ThreadingHTTPServer):
+    """Record connections and request counts"""
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), Handler)
+        self.lock = threading.Lock()
+        self.ports = set()
+        self.hits = Counter()
+        self.active = 0
+        self.peak = 0
+        self.version = 1
+
+    def reset(self) -> None:
+        """Forget recorded requests"""
+        self.ports = set()
+        self.hits = Counter()
+        self.active = 0
+        self.peak = 0
+        self.version = 1
+
+    @property
+    def url(self) -> str:
+        """Base URL of server"""
+        return 'http://127.0.0.1:{}'.format(self.server_address[1])
+
+
+def serve():
+    """Run server in background thread until closed
+
+    Returns:
+        typing.Iterator[Server] -- running server
+    """
+    server = Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,254 @@
+"""Test on-disk HTTP cache against a local server"""
+import os
+import pickle
+from http.client import HTTPMessage
+from urllib.error import HTTPError
+
+import pytest
+
+from local_server import serve
+from src.oolongt.io import HttpCache, HttpPool, read_file, set_http_cache
+from src.oolongt.io.http_cache import is_storable, parse_headers
+from src.oolongt.io.http_pool import HttpResponse
+from tests.params.helpers import parametrize
+
+
+class Clock:
+    """Settable clock"""
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name='server', scope='module')
+def fixture_server():
+    """Run server in background thread"""
+    yield from serve()
+
+
+@pytest.fixture(name='pool')
+def fixture_pool(server):
+    """Get pool without waits between retries"""
+    server.reset()
+
+    with HttpPool(timeout=5, sleep=lambda _: None) as pool:
+        yield pool
+
+
+@pytest.fixture(name='clock')
+def fixture_clock():
+    """Get settable clock"""
+    return Clock()
+
+
+@pytest.fixture(name='cache')
+def fixture_cache(tmp_path, clock):
+    """Get empty cache in temporary directory"""
+    cache = HttpCache(tmp_path / 'http.db', fresh=60, clock=clock)
+
+    yield cache
+
+    cache.close()
+
+
+def get_response(status: int, headers: str) -> HttpResponse:
+    """Build response with `headers`"""
+    return HttpResponse('http://x/', status, '', parse_headers(headers), b'')
+
+
+@parametrize(
+    'status,headers,expected',
+    (
+        (200, 'ETag: "a"\n\n', True),
+        (200, '\n', True),
+        (200, 'Cache-Control: private, no-store\n\n', False),
+        (206, '\n', False)),
+    ('etag', 'plain', 'no-store', 'partial'))
+def test_is_storable(status: int, headers: str, expected: bool):
+    """Test `is_storable`
+
+    Arguments:
+        status {int} -- HTTP status
+        headers {str} -- response headers
+        expected {bool} -- response may be stored
+    """
+    assert is_storable(get_response(status, headers)) == expected
+
+
+def test_parse_headers():
+    """Test `parse_headers`"""
+    received = parse_headers('ETag: "a"\nContent-Length: 3\n\n')
+
+    assert isinstance(received, HTTPMessage)
+    assert received['etag'] == '"a"'
+
+
+def test_get_fresh(server, pool, cache, clock):
+    """Test `HttpCache.get` serves fresh responses without a request"""
+    first = cache.get(pool, server.url + '/etag')
+    clock.now += 59
+    second = cache.get(pool, server.url + '/etag')
+
+    assert second.body == first.body == b'/etag v1'
+    assert server.hits['/etag'] == 1
+    assert (cache.hits, cache.revalidated, cache.misses) == (1, 0, 1)
+
+
+@parametrize('path', ('/etag', '/modified'), ('etag', 'last-modified'))
+def test_get_revalidated(server, pool, cache, clock, path: str):
+    """Test `HttpCache.get` serves 304 responses from cache
+
+    Arguments:
+        path {str} -- path on server
+    """
+    first = cache.get(pool, server.url + path)
+    clock.now += 61
+    second = cache.get(pool, server.url + path)
+    third = cache.get(pool, server.url + path)
+
+    assert second.body == third.body == first.body
+    assert second.status == 200
+    assert server.hits[path] == 2
+    assert (cache.hits, cache.revalidated, cache.misses) == (1, 1, 1)
+
+
+def test_get_changed(server, pool, cache, clock):
+    """Test `HttpCache.get` replaces changed responses"""
+    cache.get(pool, server.url + '/etag')
+    server.version = 2
+    clock.now += 61
+
+    received = cache.get(pool, server.url + '/etag')
+
+    assert received.body == b'/etag v2'
+    assert cache.lookup(server.url + '/etag')[1] == '"v2"'
+    assert cache.misses == 2
+
+
+def test_get_no_store(server, pool, cache):
+    """Test `HttpCache.get` does not store `no-store` responses"""
+    cache.get(pool, server.url + '/nostore')
+    cache.get(pool, server.url + '/nostore')
+
+    assert len(cache) == 0
+    assert server.hits['/nostore'] == 2
+
+
+def test_get_discards_no_store(server, pool, cache, clock):
+    """Test `HttpCache.get` discards response replaced by `no-store`"""
+    url = server.url + '/versioned'
+    cache.get(pool, url)
+    server.version = 2
+    clock.now += 61
+
+    received = cache.get(pool, url)
+
+    assert received.body == b'v2'
+    assert len(cache) == 0
+
+
+def test_get_discards_error(server, pool, cache, clock):
+    """Test `HttpCache.get` discards response replaced by an error"""
+    url = server.url + '/versioned'
+    cache.get(pool, url)
+    server.version = 3
+    clock.now += 61
+
+    with pytest.raises(HTTPError):
+        cache.get(pool, url)
+
+    assert len(cache) == 0
+
+
+def test_pickle(server, pool, cache):
+    """Test `HttpCache` reopens database when unpickled"""
+    url = server.url + '/etag'
+    cache.get(pool, url)
+
+    copy = pickle.loads(pickle.dumps(cache))
+
+    try:
+        assert copy.lookup(url)[0].body == b'/etag v1'
+        assert copy.hits == cache.hits
+
+    finally:
+        copy.close()
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork')
+def test_fork(server, pool, cache):
+    """Test `HttpCache` opens a new connection in forked process"""
+    url = server.url + '/etag'
+    cache.get(pool, url)
+    inherited = cache._open()  # pylint: disable=protected-access
+
+    pid = os.fork()
+
+    if pid == 0:  # pragma: no cover
+        try:
+            reopened = cache._open()  # pylint: disable=protected-access
+            found = cache.lookup(url) is not None
+            os._exit(0 if found and (reopened is not inherited) else 1)
+
+        finally:
+            os._exit(2)
+
+    _, status = os.waitpid(pid, 0)
+
+    assert os.WIFEXITED(status) and (os.WEXITSTATUS(status) == 0)
+    assert cache.lookup(url) is not None
+
+
+def test_evict(server, pool, tmp_path, clock):
+    """Test `HttpCache` evicts least recently used past max. size"""
+    urls = [server.url + '/etag/' + str(idx) for idx in range(3)]
+    cache = HttpCache(tmp_path / 'small.db', max_size=21, clock=clock)
+
+    for url in urls[:2]:
+        cache.get(pool, url)
+
+    cache.lookup(urls[0])
+    cache.get(pool, urls[2])
+
+    assert cache.lookup(urls[1]) is None
+    assert cache.lookup(urls[0]) is not None
+    assert cache.size == 20
+
+    cache.close()
+
+
+def test_persist(server, pool, tmp_path, clock):
+    """Test `HttpCache` keeps responses between runs"""
+    path = tmp_path / 'persist.db'
+    url = server.url + '/etag'
+
+    first = HttpCache(path, clock=clock)
+    first.get(pool, url)
+    first.close()
+
+    second = HttpCache(path, clock=clock)
+    clock.now += 1
+    received = second.get(pool, url)
+    second.close()
+
+    assert received.body == b'/etag v1'
+    assert second.revalidated == 1
+
+
+def test_read_file(server, cache, clock):
+    """Test `read_file` consults active cache"""
+    server.reset()
+    previous = set_http_cache(cache)
+
+    try:
+        first = read_file(server.url + '/etag')
+        clock.now += 61
+        second = read_file(server.url + '/etag')
+
+    finally:
+        set_http_cache(previous)
+
+    assert first == second == '/etag v1'
+    assert cache.revalidated == 1
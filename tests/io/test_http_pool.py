@@ -0,0 +1,271 @@
+"""Test pooled HTTP connections against a local server"""
+import time
+from urllib.error import HTTPError
+
+import pytest
+
+from local_server import serve
+from src.oolongt.io import get_pool, read_file, set_pool
+from src.oolongt.io.http_pool import (
+    HttpPool, fetch_many, get_deadline, get_host_key, get_target,
+    request_deadline, uses_proxy)
+from tests.params.helpers import parametrize
+
+
+@pytest.fixture(name='server', scope='module')
+def fixture_server():
+    """Run server in background thread"""
+    yield from serve()
+
+
+@pytest.fixture(name='pool')
+def fixture_pool(server):
+    """Get pool without waits between retries"""
+    server.reset()
+
+    with HttpPool(max_per_host=2, timeout=5, sleep=lambda _: None) as pool:
+        yield pool
+
+
+@parametrize(
+    'url,expected',
+    (
+        ('http://Example.com/a', ('http', 'example.com', 80)),
+        ('https://example.com:8443/', ('https', 'example.com', 8443)),
+        ('ftp://example.com/', ValueError)),
+    ('http', 'https-port', 'ftp'))
+def test_get_host_key(url: str, expected):
+    """Test `get_host_key`
+
+    Arguments:
+        url {str} -- URL
+        expected {typing.Any} -- scheme, host and port or exception
+    """
+    if expected is ValueError:
+        with pytest.raises(ValueError):
+            get_host_key(url)
+
+    else:
+        assert get_host_key(url) == expected
+
+
+@parametrize(
+    'url,expected',
+    (
+        ('http://x', '/'),
+        ('http://x/a/b', '/a/b'),
+        ('http://x/a?b=1#c', '/a?b=1')),
+    ('root', 'path', 'query'))
+def test_get_target(url: str, expected: str):
+    """Test `get_target`
+
+    Arguments:
+        url {str} -- URL
+        expected {str} -- request target
+    """
+    assert get_target(url) == expected
+
+
+@pytest.fixture(name='proxy_env')
+def fixture_proxy_env(monkeypatch):
+    """Clear proxy settings from environment"""
+    for name in ('http_proxy', 'https_proxy', 'no_proxy'):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+
+    return monkeypatch
+
+
+@parametrize(
+    'url,no_proxy,expected',
+    (
+        ('http://example.com/', '', True),
+        ('https://example.com/', '', False),
+        ('http://example.com/', 'example.com', False)),
+    ('proxied', 'other-scheme', 'bypassed'))
+def test_uses_proxy(proxy_env, url: str, no_proxy: str, expected: bool):
+    """Test `uses_proxy`
+
+    Arguments:
+        url {str} -- URL
+        no_proxy {str} -- hosts to bypass
+        expected {bool} -- proxy applies
+    """
+    proxy_env.setenv('http_proxy', 'http://proxy.invalid:3128')
+    proxy_env.setenv('no_proxy', no_proxy)
+
+    assert uses_proxy(url) == expected
+
+
+def test_get_reuses_connection(server, pool):
+    """Test `HttpPool.get` keeps connections alive between requests"""
+    received = [pool.get(server.url + '/' + str(idx)).body for idx in range(3)]
+
+    assert received == [b'page /0 ', b'page /1 ', b'page /2 ']
+    assert pool.connections == 1
+    assert len(server.ports) == 1
+
+
+def test_get_expires_idle(server):
+    """Test `HttpPool.get` closes connections idle too long"""
+    now = [0.0]
+    server.reset()
+
+    with HttpPool(max_idle_time=10, clock=lambda: now[0]) as pool:
+        pool.get(server.url + '/a')
+        now[0] += 5
+        pool.get(server.url + '/b')
+        now[0] += 11
+        pool.get(server.url + '/c')
+
+    assert pool.connections == 2
+    assert len(server.ports) == 2
+
+
+def test_max_idle(server):
+    """Test `HttpPool` closes connections past `max_idle`"""
+    urls = [server.url + '/slow/' + str(idx) for idx in range(2)]
+    server.reset()
+
+    with HttpPool(max_per_host=2, max_idle=1) as pool:
+        list(pool.fetch_many(urls))
+        list(pool.fetch_many(urls))
+
+    assert server.peak == 2
+    assert pool.connections == 3
+
+
+def test_get_retries(server, pool):
+    """Test `HttpPool.get` retries 5xx responses with backoff"""
+    waits = []
+    pool.sleep = waits.append
+
+    received = pool.get(server.url + '/flaky')
+
+    assert received.body == b'finally'
+    assert waits == [pool.backoff, pool.backoff * 2]
+
+
+def test_get_exhausts_retries(server, pool):
+    """Test `HttpPool.get` raises last 5xx response"""
+    pool.retries = 1
+
+    with pytest.raises(HTTPError) as err:
+        pool.get(server.url + '/flaky')
+
+    assert err.value.code == 503
+    assert server.hits['/flaky'] == 2
+
+
+@parametrize(
+    'path,expected',
+    (('/missing', 404), ('/loop', 302)),
+    ('not-found', 'redirect-loop'))
+def test_get_error(server, pool, path: str, expected: int):
+    """Test `HttpPool.get` raises on client errors and redirect loops
+
+    Arguments:
+        path {str} -- path on server
+        expected {int} -- status of error
+    """
+    with pytest.raises(HTTPError) as err:
+        pool.get(server.url + path)
+
+    assert err.value.code == expected
+
+
+def test_get_redirect(server, pool):
+    """Test `HttpPool.get` follows redirects"""
+    received = pool.get(server.url + '/moved')
+
+    assert received.url == server.url + '/page?q=1'
+    assert received.body == b'page /page?q=1 '
+
+
+def test_get_timeout(server):
+    """Test `HttpPool.get` gives up after timeouts"""
+    server.reset()
+
+    with HttpPool(timeout=.1, retries=1, sleep=lambda _: None) as pool:
+        with pytest.raises(OSError):
+            pool.get(server.url + '/hang')
+
+    assert server.hits['/hang'] == 2
+
+
+def test_request_deadline(server):
+    """Test `request_deadline` cuts socket timeouts and retries"""
+    server.reset()
+
+    with HttpPool(timeout=5, retries=3, sleep=lambda _: None) as pool:
+        start = time.monotonic()
+
+        with request_deadline(.2):
+            with pytest.raises(OSError):
+                pool.get(server.url + '/hang')
+
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 2
+    assert get_deadline() is None
+
+
+def test_request_deadline_nested():
+    """Test inner `request_deadline` keeps earlier enclosing deadline"""
+    with request_deadline(1):
+        outer = get_deadline()
+
+        with request_deadline(10):
+            assert get_deadline() == outer
+
+        with request_deadline(None):
+            assert get_deadline() == outer
+
+    assert get_deadline() is None
+
+
+def test_fetch_many(server, pool):
+    """Test `HttpPool.fetch_many` keeps order and per-host limit"""
+    urls = [server.url + '/slow/' + str(idx) for idx in range(8)]
+    urls.append('ftp://example.com/')
+
+    received = list(pool.fetch_many(urls, max_workers=8))
+
+    assert [url for url, _ in received] == urls
+    assert [resp.body for _, resp in received[:-1]] == [
+        url[len(server.url):].encode() for url in urls[:-1]]
+    assert isinstance(received[-1][1], ValueError)
+    assert server.peak == 2
+    assert pool.connections == 2
+
+
+def test_read_file(server, pool):
+    """Test `read_file` reads http(s) URLs through shared pool"""
+    previous = set_pool(pool)
+
+    try:
+        received = read_file(server.url + '/doc')
+        list(fetch_many([server.url + '/doc']))
+
+    finally:
+        set_pool(previous)
+
+    assert received.startswith('page /doc Mozilla/5.0')
+    assert pool.connections == 1
+    assert get_pool() is not pool
+
+
+def test_read_file_proxy(server, pool, proxy_env):
+    """Test `read_file` reads through proxy set in environment"""
+    url = 'http://example.invalid/doc'
+    proxy_env.setenv('http_proxy', server.url)
+    previous = set_pool(pool)
+
+    try:
+        received = read_file(url)
+
+    finally:
+        set_pool(previous)
+
+    assert received.startswith('page {} Mozilla/5.0'.format(url))
+    assert pool.connections == 0
@@ -1,16 +1,19 @@
 """ Simple I/O module tests """
 import typing
+from io import BytesIO
+from pathlib import Path
 
 from src.oolongt.constants import PKG_NAME, VERSION
 from src.oolongt.io.io import (
-    build_request, get_contents, get_path_forms, get_path_url, get_stream,
-    get_user_agent, is_supported_scheme, load_json, read_file)
+    build_request, decode_chunks, get_contents, get_local_path,
+    get_path_forms, get_path_url, get_stream, get_user_agent,
+    is_supported_scheme, iter_text, load_json, read_file, read_local)
 from src.oolongt.typings import PathOrString
 from tests.helpers import check_exception
 from tests.params.helpers import parametrize
 from tests.params.io import (
-    param_get_path_forms, param_get_path_url, param_load_json, param_read,
-    param_scheme)
+    param_decode_chunks, param_get_local_path, param_get_path_forms,
+    param_get_path_url, param_load_json, param_read, param_scheme)
 
 
 @param_scheme()
@@ -94,6 +97,77 @@ def test_get_stream(path: PathOrString, expected):
     assert received == expected
 
 
+@param_get_local_path()
+def test_get_local_path(path: PathOrString, expected):
+    """Test `get_local_path`
+
+    Arguments:
+        path {PathOrString} -- local path or URL
+        expected {typing.Optional[Path]} -- path to local file
+    """
+    received = get_local_path(path)
+
+    assert received == expected
+
+
+@param_decode_chunks()
+def test_decode_chunks(text: str, chunk_size: int):
+    """Test `decode_chunks` across characters split between chunks
+
+    Arguments:
+        text {str} -- text to encode
+        chunk_size {int} -- bytes per read
+    """
+    expected = text
+
+    stream = BytesIO(text.encode('utf-8'))
+    received = ''.join(decode_chunks(stream, chunk_size))
+
+    assert received == expected
+
+
+@parametrize(
+    'data,binary,expected',
+    (
+        ('Caf\u00e9\r\n'.encode('utf-8'), False, 'Caf\u00e9\r\n'),
+        (b'\xff\x00', True, b'\xff\x00'),
+        (b'', False, ''),
+        (b'\xff', False, UnicodeDecodeError)),
+    ('text', 'binary', 'empty', 'invalid'))
+def test_read_local(tmp_path: Path, data: bytes, binary: bool, expected):
+    """Test `read_local`
+
+    Arguments:
+        tmp_path {Path} -- temporary directory
+        data {bytes} -- contents of file
+        binary {bool} -- read as bytes
+        expected {typing.Any} -- contents or exception
+    """
+    path = tmp_path.joinpath('local.txt')
+    path.write_bytes(data)
+
+    try:
+        received = read_local(path, binary)
+
+    except Exception as err:  # pylint: disable=broad-except
+        received = check_exception(err, expected)
+
+    assert received == expected
+
+
+def test_iter_text(tmp_path: Path):
+    """Test `iter_text` streams local files and file: URLs"""
+    expected = 'Caf\u00e9 \U0001f375. ' * 100
+    path = tmp_path.joinpath('stream.txt')
+    path.write_text(expected, 'utf-8')
+
+    chunks = list(iter_text(path, 7))
+    from_url = ''.join(iter_text(path.as_uri(), 7))
+
+    assert len(chunks) > 1
+    assert ''.join(chunks) == from_url == expected
+
+
 def _test_read(func: typing.Callable, path: PathOrString, expected) -> bool:
     """Test an I/O reading function
 
@@ -56,6 +56,32 @@ def param_get_path_url():
     return parametrize(names, vals, ids)
 
 
+def param_get_local_path():
+    """Parametrize `test_get_local_path`"""
+    names = 'path,expected'
+    vals = (
+        ('/spam/eggs.txt', Path('/spam/eggs.txt')),
+        (Path('spam/eggs.txt'), Path('spam/eggs.txt')),
+        ('file:///spam/eggs%20bacon.txt', Path('/spam/eggs bacon.txt')),
+        ('FILE:///spam/eggs.txt', Path('/spam/eggs.txt')),
+        ('https://localhost/eggs.txt', None),
+        ('ftp://localhost/eggs.txt', None),
+    )
+    ids = ('absolute', 'relative', 'file:', 'FILE:', 'https', 'ftp', )
+
+    return parametrize(names, vals, ids)
+
+
+def param_decode_chunks():
+    """Parametrize `test_decode_chunks`"""
+    text = 'Caf\u00e9 \u2014 na\u00efve \U0001f375 tea. ' * 3
+    names = 'text,chunk_size'
+    vals = ((text, 1), (text, 2), (text, 5), (text, 1024), ('', 3))
+    ids = ('1', '2', '5', '1024', 'empty', )
+
+    return parametrize(names, vals, ids)
+
+
 def param_read(on_dir=OSError, on_404=OSError):
     """Parametrize read tests
 
@@ -0,0 +1,64 @@
+"""Test tokenize-once analysis"""
+from src.oolongt.parser import Parser
+from src.oolongt.parser.analysis import is_contiguous
+from tests.constants import SAMPLES
+from tests.helpers import assert_ex
+from tests.params.helpers import parametrize
+from tests.params.summarizer import param_samples
+from tests.typings.sample import Sample
+
+SPLIT_BODY = 'He said "Stop."Then he left. Fine.'
+
+
+@parametrize(
+    'sentences,normalized,expected',
+    (
+        ([], '', True),
+        (['Spam.', 'Eggs.'], ' Spam. Eggs. ', True),
+        (['"Spam."', 'Eggs.'], '"Spam."Eggs.', False),
+    ),
+    ('empty', 'spaced', 'unspaced'))
+def test_is_contiguous(sentences, normalized, expected):
+    """Test `is_contiguous` in analysis
+
+    Arguments:
+        sentences {StringList} -- sentences
+        normalized {str} -- normalized body
+        expected {bool} -- expected result
+    """
+    received = is_contiguous(sentences, normalized)
+
+    assert (received == expected), assert_ex(
+        'contiguous', received, expected)
+
+
+# pylint: disable=no-self-use
+class TestAnalyze:
+    """Test `Parser.analyze`"""
+    @param_samples(['essay_snark'] + SAMPLES)
+    def test_analyze(self, samp: Sample) -> None:
+        """Test `Parser.analyze` matches separate passes
+
+        Arguments:
+            samp {Sample} -- sample data
+        """
+        parser = Parser(idiom=samp.idiom)
+        analysis = parser.analyze(samp.body)
+
+        assert analysis.sentences == parser.split_sentences(samp.body)
+        assert analysis.key_stems == parser.get_key_stems(samp.body)
+
+        for sentence, stems in zip(analysis.sentences, analysis.stems):
+            assert (stems == parser.get_all_stems(sentence)), assert_ex(
+                'sentence stems', stems, sentence)
+
+    def test_analyze_unspaced(self) -> None:
+        """Test `Parser.analyze` on sentences without whitespace between"""
+        parser = Parser()
+        analysis = parser.analyze(SPLIT_BODY)
+
+        received = analysis.key_stems
+        expected = parser.get_key_stems(SPLIT_BODY)
+
+        assert (received == expected), assert_ex(
+            'keyword stems', received, expected)
@@ -3,7 +3,8 @@ import typing
 
 import kinda
 
-from src.oolongt.parser.parser import Parser, remove_punctuations
+from src.oolongt.parser.parser import (
+    Parser, remove_punctuations, score_keyword_counts)
 from src.oolongt.parser.scored_keyword import ScoredKeyword
 from src.oolongt.typings import StringList
 from tests.constants import SAMPLES
@@ -34,6 +35,16 @@ def test_remove_punctuations(samp: Sample) -> None:
         repr(expected))
 
 
+def test_score_keyword_counts() -> None:
+    """Test `score_keyword_counts` for Parser"""
+    counts = {'spam': 3, 'eggs': 1}
+    received = sorted(score_keyword_counts(counts), key=str)
+    expected = [ScoredKeyword('eggs', 1, 4), ScoredKeyword('spam', 3, 4)]
+
+    assert (received == expected), assert_ex(
+        'scored counts', received, expected)
+
+
 # pylint: disable=too-few-public-methods,no-self-use
 class TestParser:
     """Test `Parser`"""
@@ -159,6 +170,23 @@ class TestParser:
 
         return expected
 
+    @param_get_keywords()
+    def test_count_keywords(self, samp: Sample) -> None:
+        """Test `Parser.count_keywords`
+
+        Arguments:
+            samp {Sample} -- sample data
+        """
+        parser = Parser()
+        counts = parser.count_keywords(samp.body)
+
+        for keyword in parser.get_keywords(samp.body):
+            received = counts[keyword.word]
+            expected = keyword.count
+
+            assert (received == expected), assert_ex(
+                'keyword count', received, expected, hint=keyword.word)
+
     @param_split_sentences()
     def test_split_sentences(self, samp: Sample) -> None:
         """Test `Parser.split_sentences`
@@ -4,7 +4,7 @@ import typing
 from src.oolongt.constants import KEYWORD_SCORE_K
 from src.oolongt.parser.scored_keyword import (
     ScoredKeyword, compare_keywords, compare_score, compare_word,
-    score_keyword)
+    get_sort_key, score_keyword)
 from tests.helpers import check_exception
 from tests.params.parser import (
     param_compare_keywords, param_compare_score, param_compare_word,
@@ -90,6 +90,31 @@ def test_compare_keywords(
         assert received > equality, assert_msg
 
 
+@param_compare_keywords()
+def test_get_sort_key(
+        kw_a: ScoredKeyword,
+        kw_b: ScoredKeyword,
+        is_lt: bool,
+        is_eq: bool,
+        reason: str):
+    """Test get_sort_key in parser subpackage
+
+    Arguments:
+        kw_a {ScoredKeyword} -- keyword A
+        kw_b {ScoredKeyword} -- keyword B
+        is_lt {bool} -- keyword A is Less Than keyword B
+        is_eq {bool} -- keyword A is EQual to keyword B
+    """
+    key_a = get_sort_key(kw_a)
+    key_b = get_sort_key(kw_b)
+    assert (key_a == kw_a.sort_key) and (key_b == kw_b.sort_key)
+    assert_msg = 'reason: {}'.format(
+        {'s': 'score', 'l': 'length', 'w': 'word'}[reason])
+
+    assert (key_a < key_b) == is_lt, assert_msg
+    assert (key_a == key_b) == is_eq, assert_msg
+
+
 # pylint: disable=no-self-use,invalid-name
 class TestScoredKeyword:
     """Test `ScoredKeyword`"""
@@ -0,0 +1,56 @@
+"""Test `StemCache`"""
+from src.oolongt.parser import Parser
+from src.oolongt.parser.stem_cache import StemCache
+from tests.helpers import assert_ex
+
+
+def stem_upper(word: str) -> str:
+    """Stand-in stemmer
+
+    Arguments:
+        word {str} -- word
+
+    Returns:
+        str -- word in upper case
+    """
+    return word.upper()
+
+
+# pylint: disable=no-self-use
+class TestStemCache:
+    """Test `StemCache`"""
+    def test_stem(self):
+        """Test `StemCache.stem` counts hits and misses"""
+        cache = StemCache(stem_upper, 8)
+        received = [cache.stem(word) for word in 'a b a a c b'.split()]
+        expected = ['A', 'B', 'A', 'A', 'C', 'B']
+
+        assert (received == expected), assert_ex('stems', received, expected)
+        assert (cache.hits, cache.misses, len(cache)) == (3, 3, 3)
+
+    def test_stem_evict(self):
+        """Test `StemCache.stem` evicts least recently used word"""
+        cache = StemCache(stem_upper, 2)
+
+        for word in 'a b a c b'.split():
+            cache.stem(word)
+
+        assert (cache.hits, cache.misses, len(cache)) == (1, 4, 2)
+
+    def test_clear(self):
+        """Test `StemCache.clear`"""
+        cache = StemCache(stem_upper)
+        cache.stem('spam')
+        cache.clear()
+
+        assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+    def test_parser_stem_cache(self):
+        """Test `Parser` stem cache persists across documents"""
+        parser = Parser(stem_cache_size=4)
+        parser.get_all_stems('spam eggs spam')
+        parser.get_all_stems('eggs bacon')
+        cache = parser.stem_cache
+
+        assert cache.size == 4
+        assert (cache.hits, cache.misses) == (2, 3)
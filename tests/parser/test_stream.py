@@ -0,0 +1,155 @@
+"""Test streaming sentence splitting and keyword counting"""
+import tracemalloc
+import typing
+
+from src.oolongt.parser import Parser
+from src.oolongt.parser.stream import iter_runs, iter_sentences
+from tests.constants import SAMPLES
+from tests.helpers import assert_ex
+from tests.params.helpers import parametrize
+from tests.params.summarizer import param_samples
+from tests.typings.sample import Sample
+
+UNSPACED_BODY = (
+    'He said "Stop."Then he left.  Mr. Smith went to Washington. '
+    'It was 3 p.m. on Jan. 5th. Fine!  \n\n  Ok?')
+SIZES = (1, 7, 31, 4096)
+UNPUNCTUATED_LINE = ' '.join(['spam', 'eggs', 'ham', 'toast'] * 50) + ' '
+MAX_TAIL = 4096
+
+
+def get_chunks(text: str, size: int) -> typing.Iterator[str]:
+    """Cut `text` into chunks of `size` characters
+
+    Arguments:
+        text {str} -- text
+        size {int} -- characters per chunk
+
+    Returns:
+        typing.Iterator[str] -- chunks in order
+    """
+    return (text[start:start + size] for start in range(0, len(text), size))
+
+
+@parametrize(
+    'chunks,expected',
+    (
+        (['Spam eg', 'gs ham'], ['Spam ', 'eggs ', 'ham']),
+        (['Spa', 'm', ' eggs\n', 'ham'], ['Spam eggs\n', 'ham']),
+        (['Spam ', ''], ['Spam ']),
+        ([], []),
+    ),
+    ('split_word', 'short', 'trailing', 'empty'))
+def test_iter_runs(chunks: typing.List[str], expected: typing.List[str]):
+    """Test `iter_runs` in parser subpackage
+
+    Arguments:
+        chunks {typing.List[str]} -- chunks of text
+        expected {typing.List[str]} -- text cut at whitespace
+    """
+    received = list(iter_runs(chunks))
+
+    assert received == expected
+
+
+def test_iter_runs_max_carry():
+    """Test `iter_runs` cuts words longer than `max_carry`"""
+    chunks = ['x' * 100] * 10
+
+    received = list(iter_runs(chunks, max_carry=250))
+
+    assert ''.join(received) == ''.join(chunks)
+    assert max(len(run) for run in received) <= 350
+
+
+def test_iter_sentences_bounded():
+    """Test `iter_sentences` holds bounded text without sentence breaks"""
+    parser = Parser()
+    parser.split_sentences('Load the tokenizer. Now.')
+    chunks = (UNPUNCTUATED_LINE for _ in range(500))
+    words = 0
+    longest = 0
+
+    tracemalloc.start()
+
+    try:
+        for sentence in iter_sentences(
+                chunks, parser.split_sentences, max_tail=MAX_TAIL):
+            words += len(sentence.split())
+            longest = max(longest, len(sentence))
+
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    assert words == len(UNPUNCTUATED_LINE.split()) * 500
+    assert longest <= 3 * MAX_TAIL
+    assert peak < 128 * MAX_TAIL
+
+
+# pylint: disable=no-self-use
+class TestParserStream:
+    """Test streaming methods of `Parser`"""
+    @param_samples(SAMPLES)
+    def test_iter_sentences(self, samp: Sample):
+        """Test `Parser.iter_sentences` matches `split_sentences`
+
+        Arguments:
+            samp {Sample} -- sample data
+        """
+        parser = Parser()
+        expected = parser.split_sentences(samp.body)
+
+        for size in SIZES:
+            chunks = get_chunks(samp.body, size)
+            received = list(parser.iter_sentences(chunks))
+
+            assert (received == expected), assert_ex(
+                'sentences', received, expected, hint=size)
+
+    def test_iter_sentences_unspaced(self):
+        """Test `Parser.iter_sentences` on breaks without whitespace"""
+        parser = Parser()
+        expected = parser.split_sentences(UNSPACED_BODY)
+
+        for size in SIZES:
+            chunks = get_chunks(UNSPACED_BODY, size)
+            received = list(parser.iter_sentences(chunks))
+
+            assert (received == expected), assert_ex(
+                'sentences', received, expected, hint=size)
+
+    def test_iter_sentences_lazy(self):
+        """Test `Parser.iter_sentences` yields before input ends"""
+        parser = Parser()
+        consumed = []
+
+        def chunks():
+            for chunk in ('Spam is good. ', 'Eggs are ', 'better. ', 'Ham'):
+                consumed.append(chunk)
+
+                yield chunk
+
+        sentences = parser.iter_sentences(chunks())
+
+        assert next(sentences) == 'Spam is good.'
+        assert len(consumed) < 4
+
+    @param_samples(SAMPLES)
+    def test_count_keywords(self, samp: Sample):
+        """Test `Parser.count_keywords` of chunks matches whole text
+
+        Arguments:
+            samp {Sample} -- sample data
+        """
+        parser = Parser()
+
+        for body in (samp.body, UNSPACED_BODY):
+            expected = parser.count_keywords(body)
+
+            for size in SIZES:
+                received = parser.count_keywords(get_chunks(body, size))
+
+                assert (received == expected), assert_ex(
+                    'keyword counts', received, expected, hint=size)
@@ -0,0 +1,110 @@
+"""Test benchmark baseline comparison"""
+from collections import OrderedDict
+
+import pytest
+from setuptools import Distribution
+
+from src.setup import bench_command
+from src.setup.bench import compare, format_change, load, save
+from src.setup.bench_command import BenchCommand
+from tests.helpers import assert_ex
+from tests.params.helpers import parametrize
+
+MARGIN = .25
+
+
+def get_result(p50: float, peak_kb: float = 100.0) -> OrderedDict:
+    """Build measurements of one case
+
+    Arguments:
+        p50 {float} -- median latency in seconds
+
+    Keyword Arguments:
+        peak_kb {float} -- peak memory in KB (default: {100.0})
+
+    Returns:
+        OrderedDict -- measurements
+    """
+    return OrderedDict([
+        ('unit', 'runs'), ('items', 1), ('runs', 5), ('mean', p50),
+        ('p50', p50), ('p90', p50), ('p99', p50),
+        ('per_second', 1 / p50), ('peak_kb', peak_kb)])
+
+
+@parametrize(
+    'result,expected',
+    (
+        (get_result(1.2), []),
+        (get_result(1.3), [('case', 'p50', 1.0, 1.3)]),
+        (get_result(1.0, 200.0), [('case', 'peak_kb', 100.0, 200.0)])),
+    ('within', 'slower', 'larger'))
+def test_compare(result: OrderedDict, expected: list):
+    """Test `compare` lists measurements worse than margin
+
+    Arguments:
+        result {OrderedDict} -- measurements of case
+        expected {list} -- regressions
+    """
+    results = OrderedDict([('case', result), ('new', get_result(9.0))])
+    baseline = OrderedDict([('case', get_result(1.0))])
+
+    received = compare(results, baseline, MARGIN)
+
+    assert (received == expected), assert_ex('regressions', received, expected)
+
+
+@parametrize(
+    'old,new,expected',
+    ((1.0, 1.3, '+30%'), (2.0, 1.0, '-50%'), (0, 1.0, '+inf%'), (0, 0, '+0%')),
+    ('slower', 'faster', 'from-zero', 'zero'))
+def test_format_change(old: float, new: float, expected: str):
+    """Test `format_change`
+
+    Arguments:
+        old {float} -- baseline measurement
+        new {float} -- result
+        expected {str} -- change as percentage
+    """
+    assert format_change(old, new) == expected
+
+
+@parametrize(
+    'p50,expected',
+    ((1.2, None), (1.3, 1)),
+    ('within', 'regression'))
+def test_bench_command(tmp_path, monkeypatch, p50: float, expected):
+    """Test `BenchCommand.run` fails on regression past margin
+
+    Arguments:
+        p50 {float} -- median latency of new run
+        expected {typing.Optional[int]} -- exit status, None if no exit
+    """
+    baseline_path = tmp_path.joinpath('baseline.json')
+    save(OrderedDict(
+        [('results', OrderedDict([('case', get_result(1.0))]))]),
+        baseline_path)
+    monkeypatch.setattr(
+        bench_command, 'get_cases',
+        lambda *_: [('case', lambda: None, 1, 'runs')])
+    monkeypatch.setattr(bench_command, 'measure', lambda *_: get_result(p50))
+
+    command = BenchCommand(Distribution())
+    command.initialize_options()
+    command.baseline = str(baseline_path)
+    command.output = str(tmp_path.joinpath('results.json'))
+    command.margin = str(MARGIN)
+    command.finalize_options()
+
+    if expected is None:
+        command.run()
+
+    else:
+        with pytest.raises(SystemExit) as err:
+            command.run()
+
+        assert err.value.code == expected
+
+    received = load(tmp_path.joinpath('results.json'))['results']['case']
+
+    assert received['p50'] == p50
+    assert load(baseline_path)['results']['case']['p50'] == 1.0
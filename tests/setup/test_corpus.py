@@ -0,0 +1,46 @@
+"""Test synthetic corpus generator"""
+import pytest
+
+from src.oolongt.files.files import get_document
+from src.setup.generate.corpus import (
+    FORMATS, CorpusSpec, generate_document, iter_paragraphs)
+from tests.helpers import assert_ex
+from tests.params.helpers import parametrize
+
+SPEC = CorpusSpec(sentences=12, vocabulary=50, sentence_length=8, seed=3)
+LIMIT = 3
+
+
+@pytest.fixture(name='expected', scope='module')
+def fixture_expected(tmp_path_factory):
+    """Summarize plain text document of `SPEC`"""
+    path = tmp_path_factory.mktemp('corpus').joinpath('doc.txt')
+
+    return get_document(str(generate_document(path, SPEC)), None).summarize(
+        LIMIT)
+
+
+def test_generate_document_unsupported(tmp_path):
+    """Test `generate_document` rejects unknown formats"""
+    with pytest.raises(ValueError):
+        generate_document(tmp_path.joinpath('doc.rtf'), SPEC)
+
+
+@parametrize('fmt', FORMATS, FORMATS)
+def test_generate_document(tmp_path, expected, fmt: str):
+    """Test documents read back and summarize alike in every format
+
+    Arguments:
+        fmt {str} -- extension of document
+    """
+    path = generate_document(tmp_path.joinpath('doc.' + fmt), SPEC)
+    sentences = [
+        sentence
+        for paragraph in iter_paragraphs(SPEC, SPEC.seed * 1000003)
+        for sentence in paragraph]
+
+    received = get_document(str(path), None).summarize(LIMIT)
+
+    assert (received == expected), assert_ex('summary', received, expected)
+    assert len(received) == LIMIT
+    assert set(received) <= set(sentences)
@@ -0,0 +1,57 @@
+"""Test summarizer registry"""
+from concurrent.futures import ThreadPoolExecutor
+
+from src.oolongt.constants import BUILTIN, DEFAULT_IDIOM
+from src.oolongt.summarizer import Summarizer
+from src.oolongt.summarizer.registry import (
+    get_key, get_parser, get_summarizer, invalidate)
+from tests.constants import IDIOM_PATH
+from tests.helpers import assert_ex
+
+VALID_IDIOM = 'valid'
+
+
+def test_get_key():
+    """Test `get_key` in registry"""
+    received = get_key(IDIOM_PATH, VALID_IDIOM)
+    expected = (str(IDIOM_PATH), VALID_IDIOM)
+
+    assert (received == expected), assert_ex(
+        'registry key', received, expected)
+
+
+def test_get_summarizer():
+    """Test `get_summarizer` hands out the same instance per key"""
+    summ = get_summarizer()
+
+    assert isinstance(summ, Summarizer)
+    assert get_summarizer(BUILTIN, DEFAULT_IDIOM) is summ
+    assert get_summarizer(IDIOM_PATH, VALID_IDIOM) is not summ
+
+
+def test_get_summarizer_threaded():
+    """Test `get_summarizer` from many threads"""
+    invalidate(IDIOM_PATH, VALID_IDIOM)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        receiveds = list(pool.map(
+            lambda _: get_summarizer(IDIOM_PATH, VALID_IDIOM), range(32)))
+
+    assert len(set(id(summ) for summ in receiveds)) == 1
+
+
+def test_get_parser():
+    """Test `get_parser` returns parser of shared summarizer"""
+    assert get_parser() is get_summarizer().parser
+
+
+def test_invalidate():
+    """Test `invalidate` in registry"""
+    summ = get_summarizer(IDIOM_PATH, VALID_IDIOM)
+    default = get_summarizer()
+
+    received = invalidate(idiom=VALID_IDIOM)
+
+    assert (received == 1), assert_ex('invalidated', received, 1)
+    assert get_summarizer(IDIOM_PATH, VALID_IDIOM) is not summ
+    assert get_summarizer() is default
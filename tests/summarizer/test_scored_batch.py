@@ -0,0 +1,76 @@
+"""Test `ScoredBatch`"""
+import pytest
+
+from src.oolongt.constants import BACKEND_NUMPY, BACKEND_PYTHON
+from src.oolongt.summarizer import ScoredBatch, Summarizer
+from src.oolongt.summarizer.scored_batch import locate_sentences
+from tests.constants import SAMPLES
+from tests.helpers import assert_ex
+from tests.params.summarizer import get_inst_comp, param_samples
+from tests.typings.sample import Sample
+
+
+def test_locate_sentences():
+    """Test `locate_sentences` in summarizer subpackage"""
+    starts, ends = locate_sentences('Spam. Eggs. Spam.', ['Spam.', 'Spam.'])
+
+    assert (list(starts), list(ends)) == ([0, 12], [5, 17])
+
+    with pytest.raises(ValueError):
+        locate_sentences('Spam. Eggs.', ['Eggs.', 'Spam.'])
+
+
+# pylint: disable=no-self-use
+class TestScoredBatch:
+    """Test `ScoredBatch`"""
+    @param_samples(SAMPLES)
+    def test_get_batch(self, samp: Sample):
+        """Test batch views match `Summarizer.get_all_sentences`
+
+        Arguments:
+            samp {Sample} -- sample data
+        """
+        summ = Summarizer(backend=BACKEND_PYTHON)
+        batch = summ.get_batch(samp.body, samp.title)
+        expecteds = summ.get_all_sentences(samp.body, samp.title)
+
+        assert len(batch) == len(expecteds)
+
+        for received, expected in zip(batch, expecteds):
+            assert (get_inst_comp(received) == get_inst_comp(expected)), \
+                assert_ex('sentence', received, expected)
+
+        assert list(batch.total) == [s.score.total for s in expecteds]
+        assert batch.get_ranking() == [
+            s.index for s in sorted(expecteds, reverse=True)]
+
+    @param_samples(SAMPLES)
+    def test_get_batch_numpy(self, samp: Sample):
+        """Test NumPy backend batch matches Python backend
+
+        Arguments:
+            samp {Sample} -- sample data
+        """
+        pytest.importorskip('numpy')
+        python = Summarizer(backend=BACKEND_PYTHON)
+        numpy = Summarizer(backend=BACKEND_NUMPY)
+        expected = python.get_batch(samp.body, samp.title)
+        received = numpy.get_batch(samp.body, samp.title)
+
+        assert list(map(get_inst_comp, received)) == list(
+            map(get_inst_comp, expected))
+
+    def test_empty(self):
+        """Test batch of empty body"""
+        batch = ScoredBatch('', [], [])
+
+        assert (len(batch), list(batch), batch.get_ranking()) == (0, [], [])
+
+    def test_get_text(self):
+        """Test `ScoredBatch.get_text` slices body"""
+        batch = ScoredBatch(
+            'Spam.  Eggs. ', ['Spam.', ' Eggs. '], [(0, 0, 0, 0)] * 2)
+
+        assert batch.get_texts() == ['Spam.', 'Eggs.']
+        assert batch[-1].text == 'Eggs.'
+        assert batch[-1].index == 1
@@ -109,3 +109,25 @@ class TestScoredSentence:
         received = sent_a > sent_b
 
         assert received == expected
+
+    @param_comp()
+    def test_sort_key(
+            self,
+            sent_a: ScoredSentence,
+            sent_b: ScoredSentence,
+            is_lt: bool,
+            is_eq: bool):
+        """Test `ScoredSentence.sort_key` orders as comparisons do
+
+        Arguments:
+            sent_a {ScoredSentence} -- sentence A
+            sent_b {ScoredSentence} -- sentence B
+            is_lt {bool} -- sentence A is Less Than sentence B
+            is_eq {bool} -- sentence A is EQual to sentence B
+        """
+        key_a = sent_a[0].sort_key
+        key_b = sent_b[0].sort_key
+
+        assert isinstance(key_a, int)
+        assert (key_a < key_b) == is_lt
+        assert (key_a == key_b) == is_eq
@@ -0,0 +1,94 @@
+"""Test sharded scoring"""
+from collections import Counter
+
+import pytest
+
+from src.oolongt.summarizer import Summarizer, score_sharded
+from src.oolongt.summarizer.sharded import (
+    score_shard, split_shards, stem_shard)
+from tests.constants import SAMPLES
+from tests.helpers import assert_ex, get_sample
+from tests.params.helpers import parametrize
+from tests.params.summarizer import get_inst_comp
+
+UNSPACED_BODY = ' '.join(['He said "Stop."Then he left. Fine.'] * 5)
+
+
+def get_contents():
+    """List body and title of samples, combined and unspaced
+
+    Returns:
+        typing.List[typing.Tuple[str, str]] -- (body, title) pairs
+    """
+    samples = [get_sample(name) for name in SAMPLES]
+    contents = [(samp.body, samp.title) for samp in samples]
+    contents.append((
+        ' '.join(samp.body for samp in samples), samples[0].title))
+    contents.append((UNSPACED_BODY, 'Stop'))
+
+    return contents
+
+
+@parametrize(
+    'items,size,expected',
+    (
+        ('abcde', 2, ['ab', 'cd', 'e']),
+        ('abcd', 2, ['ab', 'cd']),
+        ('', 2, []),
+    ),
+    ('partial', 'even', 'empty'))
+def test_split_shards(items, size, expected):
+    """Test `split_shards` in summarizer subpackage
+
+    Arguments:
+        items {str} -- items
+        size {int} -- items per shard
+        expected {list} -- shards
+    """
+    received = split_shards(items, size)
+
+    assert (received == expected), assert_ex('shards', received, expected)
+
+
+@parametrize(
+    'body,title', get_contents(), SAMPLES + ['combined', 'unspaced'])
+def test_score_sharded(body: str, title: str):
+    """Test `score_sharded` matches `Summarizer.get_all_sentences`
+
+    Arguments:
+        body {str} -- body of content
+        title {str} -- title of content
+    """
+    expected = list(map(
+        get_inst_comp, Summarizer().get_all_sentences(body, title)))
+    received = list(map(
+        get_inst_comp,
+        score_sharded(body, title, shard_size=4, max_workers=2)))
+
+    assert (received == expected), assert_ex('sentences', received, expected)
+
+
+def test_stem_shard():
+    """Test `stem_shard` returns counts, keeping stems for `score_shard`"""
+    summarizer = Summarizer()
+    sentences = ['Spam is good.', 'Eggs are better than spam.']
+    stems, key_stems = summarizer.parser.stem_sentences(sentences)
+    kw_table = {'spam': 1.}
+    expected = [
+        summarizer.score_tlds(stem_list, [], kw_table)
+        for stem_list in stems]
+
+    counts = stem_shard((7, sentences))
+    received = score_shard((7, [], kw_table))
+
+    assert dict(counts) == dict(Counter(key_stems))
+    assert (received == expected), assert_ex('scores', received, expected)
+
+    with pytest.raises(KeyError):
+        score_shard((7, [], kw_table))
+
+
+def test_score_sharded_size():
+    """Test `score_sharded` rejects invalid shard size"""
+    with pytest.raises(ValueError):
+        score_sharded('Spam.', 'Eggs', shard_size=0)
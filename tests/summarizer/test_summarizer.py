@@ -4,16 +4,19 @@ import typing
 import kinda
 
 from src.oolongt.constants import COMPOSITE_TOLERANCE, TOP_KEYWORD_MIN_RANK
+from src.oolongt.parser.parser import score_keyword_counts
 from src.oolongt.summarizer.summarizer import (
-    Summarizer, _float_len, get_top_keyword_threshold, pluck_keyword_words,
-    score_by_dbs, score_by_sbs, score_by_title)
+    Summarizer, _float_len, filter_top_counts, filter_top_keywords,
+    get_top_keyword_threshold, pluck_keyword_words, score_by_dbs,
+    score_by_sbs, score_by_title, score_dbs, score_sbs, tabulate_keywords)
 from src.oolongt.typings import StringList
 from tests.helpers import assert_ex, snip
 from tests.params.summarizer import (
     param__float_len, param_pluck_keyword_words, param_samples,
     param_score_by_length, param_score_by_title, param_sentences,
     param_threshold)
-from tests.typings import Sample, SampleKeywordList, SampleSentence
+from tests.typings import (
+    Sample, SampleKeyword, SampleKeywordList, SampleSentence)
 
 
 @param_pluck_keyword_words()
@@ -66,6 +69,47 @@ def test_get_top_keyword_threshold(
         expected)
 
 
+@param_samples()
+def test_filter_top_counts(samp: Sample) -> None:
+    """Test `filter_top_counts` matches `filter_top_keywords`
+
+    Arguments:
+        samp {Sample} -- sample data
+    """
+    counts = Summarizer().parser.count_keywords(samp.body)
+
+    received = sorted(filter_top_counts(counts))
+    expected = sorted(filter_top_keywords(score_keyword_counts(counts)))
+
+    assert (received == expected), assert_ex(
+        'top keywords', received, expected)
+
+
+def test_tabulate_keywords() -> None:
+    """Test `tabulate_keywords` keeps first score of repeated words"""
+    top_kws = [SampleKeyword.by_score(.3), SampleKeyword.by_score(.2)]
+
+    received = tabulate_keywords(top_kws, ['spam', 'spam'])
+    expected = {'spam': .3}
+
+    assert (received == expected), assert_ex(
+        'keyword table', received, expected)
+
+
+def test_score_dbs_sbs() -> None:
+    """Test `score_dbs` and `score_sbs` against worked example"""
+    kw_table = {'spam': .3, 'eggs': .2}
+    words = ['spam', 'eggs', 'ham', 'spam']
+
+    dbs = score_dbs(words, kw_table)
+    sbs = score_sbs(words, kw_table)
+    k = 3
+
+    assert dbs == (1.0 / k * (k + 1.0)) * ((.2 * .3) / 1 + (.3 * .2) / 4)
+    assert sbs == 1.0 / 4 * (.3 + .2 + .3)
+    assert score_sbs([], kw_table) == 0.0
+
+
 @param_score_by_title()
 def test_score_by_title(samp: Sample) -> None:
     """Test `Parser.score_by_title`
@@ -0,0 +1,138 @@
+"""Test vectorized scoring backend"""
+import typing
+
+import pytest
+
+from src.oolongt.constants import BACKEND_NUMPY, BACKEND_PYTHON
+from src.oolongt.io import load_json
+from src.oolongt.summarizer import ScoredSentence, Summarizer, vectorized
+from src.oolongt.summarizer.sentence_score import score_position
+from src.oolongt.summarizer.summarizer import get_backend
+from tests.constants import DOC_PATH, SAMPLES
+from tests.helpers import assert_ex, get_sample
+from tests.params.helpers import parametrize
+
+pytest.importorskip('numpy')
+
+Content = typing.Tuple[str, str]
+
+
+def get_contents() -> typing.List[Content]:
+    """List body and title of content and text samples
+
+    Returns:
+        typing.List[Content] -- (body, title) pairs
+    """
+    contents = [
+        (data['body'], data['title'])
+        for data in (
+            load_json(DOC_PATH.joinpath(stem + '.json'))
+            for stem in ('basic', 'intermed'))]
+    samples = [get_sample(name) for name in SAMPLES]
+
+    contents.extend((samp.body, samp.title) for samp in samples)
+    contents.append((
+        ' '.join(samp.body for samp in samples), samples[0].title))
+    contents.append(('', ''))
+
+    return contents
+
+
+def get_scores(sent: ScoredSentence) -> typing.Tuple:
+    """List every score of `sent`
+
+    Arguments:
+        sent {ScoredSentence} -- scored sentence
+
+    Returns:
+        typing.Tuple -- text, index, and scores
+    """
+    score = sent.score
+
+    return (
+        sent.text, sent.index, sent.of,
+        score.title, score.length, score.dbs, score.sbs,
+        score.position, score.keyword, score.total)
+
+
+CONTENTS = get_contents()
+CONTENT_IDS = ['basic', 'intermed'] + SAMPLES + ['combined', 'empty']
+
+
+def test_has_numpy():
+    """Test `has_numpy` imports NumPy"""
+    assert vectorized.has_numpy()
+    assert vectorized.numpy is not None
+
+
+@parametrize('num_sentences', (1, 3, 11), ('one', 'three', 'eleven'))
+def test_calc_position(monkeypatch, num_sentences: int):
+    """Test `calc_position` imports NumPy when called directly
+
+    Arguments:
+        num_sentences {int} -- number of sentences
+    """
+    monkeypatch.setattr(vectorized, 'numpy', None)
+    expected = [score_position(idx, num_sentences)
+                for idx in range(num_sentences)]
+
+    received = vectorized.calc_position(num_sentences).tolist()
+
+    assert (received == expected), assert_ex(
+        'position scores', received, expected)
+
+
+def test_encode_stems(monkeypatch):
+    """Test `encode_stems` imports NumPy when called directly"""
+    monkeypatch.setattr(vectorized, 'numpy', None)
+    vocab = {}  # type: typing.Dict[str, int]
+
+    ids, lengths = vectorized.encode_stems([['spam', 'eggs'], ['spam']], vocab)
+
+    assert ids.tolist() == [0, 1, 0]
+    assert lengths.tolist() == [2, 1]
+    assert vocab == {'spam': 0, 'eggs': 1}
+
+
+def test_get_backend():
+    """Test `get_backend`"""
+    assert get_backend(BACKEND_NUMPY) == BACKEND_NUMPY
+    assert get_backend(BACKEND_PYTHON) == BACKEND_PYTHON
+
+    with pytest.raises(ValueError):
+        get_backend('fortran')
+
+
+@parametrize('body,title', CONTENTS, CONTENT_IDS)
+def test_get_all_sentences(body: str, title: str):
+    """Test NumPy backend scores match Python backend exactly
+
+    Arguments:
+        body {str} -- body of content
+        title {str} -- title of content
+    """
+    python = Summarizer(backend=BACKEND_PYTHON)
+    numpy = Summarizer(backend=BACKEND_NUMPY)
+
+    expecteds = [get_scores(s) for s in python.get_all_sentences(body, title)]
+    receiveds = [get_scores(s) for s in numpy.get_all_sentences(body, title)]
+
+    assert (receiveds == expecteds), assert_ex(
+        'vectorized scores', receiveds, expecteds)
+
+
+@parametrize('body,title', CONTENTS, CONTENT_IDS)
+def test_rank_sentences(body: str, title: str):
+    """Test NumPy backend ranks sentences as Python backend
+
+    Arguments:
+        body {str} -- body of content
+        title {str} -- title of content
+    """
+    python = Summarizer(backend=BACKEND_PYTHON)
+    numpy = Summarizer(backend=BACKEND_NUMPY)
+
+    expected = [s.index for s in python.rank_sentences(body, title)]
+    received = [s.index for s in numpy.rank_sentences(body, title)]
+
+    assert (received == expected), assert_ex('ranking', received, expected)
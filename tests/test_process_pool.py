@@ -0,0 +1,51 @@
+"""Test process_pool module"""
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.oolongt import process_pool
+from src.oolongt.process_pool import get_process_pool
+
+_SETTING = 'uninitialized'
+
+
+def init_worker(setting: str) -> None:
+    """Store `setting` in worker"""
+    global _SETTING  # pylint: disable=global-statement
+    _SETTING = setting
+
+
+def get_setting(_) -> str:
+    """Get setting of worker"""
+    return _SETTING
+
+
+def test_get_process_pool():
+    """Test `get_process_pool` initializes workers"""
+    with get_process_pool(2, init_worker, ('spam', )) as executor:
+        received = list(executor.map(get_setting, range(4)))
+
+    assert received == ['spam'] * 4
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != 'fork',
+    reason='requires fork start method')
+def test_get_process_pool_legacy(monkeypatch):
+    """Test `get_process_pool` without initializer support (Python 3.6)"""
+    def legacy_pool(max_workers, **kwargs):
+        if kwargs:
+            raise TypeError('unexpected keyword arguments')
+
+        return ProcessPoolExecutor(max_workers)
+
+    monkeypatch.setattr(process_pool, 'ProcessPoolExecutor', legacy_pool)
+    # initializer runs in this process: restore setting afterwards
+    monkeypatch.setattr(sys.modules[__name__], '_SETTING', _SETTING)
+
+    with get_process_pool(2, init_worker, ('eggs', )) as executor:
+        received = list(executor.map(get_setting, range(4)))
+
+    assert received == ['eggs'] * 4
@@ -0,0 +1,162 @@
+"""Test incremental summarization"""
+import pytest
+
+from src.oolongt.summarizer import Summarizer
+from src.oolongt.summarizer.sentence_score import calc_rank
+from src.oolongt.text import IncrementalSummarizer, summarize
+from src.oolongt.text.incremental import find_unsettled, get_moved
+from tests.constants import SAMPLES
+from tests.helpers import assert_ex
+from tests.params.helpers import parametrize
+from tests.params.summarizer import get_inst_comp, param_samples
+from tests.typings.sample import Sample
+
+UNSPACED_BODY = (
+    'He said "Stop."Then he left.  Mr. Smith went to Washington. '
+    'It was 3 p.m. on Jan. 5th. Fine!  \n\n  Ok?')
+LEADING_BODY = (
+    ' \n Leading space here. Second one is here.  Leading space here.')
+
+
+def feed(inc: IncrementalSummarizer, body: str, size: int):
+    """Append `body` to `inc` in chunks of `size` characters
+
+    Arguments:
+        inc {IncrementalSummarizer} -- incremental summarizer
+        body {str} -- body of content
+        size {int} -- characters per chunk
+
+    Yields:
+        str -- body so far
+    """
+    for start in range(0, len(body), size):
+        inc.append(body[start:start + size])
+
+        yield body[:start + size]
+
+
+@parametrize(
+    'text,starts,expected',
+    (
+        ('Spam. Eggs. Ham', [0, 6, 12], 1),
+        ('Spam. Eggs. Ham ', [0, 6, 12], 2),
+        ('Spam. Eggs.', [0, 6], 0),
+        ('"Spam."Eggs. Ham', [0, 7, 13], 0),
+        ('', [], 0),
+    ),
+    ('partial', 'complete', 'one_word', 'unspaced', 'empty'))
+def test_find_unsettled(text, starts, expected):
+    """Test `find_unsettled` in text subpackage
+
+    Arguments:
+        text {str} -- normalized text
+        starts {typing.List[int]} -- offset of each sentence
+        expected {int} -- index of first unsettled sentence
+    """
+    received = find_unsettled(text, starts)
+
+    assert (received == expected), assert_ex(
+        'first unsettled', received, expected, hint=text)
+
+
+@parametrize(
+    'old_of,new_of',
+    ((1, 2), (9, 10), (10, 11), (37, 38), (38, 37), (5, 50), (20, 20)),
+    ('one', 'nine', 'ten', 'grow', 'shrink', 'jump', 'same'))
+def test_get_moved(old_of: int, new_of: int):
+    """Test `get_moved` in text subpackage
+
+    Arguments:
+        old_of {int} -- earlier number of sentences
+        new_of {int} -- current number of sentences
+    """
+    expected = {
+        idx for idx in range(min(old_of, new_of))
+        if calc_rank(idx, old_of, 10) != calc_rank(idx, new_of, 10)}
+
+    received = get_moved(old_of, new_of)
+
+    assert (received == expected), assert_ex(
+        'moved', received, expected, hint=(old_of, new_of))
+
+
+# pylint: disable=no-self-use
+class TestIncrementalSummarizer:
+    """Test `IncrementalSummarizer`"""
+    @param_samples(SAMPLES)
+    def test_summary(self, samp: Sample):
+        """Test `IncrementalSummarizer.summary` matches `summarize`
+
+        Arguments:
+            samp {Sample} -- sample data
+        """
+        for size in (31, 97):
+            inc = IncrementalSummarizer(samp.title)
+
+            for body in feed(inc, samp.body, size):
+                for limit in (3, .5):
+                    received = inc.summary(limit)
+                    expected = summarize(body, samp.title, limit)
+
+                    assert (received == expected), assert_ex(
+                        'summary', received, expected, hint=len(body))
+
+    @param_samples(SAMPLES)
+    def test_get_all_sentences(self, samp: Sample):
+        """Test incremental scores match `Summarizer.get_all_sentences`
+
+        Arguments:
+            samp {Sample} -- sample data
+        """
+        summ = Summarizer()
+        inc = IncrementalSummarizer(samp.title)
+
+        for body in feed(inc, samp.body, 211):
+            received = list(map(get_inst_comp, inc.get_all_sentences()))
+            expected = list(map(
+                get_inst_comp, summ.get_all_sentences(body, samp.title)))
+
+            assert (received == expected), assert_ex(
+                'sentences', received, expected, hint=len(body))
+
+        assert inc.body == samp.body
+
+    def test_summary_unspaced(self):
+        """Test summary of sentences without whitespace between"""
+        for size in (1, 5):
+            inc = IncrementalSummarizer('Smith')
+
+            for body in feed(inc, UNSPACED_BODY, size):
+                received = inc.summary(2)
+                expected = summarize(body, 'Smith', 2)
+
+                assert (received == expected), assert_ex(
+                    'summary', received, expected, hint=body)
+
+    def test_summary_leading_space(self):
+        """Test summary of body starting with whitespace"""
+        for size in (1, 7, len(LEADING_BODY)):
+            inc = IncrementalSummarizer('Leading')
+
+            for body in feed(inc, LEADING_BODY, size):
+                received = inc.summary(3)
+                expected = summarize(body, 'Leading', 3)
+
+                assert (received == expected), assert_ex(
+                    'summary', received, expected, hint=body)
+
+    def test_summary_counts_incrementally(self, monkeypatch):
+        """Test summaries never read the whole body again"""
+        def fail(*_):
+            pytest.fail('whole body read')
+
+        inc = IncrementalSummarizer('Smith')
+        monkeypatch.setattr(IncrementalSummarizer, 'body', property(fail))
+        monkeypatch.setattr(inc.parser, 'count_keywords', fail)
+
+        for body in feed(inc, UNSPACED_BODY * 3, 7):
+            received = inc.summary(2)
+            expected = summarize(body, 'Smith', 2)
+
+            assert (received == expected), assert_ex(
+                'summary', received, expected, hint=body)
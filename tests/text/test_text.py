@@ -4,7 +4,10 @@ import typing
 import kinda
 
 from src.oolongt import score_body_sentences, summarize
-from src.oolongt.text.text import get_slice_length
+from src.oolongt.pipe import pipe
+from src.oolongt.text.text import (
+    dedupe_sentences, get_slice_length, select_best_sentences,
+    sort_sentences_by_score)
 from src.oolongt.typings import StringList
 from tests.constants import SAMPLES, TEXT_PATH
 from tests.helpers import assert_ex, check_exception, snip
@@ -140,3 +143,26 @@ def test_get_slice_length(
         received,
         expected,
         hint='nominal: {!r}'.format(nominal))
+
+
+@param_samples()
+def test_select_best_sentences(samp: Sample) -> None:
+    """Test `select_best_sentences` matches sort, dedupe and slice
+
+    Arguments:
+        samp {Sample} -- sample data
+    """
+    # repeat every sentence so some copies outrank others
+    body = ' '.join([samp.body] * 2)
+    sentences = score_body_sentences(body, samp.title)
+    ranked = pipe(sentences, sort_sentences_by_score, dedupe_sentences)
+
+    for limit in (1, 5, .25, .5, 1000):
+        slice_len = get_slice_length(limit, len(ranked))
+        expected = [(s.text, s.index) for s in ranked[:slice_len]]
+        received = [
+            (s.text, s.index)
+            for s in select_best_sentences(sentences, limit)]
+
+        assert (received == expected), assert_ex(
+            'best sentences', received, expected, hint=limit)
@@ -1,7 +1,8 @@
 """Sample ScoredKeyword """
 import typing
 
-from src.oolongt.parser.scored_keyword import ScoredKeyword, score_keyword
+from src.oolongt.parser.scored_keyword import (
+    ScoredKeyword, get_sort_key, score_keyword)
 
 
 # pylint: disable=super-init-not-called,too-few-public-methods
@@ -23,6 +24,7 @@ class SampleKeyword(ScoredKeyword):
         self.of = of                                            # type: int
         self.score = (
             pairs.get('score', score_keyword(self.count, of)))  # type: float
+        self._sort_key = get_sort_key(self)
 
     @classmethod
     def by_score(cls, score: float, count: int = 1):